@@ -0,0 +1,103 @@
+""".
+
+##############################################################################
+#
+#   Implementation of the entropy bookkeeping shared by the Moran Processes
+#
+#   AUTHOR: Maciej_Bak
+#   AFFILIATION: University_of_Basel
+#   AFFILIATION: Swiss_Institute_of_Bioinformatics
+#   CONTACT: wsciekly.maciek@gmail.com
+#   CREATED: 18-10-2026
+#   LICENSE: MIT
+#
+##############################################################################
+"""
+
+# imports
+import math
+
+import numpy as np
+
+
+class EntropyTracker:
+    """Entropy of the types distribution, updated after every cycle.
+
+    Note:
+        Not to be instantiated by the user directly. Classes which inherit
+        the bookkeeping provide the attributes curr_size_list and Entropy;
+        the entropy is calculated exactly with _UpdateEntropy (whenever
+        the whole population changes) and updated incrementally with
+        _UpdateEntropyChange after a single replacement.
+
+    """
+
+    # number of incremental updates between two exact calculations
+    _EntropyResyncInterval = 1000
+
+    def _UpdateEntropy(self):
+        """Calculate entropy of Individual types in the population.
+
+        Note:
+            Also resets the sum of n * log2(n) over the subpopulations'
+            cardinalities n, which is then updated incrementally.
+
+        """
+        self.Entropy = 0
+        population_size = sum(self.curr_size_list)
+        for type_size in self.curr_size_list:
+            fraction = float(type_size) / population_size
+            if fraction != 0.0:
+                self.Entropy -= fraction * np.log2(fraction)
+        self._SizeLogSum = sum(
+            self._SizeLog(type_size) for type_size in self.curr_size_list
+        )
+        self._EntropyPopulationSize = population_size
+        self._EntropyUpdates = 0
+
+    def _SizeLog(self, type_size):
+        """Calculate the contribution of a subpopulation to the entropy.
+
+        Args:
+            type_size (int): cardinality of the subpopulation.
+
+        Returns:
+            float: type_size * log2(type_size) (zero for an empty one).
+
+        """
+        return type_size * math.log2(type_size) if type_size > 0 else 0.0
+
+    def _UpdateEntropyChange(self, birth_index, death_index):
+        """Update entropy after one Individual replaced another one.
+
+        Note:
+            Entropy equals log2(N) - sum(n * log2(n)) / N for the
+            subpopulations' cardinalities n summing up to N, hence only
+            the two changed terms of the sum are updated. The sum is
+            recomputed exactly every _EntropyResyncInterval updates
+            to bound the accumulation of rounding errors.
+
+        Args:
+            birth_index (int): index of the type which multiplied.
+            death_index (int): index of the type which died.
+
+        """
+        if birth_index == death_index:
+            return
+        self._EntropyUpdates += 1
+        if self._EntropyUpdates >= self._EntropyResyncInterval:
+            self._UpdateEntropy()
+            return
+        birth_size = self.curr_size_list[birth_index]
+        death_size = self.curr_size_list[death_index]
+        self._SizeLogSum += (
+            self._SizeLog(birth_size)
+            - self._SizeLog(birth_size - 1)
+            + self._SizeLog(death_size)
+            - self._SizeLog(death_size + 1)
+        )
+        population_size = self._EntropyPopulationSize
+        self.Entropy = max(
+            math.log2(population_size) - self._SizeLogSum / population_size,
+            0.0,
+        )
@@ -0,0 +1,142 @@
+""".
+
+##############################################################################
+#
+#   Implementation of the preallocated simulation logs
+#
+#   AUTHOR: Maciej_Bak
+#   AFFILIATION: University_of_Basel
+#   AFFILIATION: Swiss_Institute_of_Bioinformatics
+#   CONTACT: wsciekly.maciek@gmail.com
+#   CREATED: 18-10-2026
+#   LICENSE: MIT
+#
+##############################################################################
+"""
+
+# imports
+import numpy as np
+import pandas as pd
+
+
+class LogBuffer:
+    """Typed, preallocated storage for the simulation logs."""
+
+    def __init__(self, size_columns, value_columns, nrows):
+        """Class initializer.
+
+        Note:
+            Not to be instantiated by the user directly.
+            Logs are written into NumPy arrays of fixed dtypes and
+            converted into a pandas dataframe only once.
+
+        Args:
+            size_columns (list of str): names of the integer columns.
+            value_columns (list of str): names of the float columns.
+            nrows (int): number of rows to preallocate.
+
+        Attributes:
+            size_columns (list of str): names of the integer columns.
+            value_columns (list of str): names of the float columns.
+            generations (np.array): generation of every row.
+            sizes (np.array): integer part of the logs.
+            values (np.array): float part of the logs.
+            nrows (int): number of rows recorded so far.
+
+        """
+        self.size_columns = size_columns
+        self.value_columns = value_columns
+        self.generations = np.zeros(nrows, dtype=np.int64)
+        self.sizes = np.zeros((nrows, len(size_columns)), dtype=np.int64)
+        self.values = np.zeros((nrows, len(value_columns)), dtype=float)
+        self.nrows = 0
+
+    @property
+    def size_columns(self):
+        """Python getter."""
+        return self._size_columns
+
+    @size_columns.setter
+    def size_columns(self, size_columns):
+        """Python setter."""
+        self._size_columns = size_columns
+
+    @property
+    def value_columns(self):
+        """Python getter."""
+        return self._value_columns
+
+    @value_columns.setter
+    def value_columns(self, value_columns):
+        """Python setter."""
+        self._value_columns = value_columns
+
+    @property
+    def generations(self):
+        """Python getter."""
+        return self._generations
+
+    @generations.setter
+    def generations(self, generations):
+        """Python setter."""
+        self._generations = generations
+
+    @property
+    def sizes(self):
+        """Python getter."""
+        return self._sizes
+
+    @sizes.setter
+    def sizes(self, sizes):
+        """Python setter."""
+        self._sizes = sizes
+
+    @property
+    def values(self):
+        """Python getter."""
+        return self._values
+
+    @values.setter
+    def values(self, values):
+        """Python setter."""
+        self._values = values
+
+    @property
+    def nrows(self):
+        """Python getter."""
+        return self._nrows
+
+    @nrows.setter
+    def nrows(self, nrows):
+        """Python setter."""
+        self._nrows = nrows
+
+    def record(self, generation, sizes, values):
+        """Write one row of the logs.
+
+        Args:
+            generation (int): current generation.
+            sizes (list of int): values of the integer columns.
+            values (list of float): values of the float columns.
+
+        """
+        row = self.nrows
+        self.generations[row] = generation
+        self.sizes[row] = sizes
+        self.values[row] = values
+        self.nrows += 1
+
+    def to_dataframe(self):
+        """Convert the recorded rows into a table.
+
+        Returns:
+            pd.DataFrame: table with simulation logs.
+
+        """
+        columns = {}
+        for index, name in enumerate(self.size_columns):
+            columns[name] = self.sizes[: self.nrows, index]
+        for index, name in enumerate(self.value_columns):
+            columns[name] = self.values[: self.nrows, index]
+        index = pd.Index(self.generations[: self.nrows], name="generation")
+        return pd.DataFrame(columns, index=index)
@@ -0,0 +1,175 @@
+""".
+
+##############################################################################
+#
+#   Implementation of the summary-only simulation logs
+#
+#   AUTHOR: Maciej_Bak
+#   AFFILIATION: University_of_Basel
+#   AFFILIATION: Swiss_Institute_of_Bioinformatics
+#   CONTACT: wsciekly.maciek@gmail.com
+#   CREATED: 18-10-2026
+#   LICENSE: MIT
+#
+##############################################################################
+"""
+
+# imports
+import numpy as np
+import pandas as pd
+
+
+class LogSummary:
+    """Fixed-memory summary of the simulation logs."""
+
+    def __init__(self, size_columns, value_columns):
+        """Class initializer.
+
+        Note:
+            Not to be instantiated by the user directly.
+            Keeps only the last recorded row and the running sums of
+            the subpopulations' sizes and of the entropy, hence its memory
+            does not depend on the number of generations.
+
+        Args:
+            size_columns (list of str): names of the integer columns.
+            value_columns (list of str): names of the float columns.
+
+        Attributes:
+            size_columns (list of str): names of the integer columns.
+            value_columns (list of str): names of the float columns.
+            generation (int): generation of the last recorded row.
+            sizes (np.array): integer part of the last recorded row.
+            values (np.array): float part of the last recorded row.
+            sizes_sum (np.array): running sums of the integer columns.
+            entropy_sum (float): running sum of the entropy.
+            nrows (int): number of rows recorded so far.
+
+        """
+        self.size_columns = size_columns
+        self.value_columns = value_columns
+        self.generation = 0
+        self.sizes = np.zeros(len(size_columns), dtype=np.int64)
+        self.values = np.zeros(len(value_columns), dtype=float)
+        self.sizes_sum = np.zeros(len(size_columns), dtype=np.int64)
+        self.entropy_sum = 0.0
+        self.nrows = 0
+
+    @property
+    def size_columns(self):
+        """Python getter."""
+        return self._size_columns
+
+    @size_columns.setter
+    def size_columns(self, size_columns):
+        """Python setter."""
+        self._size_columns = size_columns
+
+    @property
+    def value_columns(self):
+        """Python getter."""
+        return self._value_columns
+
+    @value_columns.setter
+    def value_columns(self, value_columns):
+        """Python setter."""
+        self._value_columns = value_columns
+
+    @property
+    def generation(self):
+        """Python getter."""
+        return self._generation
+
+    @generation.setter
+    def generation(self, generation):
+        """Python setter."""
+        self._generation = generation
+
+    @property
+    def sizes(self):
+        """Python getter."""
+        return self._sizes
+
+    @sizes.setter
+    def sizes(self, sizes):
+        """Python setter."""
+        self._sizes = sizes
+
+    @property
+    def values(self):
+        """Python getter."""
+        return self._values
+
+    @values.setter
+    def values(self, values):
+        """Python setter."""
+        self._values = values
+
+    @property
+    def sizes_sum(self):
+        """Python getter."""
+        return self._sizes_sum
+
+    @sizes_sum.setter
+    def sizes_sum(self, sizes_sum):
+        """Python setter."""
+        self._sizes_sum = sizes_sum
+
+    @property
+    def entropy_sum(self):
+        """Python getter."""
+        return self._entropy_sum
+
+    @entropy_sum.setter
+    def entropy_sum(self, entropy_sum):
+        """Python setter."""
+        self._entropy_sum = entropy_sum
+
+    @property
+    def nrows(self):
+        """Python getter."""
+        return self._nrows
+
+    @nrows.setter
+    def nrows(self, nrows):
+        """Python setter."""
+        self._nrows = nrows
+
+    def record(self, generation, sizes, values):
+        """Fold one row of the logs into the summary.
+
+        Args:
+            generation (int): current generation.
+            sizes (list of int): values of the integer columns.
+            values (list of float): values of the float columns;
+                the entropy is expected to be the last one.
+
+        """
+        self.generation = generation
+        self.sizes[:] = sizes
+        self.values[:] = values
+        self.sizes_sum += self.sizes
+        self.entropy_sum += self.values[-1]
+        self.nrows += 1
+
+    def to_series(self):
+        """Convert the summary into a table.
+
+        Note:
+            Means are taken over the recorded generations.
+
+        Returns:
+            pd.Series: final state of the population followed by the mean
+                subpopulations' sizes and the mean entropy.
+
+        """
+        summary = {"generations": self.generation}
+        for index, name in enumerate(self.size_columns):
+            summary[name] = self.sizes[index]
+        for index, name in enumerate(self.value_columns):
+            summary[name] = self.values[index]
+        for index, name in enumerate(self.size_columns):
+            mean_name = name.replace("__size", "__MeanSize")
+            summary[mean_name] = self.sizes_sum[index] / self.nrows
+        summary["MeanEntropy"] = self.entropy_sum / self.nrows
+        return pd.Series(summary, dtype=object)
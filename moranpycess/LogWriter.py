@@ -0,0 +1,202 @@
+""".
+
+##############################################################################
+#
+#   Implementation of the chunked on-disk simulation logs
+#
+#   AUTHOR: Maciej_Bak
+#   AFFILIATION: University_of_Basel
+#   AFFILIATION: Swiss_Institute_of_Bioinformatics
+#   CONTACT: wsciekly.maciek@gmail.com
+#   CREATED: 18-10-2026
+#   LICENSE: MIT
+#
+##############################################################################
+"""
+
+# imports
+import glob
+import importlib.util
+import os
+
+from moranpycess.CustomExceptions import IncorrectValueError
+from moranpycess.LogBuffer import LogBuffer
+
+
+class LogWriter:
+    """Sink which appends the simulation logs to a file in chunks."""
+
+    def __init__(self, path, file_format="csv", chunk_size=10000):
+        """Class initializer.
+
+        Note:
+            Rows of the logs are collected in a preallocated buffer and
+            appended to the output in bulk, one chunk at a time, therefore
+            the memory does not grow with the number of generations and
+            an interrupted simulation loses at most the last chunk.
+            Formats:
+            "csv" - a single CSV file, extended with every chunk;
+            "parquet" - a directory with one Parquet file per chunk
+            (requires pyarrow);
+            "hdf5" - a table under the key "log" in an HDF5 file
+            (requires PyTables).
+
+        Args:
+            path (str): path for the output file (directory for "parquet").
+            file_format (str, optional): one of: "csv", "parquet", "hdf5".
+                Defaults to "csv".
+            chunk_size (int, optional): number of rows written at once.
+                Defaults to 10000.
+
+        Raises:
+            IncorrectValueError: on an unknown format or
+                a non-positive chunk size.
+            ImportError: if the engine of the format is not installed.
+
+        Attributes:
+            path (str): path for the output file (directory for "parquet").
+            file_format (str): format of the output.
+            chunk_size (int): number of rows written at once.
+            nchunks (int): number of chunks written so far.
+            buffer (LogBuffer): rows which were not written yet.
+
+        """
+        if file_format not in ["csv", "parquet", "hdf5"]:
+            raise IncorrectValueError(
+                parameter="file_format",
+                message='Format needs to be one of: "csv", "parquet", "hdf5".',
+            )
+        if chunk_size < 1:
+            raise IncorrectValueError(
+                parameter="chunk_size",
+                message="Chunk size needs to be a positive integer.",
+            )
+        # fail before the simulation rather than at the first flush
+        engines = {
+            "parquet": ["pyarrow", "fastparquet"],
+            "hdf5": ["tables"],
+        }
+        if file_format in engines and not any(
+            importlib.util.find_spec(engine) is not None
+            for engine in engines[file_format]
+        ):
+            raise ImportError(
+                f'Format "{file_format}" requires one of: '
+                + ", ".join(engines[file_format])
+                + ' (install the "io" extra: pip install moranpycess[io]).'
+            )
+        self.path = path
+        self.file_format = file_format
+        self.chunk_size = chunk_size
+        self.nchunks = 0
+        self.buffer = None
+
+    @property
+    def path(self):
+        """Python getter."""
+        return self._path
+
+    @path.setter
+    def path(self, path):
+        """Python setter."""
+        self._path = path
+
+    @property
+    def file_format(self):
+        """Python getter."""
+        return self._file_format
+
+    @file_format.setter
+    def file_format(self, file_format):
+        """Python setter."""
+        self._file_format = file_format
+
+    @property
+    def chunk_size(self):
+        """Python getter."""
+        return self._chunk_size
+
+    @chunk_size.setter
+    def chunk_size(self, chunk_size):
+        """Python setter."""
+        self._chunk_size = chunk_size
+
+    @property
+    def nchunks(self):
+        """Python getter."""
+        return self._nchunks
+
+    @nchunks.setter
+    def nchunks(self, nchunks):
+        """Python setter."""
+        self._nchunks = nchunks
+
+    @property
+    def buffer(self):
+        """Python getter."""
+        return self._buffer
+
+    @buffer.setter
+    def buffer(self, buffer):
+        """Python setter."""
+        self._buffer = buffer
+
+    def open(self, size_columns, value_columns):
+        """Prepare the output for a new simulation.
+
+        Note:
+            Any previous output under the same path is replaced.
+
+        Args:
+            size_columns (list of str): names of the integer columns.
+            value_columns (list of str): names of the float columns.
+
+        """
+        self.buffer = LogBuffer(size_columns, value_columns, self.chunk_size)
+        self.nchunks = 0
+        if self.file_format == "parquet":
+            os.makedirs(self.path, exist_ok=True)
+            for part in glob.glob(os.path.join(self.path, "part-*.parquet")):
+                os.remove(part)
+        elif os.path.exists(self.path) and self.file_format == "csv":
+            os.remove(self.path)
+
+    def record(self, generation, sizes, values):
+        """Write one row of the logs.
+
+        Args:
+            generation (int): current generation.
+            sizes (list of int): values of the integer columns.
+            values (list of float): values of the float columns.
+
+        """
+        self.buffer.record(generation, sizes, values)
+        if self.buffer.nrows == self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Append the buffered rows to the output."""
+        if self.buffer.nrows == 0:
+            return
+        chunk = self.buffer.to_dataframe()
+        if self.file_format == "csv":
+            chunk.to_csv(self.path, mode="a", header=(self.nchunks == 0))
+        elif self.file_format == "parquet":
+            chunk.to_parquet(
+                os.path.join(self.path, f"part-{self.nchunks:06d}.parquet")
+            )
+        else:
+            # the first chunk replaces the table of a previous simulation
+            chunk.to_hdf(
+                self.path,
+                key="log",
+                mode="a",
+                format="table",
+                append=(self.nchunks > 0),
+            )
+        self.nchunks += 1
+        self.buffer.nrows = 0
+
+    def close(self):
+        """Write the remaining rows to the output."""
+        self.flush()
@@ -18,16 +18,18 @@
 
 # imports
 import random
+import types
 
 import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
 
 from moranpycess.CustomExceptions import IncorrectValueError
+from moranpycess.EntropyTracker import EntropyTracker
 from moranpycess.Individual import Individual
+from moranpycess.SimulationDriver import SimulationDriver
 
 
-class MoranProcess:
+class MoranProcess(SimulationDriver, EntropyTracker):
     """General Moran Process with multiple types of individuals."""
 
     def __init__(
@@ -37,6 +39,8 @@ def __init__(
         BirthPayoffMatrix,
         DeathPayoffMatrix,
         TransitionMatrix=None,
+        track_individuals=True,
+        rng=None,
     ):
         """Class initializer.
 
@@ -47,9 +51,18 @@ def __init__(
             DeathPayoffMatrix (np.array): payoff matrix for the death process.
             TransitionMatrix (np.array, optional): transition probabilities
                 between types. Defaults to None.
+            track_individuals (bool, optional): keep one Individual object
+                per member of the population. If False the population is
+                represented by the subpopulations' cardinalities only and
+                a Birth-Death step costs O(k) for k types instead of O(N).
+                Defaults to True.
+            rng (np.random.Generator, optional): source of randomness.
+                If None the global random and np.random modules are used.
+                Defaults to None.
 
         Attributes:
-            population (list of Individual): entire population.
+            population (list of Individual): entire population
+                (None if individuals are not tracked).
             init_size_list (list of int): cardinalities of initial
                 subpopulations.
             curr_size_list (list of int): cardinalities of current
@@ -67,9 +80,18 @@ def __init__(
                 for distinct subpopulations.
             DeathFitnessDict (dict of str-float): current death fitnesses
                 for distinct subpopulations.
+                The four mappings above are read-only snapshots of the values
+                (kept in arrays indexed by type); assigning a whole new dict
+                to an attribute updates the process.
             Entropy (float): current entropy of the whole population.
             TransitionMatrix (np.array, optional): transition probabilities
                 between types. Defaults to None.
+            fixation_generation (int): generation in which one type took
+                over the whole population (None if not detected).
+            fixed_label (str): label of the type which took over the whole
+                population (None if not detected).
+            rng (np.random.Generator): source of randomness
+                (None for the global random and np.random modules).
 
         Raises:
             AssertionError: on invalid arguments.
@@ -83,21 +105,27 @@ def __init__(
             e.args += ("Mismatch length of size and label lists",)
             raise
 
-        # initialize a list of Individuals
-        ID_counter = 0
-        self.population = []
-        for label_index, label in enumerate(label_list):
-            for i in range(size_list[label_index]):
-                self.population.append(
-                    Individual(ID=ID_counter, label=label_list[label_index])
-                )
-                ID_counter += 1
-
         # keep record of the argument lists
         self.init_size_list = copy.deepcopy(size_list)
         self.curr_size_list = copy.deepcopy(size_list)
         self.init_label_list = copy.deepcopy(label_list)
 
+        # initialize a list of Individuals
+        if track_individuals:
+            ID_counter = 0
+            population = []
+            for label_index, label in enumerate(label_list):
+                for i in range(size_list[label_index]):
+                    population.append(
+                        Individual(
+                            ID=ID_counter, label=label_list[label_index]
+                        )
+                    )
+                    ID_counter += 1
+            self.population = population
+        else:
+            self.population = None
+
         # check if the argument matrices shape match
         try:
             assert len(BirthPayoffMatrix.shape) == 2
@@ -128,15 +156,11 @@ def __init__(
         self.w = 0.5
 
         # calculate avg payoffs
-        self.AvgBirthPayoffDict = {}
         self._UpdateAvgBirthPayoffForAll()
-        self.AvgDeathPayoffDict = {}
         self._UpdateAvgDeathPayoffForAll()
 
         # calculate fitnesses
-        self.BirthFitnessDict = {}
         self._UpdateBirthFitnessForAll()
-        self.DeathFitnessDict = {}
         self._UpdateDeathFitnessForAll()
 
         # calculate entropy of the types distribution
@@ -166,15 +190,49 @@ def __init__(
                     )
         self.TransitionMatrix = copy.deepcopy(TransitionMatrix)
 
+        # absorption is detected only on demand (see: simulate)
+        self.fixation_generation = None
+        self.fixed_label = None
+
+        # keep record of the source of randomness
+        self.rng = rng
+
     @property
     def population(self):
-        """Python getter."""
+        """Python getter.
+
+        Note:
+            Individuals are stored grouped by their type; the list and
+            the payoffs and fitnesses of the Individuals are refreshed
+            lazily, only when the population is accessed.
+
+        """
+        if self._members is None:
+            return None
+        if self._population is None:
+            self._population = [
+                ind for members in self._members for ind in members
+            ]
+            self._population_synced = False
+        if not self._population_synced:
+            self._SyncPopulation()
         return self._population
 
     @population.setter
     def population(self, population):
         """Python setter."""
-        self._population = population
+        if population is None:
+            self._members = None
+        else:
+            label_indices = {
+                label: index
+                for index, label in enumerate(self.init_label_list)
+            }
+            self._members = [[] for label in self.init_label_list]
+            for ind in population:
+                self._members[label_indices[ind.label]].append(ind)
+        self._population = None
+        self._population_synced = False
 
     @property
     def init_size_list(self):
@@ -238,43 +296,91 @@ def w(self, w):
 
     @property
     def AvgBirthPayoffDict(self):
-        """Python getter."""
-        return self._AvgBirthPayoffDict
+        """Python getter.
+
+        Note:
+            Read-only view of a snapshot of the values; assign a new dict
+            to the attribute to change them.
+
+        """
+        return types.MappingProxyType(
+            dict(zip(self.init_label_list, self._AvgBirthPayoffArray.tolist()))
+        )
 
     @AvgBirthPayoffDict.setter
     def AvgBirthPayoffDict(self, AvgBirthPayoffDict):
         """Python setter."""
-        self._AvgBirthPayoffDict = AvgBirthPayoffDict
+        self._AvgBirthPayoffArray = np.array(
+            [AvgBirthPayoffDict[label] for label in self.init_label_list],
+            dtype=float,
+        )
+        self._population_synced = False
 
     @property
     def AvgDeathPayoffDict(self):
-        """Python getter."""
-        return self._AvgDeathPayoffDict
+        """Python getter.
+
+        Note:
+            Read-only view of a snapshot of the values; assign a new dict
+            to the attribute to change them.
+
+        """
+        return types.MappingProxyType(
+            dict(zip(self.init_label_list, self._AvgDeathPayoffArray.tolist()))
+        )
 
     @AvgDeathPayoffDict.setter
     def AvgDeathPayoffDict(self, AvgDeathPayoffDict):
         """Python setter."""
-        self._AvgDeathPayoffDict = AvgDeathPayoffDict
+        self._AvgDeathPayoffArray = np.array(
+            [AvgDeathPayoffDict[label] for label in self.init_label_list],
+            dtype=float,
+        )
+        self._population_synced = False
 
     @property
     def BirthFitnessDict(self):
-        """Python getter."""
-        return self._BirthFitnessDict
+        """Python getter.
+
+        Note:
+            Read-only view of a snapshot of the values; assign a new dict
+            to the attribute to change them.
+
+        """
+        return types.MappingProxyType(
+            dict(zip(self.init_label_list, self._BirthFitnessArray.tolist()))
+        )
 
     @BirthFitnessDict.setter
     def BirthFitnessDict(self, BirthFitnessDict):
         """Python setter."""
-        self._BirthFitnessDict = BirthFitnessDict
+        self._BirthFitnessArray = np.array(
+            [BirthFitnessDict[label] for label in self.init_label_list],
+            dtype=float,
+        )
+        self._population_synced = False
 
     @property
     def DeathFitnessDict(self):
-        """Python getter."""
-        return self._DeathFitnessDict
+        """Python getter.
+
+        Note:
+            Read-only view of a snapshot of the values; assign a new dict
+            to the attribute to change them.
+
+        """
+        return types.MappingProxyType(
+            dict(zip(self.init_label_list, self._DeathFitnessArray.tolist()))
+        )
 
     @DeathFitnessDict.setter
     def DeathFitnessDict(self, DeathFitnessDict):
         """Python setter."""
-        self._DeathFitnessDict = DeathFitnessDict
+        self._DeathFitnessArray = np.array(
+            [DeathFitnessDict[label] for label in self.init_label_list],
+            dtype=float,
+        )
+        self._population_synced = False
 
     @property
     def Entropy(self):
@@ -296,61 +402,122 @@ def TransitionMatrix(self, TransitionMatrix):
         """Python setter."""
         self._TransitionMatrix = TransitionMatrix
 
+    @property
+    def fixation_generation(self):
+        """Python getter."""
+        return self._fixation_generation
+
+    @fixation_generation.setter
+    def fixation_generation(self, fixation_generation):
+        """Python setter."""
+        self._fixation_generation = fixation_generation
+
+    @property
+    def fixed_label(self):
+        """Python getter."""
+        return self._fixed_label
+
+    @fixed_label.setter
+    def fixed_label(self, fixed_label):
+        """Python setter."""
+        self._fixed_label = fixed_label
+
+    @property
+    def rng(self):
+        """Python getter."""
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng):
+        """Python setter."""
+        self._rng = rng
+
+    def _RandomUniform(self, high):
+        """Draw a number uniformly from the interval [0, high].
+
+        Args:
+            high (float): upper bound of the interval.
+
+        Returns:
+            float: random number.
+
+        """
+        if self.rng is None:
+            return random.uniform(0, high)
+        return self.rng.uniform(0, high)
+
+    def _NumpyRandom(self):
+        """Select the source of the NumPy random draws.
+
+        Returns:
+            np.random.Generator: explicit generator of the process
+                or the global np.random module.
+
+        """
+        if self.rng is None:
+            return np.random
+        return self.rng
+
     def _UpdateAvgBirthPayoffForAll(self):
         """Calculate avg Birth Payoffs in the whole population."""
-        nrows = np.shape(self.BirthPayoffMatrix)[0]
-        ncols = np.shape(self.BirthPayoffMatrix)[1]
-        # calculate avg payoff for distinct Individual types:
-        for r in range(nrows):
-            payoff = 0
-            for c in range(ncols):
-                payoff += self.BirthPayoffMatrix[r, c] * (
-                    self.curr_size_list[c] - int(r == c)
-                )
-            payoff = payoff / (sum(self.curr_size_list) - 1)
-            self.AvgBirthPayoffDict[self.init_label_list[r]] = payoff
-        # update attributes of all Individuals:
-        for ind in self.population:
-            ind.AvgBirthPayoff = self.AvgBirthPayoffDict[ind.label]
+        self._AvgBirthPayoffArray = self.__AvgPayoffs(self.BirthPayoffMatrix)
+        self._population_synced = False
 
     def _UpdateAvgDeathPayoffForAll(self):
         """Calculate avg Death Payoffs in the whole population."""
-        nrows = np.shape(self.DeathPayoffMatrix)[0]
-        ncols = np.shape(self.DeathPayoffMatrix)[1]
-        # calculate avg payoff for distinct Individual types:
-        for r in range(nrows):
-            payoff = 0
-            for c in range(ncols):
-                payoff += self.DeathPayoffMatrix[r, c] * (
-                    self.curr_size_list[c] - int(r == c)
-                )
-            payoff = payoff / (sum(self.curr_size_list) - 1)
-            self.AvgDeathPayoffDict[self.init_label_list[r]] = payoff
-        # update attributes of all Individuals:
-        for ind in self.population:
-            ind.AvgDeathPayoff = self.AvgDeathPayoffDict[ind.label]
+        self._AvgDeathPayoffArray = self.__AvgPayoffs(self.DeathPayoffMatrix)
+        self._population_synced = False
+
+    def __AvgPayoffs(self, PayoffMatrix):
+        """Calculate avg payoffs for distinct Individual types.
+
+        Note:
+            Every individual interacts with all other members of
+            the population, hence the payoffs of all k types are given by
+            one matrix-vector product with the subpopulations' cardinalities.
+
+        Args:
+            PayoffMatrix (np.array): payoff matrix of the process.
+
+        Returns:
+            np.array: average payoffs of distinct types.
+
+        """
+        size_array = np.asarray(self.curr_size_list)
+        return (PayoffMatrix @ size_array - np.diag(PayoffMatrix)) / (
+            size_array.sum() - 1
+        )
 
     def _UpdateBirthFitnessForAll(self):
         """Calculate Birth Fitness in the whole population."""
-        # calculate fitness for distinct Individual types:
-        for label in self.init_label_list:
-            self.BirthFitnessDict[label] = (
-                1 - self.w + self.w * self.AvgBirthPayoffDict[label]
-            )
-        # update attributes of all Individuals:
-        for ind in self.population:
-            ind.BirthFitness = self.BirthFitnessDict[ind.label]
+        self._BirthFitnessArray = (
+            1 - self.w + self.w * self._AvgBirthPayoffArray
+        )
+        self._population_synced = False
 
     def _UpdateDeathFitnessForAll(self):
         """Calculate Death Fitness in the whole population."""
-        # calculate fitness for distinct Individual types:
-        for label in self.init_label_list:
-            self.DeathFitnessDict[label] = (
-                1 - self.w + self.w * self.AvgDeathPayoffDict[label]
-            )
-        # update attributes of all Individuals:
-        for ind in self.population:
-            ind.DeathFitness = self.DeathFitnessDict[ind.label]
+        self._DeathFitnessArray = (
+            1 - self.w + self.w * self._AvgDeathPayoffArray
+        )
+        self._population_synced = False
+
+    def _SyncPopulation(self):
+        """Copy current payoffs and fitnesses onto all Individuals."""
+        label_indices = {
+            label: index for index, label in enumerate(self.init_label_list)
+        }
+        AvgBirthPayoffs = self._AvgBirthPayoffArray.tolist()
+        AvgDeathPayoffs = self._AvgDeathPayoffArray.tolist()
+        BirthFitnesses = self._BirthFitnessArray.tolist()
+        DeathFitnesses = self._DeathFitnessArray.tolist()
+        for ind in self._population:
+            index = label_indices[ind.label]
+            ind.AvgBirthPayoff = AvgBirthPayoffs[index]
+            ind.AvgDeathPayoff = AvgDeathPayoffs[index]
+            ind.BirthFitness = BirthFitnesses[index]
+            ind.DeathFitness = DeathFitnesses[index]
+        self._population_synced = True
 
     def _roulette_wheel_selection_Birth(self):
         """Select one individual according to the Birth Fitness.
@@ -359,7 +526,10 @@ def _roulette_wheel_selection_Birth(self):
             Individual: an individual selected from the population.
 
         """
-        return self.__roulette_wheel_selection(attr="BirthFitness")
+        (type_index, member_index) = self.__roulette_wheel_selection(
+            fitness_array=self._BirthFitnessArray
+        )
+        return self._members[type_index][member_index]
 
     def _roulette_wheel_selection_Death(self):
         """Select one individual according to the Death Fitness.
@@ -368,146 +538,290 @@ def _roulette_wheel_selection_Death(self):
             Individual: an individual selected from the population.
 
         """
-        return self.__roulette_wheel_selection(attr="DeathFitness")
+        (type_index, member_index) = self.__roulette_wheel_selection(
+            fitness_array=self._DeathFitnessArray
+        )
+        return self._members[type_index][member_index]
 
-    def __roulette_wheel_selection(self, attr):
-        """Select individual based on fitness (fitness-proportional).
+    def _roulette_wheel_selection_BirthType(self):
+        """Select one type according to the Birth Fitness.
 
         Returns:
-            Individual: an individual selected from the population.
+            int: index of the selected type.
 
         """
-        if attr == "BirthFitness":
-            max_value = sum(ind.BirthFitness for ind in self.population)
-        elif attr == "DeathFitness":
-            max_value = sum(ind.DeathFitness for ind in self.population)
-        pick = random.uniform(0, max_value)
-        current = 0
-        for ind in self.population:
-            if attr == "BirthFitness":
-                current += ind.BirthFitness
-            elif attr == "DeathFitness":
-                current += ind.DeathFitness
-            if current > pick:
-                return ind
-
-    def simulate(self, generations):
-        """Simulate population evolution.
-
-        Simulate population evolution: Birth-Death process with fitness-based
-        selection of individuals.
+        return self.__roulette_wheel_selection(
+            fitness_array=self._BirthFitnessArray
+        )[0]
+
+    def _roulette_wheel_selection_DeathType(self):
+        """Select one type according to the Death Fitness.
+
+        Returns:
+            int: index of the selected type.
+
+        """
+        return self.__roulette_wheel_selection(
+            fitness_array=self._DeathFitnessArray
+        )[0]
+
+    def __roulette_wheel_selection(self, fitness_array):
+        """Select individual based on fitness (fitness-proportional).
+
+        Note:
+            All members of a subpopulation share the same fitness, hence
+            the wheel is spun over the k types, weighted by cardinality
+            times fitness, and the position of the pick inside the selected
+            type determines its member. The selection costs O(k)
+            instead of O(N).
 
         Args:
-            generations (int): number of time steps.
+            fitness_array (np.array): fitnesses of distinct types.
+
+        Returns:
+            tuple: (type index, member index) of the selected individual.
+
+        """
+        size_array = np.asarray(self.curr_size_list)
+        weights = size_array * fitness_array
+        cumulative_weights = np.cumsum(weights)
+        pick = self._RandomUniform(cumulative_weights[-1])
+        type_index = int(
+            np.searchsorted(cumulative_weights, pick, side="right")
+        )
+        if type_index == len(weights):
+            # the pick fell on the upper bound of the wheel
+            type_index = int(np.flatnonzero(weights)[-1])
+        offset = pick - (cumulative_weights[type_index] - weights[type_index])
+        member_index = min(
+            int(offset // fitness_array[type_index]),
+            size_array[type_index] - 1,
+        )
+        return (type_index, member_index)
+
+    def _TransitionCounts(self):
+        """Perform type transitions on the subpopulations' cardinalities.
+
+        Note:
+            Every individual switches its type independently, hence the new
+            cardinalities follow one multinomial draw per source type.
+
+        """
+        new_size_list = np.zeros(len(self.init_label_list), dtype=int)
+        for row_index, type_size in enumerate(self.curr_size_list):
+            new_size_list += self._NumpyRandom().multinomial(
+                type_size, self.TransitionMatrix[row_index,]
+            )
+        self.curr_size_list = new_size_list.tolist()
+
+    def _TransitionMembers(self):
+        """Perform type transitions on the tracked individuals.
+
+        Note:
+            Cardinalities of the destination types follow one multinomial
+            draw per source type; members are then assigned to these
+            destinations in a random order and only the ones which switch
+            their type are relabelled.
+
+        """
+        new_members = [[] for label in self.init_label_list]
+        for row_index, members in enumerate(self._members):
+            destination_sizes = self._NumpyRandom().multinomial(
+                len(members), self.TransitionMatrix[row_index,]
+            )
+            order = self._NumpyRandom().permutation(len(members))
+            start = 0
+            for new_index, type_size in enumerate(destination_sizes):
+                stop = start + type_size
+                moved = [members[i] for i in order[start:stop]]
+                start = stop
+                if new_index != row_index:
+                    for ind in moved:
+                        ind.label = self.init_label_list[new_index]
+                new_members[new_index].extend(moved)
+        self._members = new_members
+        # update the list with population info
+        self.curr_size_list = [len(members) for members in new_members]
+
+    def _PrepareRejectionFree(self):
+        """Prepare the process for the rejection-free simulation.
+
+        Raises:
+            IncorrectValueError: if the individuals are tracked.
+
+        """
+        if self._members is not None:
+            raise IncorrectValueError(
+                parameter="rejection_free",
+                message="Every cycle changes the tracked individuals.",
+            )
+
+    def _LogColumns(self):
+        """Names of the columns of the simulation logs.
 
         Returns:
-            pd.DataFrame: table with simulation logs.
+            tuple: names of the integer and of the float columns.
 
         """
-        # prepare a dataframe to store the logs
-        colnames = (
-            [label + "__size" for label in self.init_label_list]
-            + [label + "__AvgBirthPayoff" for label in self.init_label_list]
+        size_columns = [label + "__size" for label in self.init_label_list]
+        value_columns = (
+            [label + "__AvgBirthPayoff" for label in self.init_label_list]
             + [label + "__AvgDeathPayoff" for label in self.init_label_list]
             + [label + "__BirthFitness" for label in self.init_label_list]
             + [label + "__DeathFitness" for label in self.init_label_list]
             + ["Entropy"]
         )
-        log_df = pd.DataFrame(index=range(generations + 1), columns=colnames)
-        log_df.index.name = "generation"
-
-        # update the dataframe with features of the initial population
-        for index in range(len(self.init_label_list)):
-            label = self.init_label_list[index]
-            log_df.at[0, label + "__size"] = self.init_size_list[index]
-            log_df.at[0, label + "__AvgBirthPayoff"] = self.AvgBirthPayoffDict[
-                label
-            ]
-            log_df.at[0, label + "__AvgDeathPayoff"] = self.AvgDeathPayoffDict[
-                label
-            ]
-            log_df.at[0, label + "__BirthFitness"] = self.BirthFitnessDict[
-                label
-            ]
-            log_df.at[0, label + "__DeathFitness"] = self.DeathFitnessDict[
-                label
-            ]
-            log_df.at[0, "Entropy"] = self.Entropy
+        return (size_columns, value_columns)
+
+    def _SimulateGeneration(self):
+        """Perform one Birth-Death cycle (followed by type transitions).
+
+        Returns:
+            int: index of the type which multiplied.
 
-        for g in range(generations):
+        """
+        # evolve the cardinalities only (if individuals are not tracked)
+        if self._members is None:
+            # select one type to multiply and one type to die
+            birth_index = self._roulette_wheel_selection_BirthType()
+            death_index = self._roulette_wheel_selection_DeathType()
+            # update the list with population info
+            self.curr_size_list[birth_index] += 1
+            self.curr_size_list[death_index] -= 1
+            # perform transitions (if TransitionMatrix was specified)
+            if self.TransitionMatrix is not None:
+                self._TransitionCounts()
+        else:
             # select one individual to multiply
-            selectedBirth = self._roulette_wheel_selection_Birth()
+            (birth_index, birth_member) = self.__roulette_wheel_selection(
+                fitness_array=self._BirthFitnessArray
+            )
             # create a copy
-            new_individual = copy.deepcopy(selectedBirth)
+            new_individual = copy.deepcopy(
+                self._members[birth_index][birth_member]
+            )
             # select one individual to die
-            selectedDeath = self._roulette_wheel_selection_Death()
-            # add the new individual to the population
-            self.population.append(new_individual)
+            (death_index, death_member) = self.__roulette_wheel_selection(
+                fitness_array=self._DeathFitnessArray
+            )
             # remove the selected individual from the population
-            self.population.remove(selectedDeath)
+            members = self._members[death_index]
+            members[death_member] = members[-1]
+            members.pop()
+            # add the new individual to the population
+            self._members[birth_index].append(new_individual)
+            self._population = None
             # update the list with population info
-            self.curr_size_list[
-                self.init_label_list.index(selectedBirth.label)
-            ] += 1
-            self.curr_size_list[
-                self.init_label_list.index(selectedDeath.label)
-            ] -= 1
+            self.curr_size_list[birth_index] += 1
+            self.curr_size_list[death_index] -= 1
 
             # perform transitions (if TransitionMatrix was specified)
             if self.TransitionMatrix is not None:
-                for ind in self.population:
-                    row_index = self.init_label_list.index(ind.label)
-                    new_label = np.random.choice(
-                        a=self.init_label_list,
-                        size=1,
-                        p=self.TransitionMatrix[row_index,],
-                    )[0]
-                    old_label = ind.label
-                    ind.label = new_label
-                    # update the list with population info
-                    self.curr_size_list[
-                        self.init_label_list.index(new_label)
-                    ] += 1
-                    self.curr_size_list[
-                        self.init_label_list.index(old_label)
-                    ] -= 1
-
-            # after each birth-death cycle:
-            # re-evaluate the payoffs and fitnesses of all ind in the pop
-            self._UpdateAvgBirthPayoffForAll()
-            self._UpdateAvgDeathPayoffForAll()
-            self._UpdateBirthFitnessForAll()
-            self._UpdateDeathFitnessForAll()
-            # re-evaluate the population Entropy
+                self._TransitionMembers()
+
+        # after each birth-death cycle:
+        # re-evaluate the payoffs and fitnesses of all ind in the pop
+        self._UpdateAvgBirthPayoffForAll()
+        self._UpdateAvgDeathPayoffForAll()
+        self._UpdateBirthFitnessForAll()
+        self._UpdateDeathFitnessForAll()
+        # re-evaluate the population Entropy
+        # (transitions might change the cardinalities of all the types)
+        if self.TransitionMatrix is not None:
             self._UpdateEntropy()
+        else:
+            self._UpdateEntropyChange(birth_index, death_index)
 
-            # update the log dataframe
-            for index in range(len(self.init_label_list)):
-                label = self.init_label_list[index]
-                log_df.at[g + 1, label + "__size"] = self.curr_size_list[index]
-                log_df.at[
-                    g + 1, label + "__AvgBirthPayoff"
-                ] = self.AvgBirthPayoffDict[label]
-                log_df.at[
-                    g + 1, label + "__AvgDeathPayoff"
-                ] = self.AvgDeathPayoffDict[label]
-                log_df.at[
-                    g + 1, label + "__BirthFitness"
-                ] = self.BirthFitnessDict[label]
-                log_df.at[
-                    g + 1, label + "__DeathFitness"
-                ] = self.DeathFitnessDict[label]
-                log_df.at[g + 1, "Entropy"] = self.Entropy
-
-        return log_df
-
-    def _UpdateEntropy(self):
-        """Calculate entropy of Individual types in the population."""
-        self.Entropy = 0
-        for type_size in self.curr_size_list:
-            fraction = float(type_size) / len(self.population)
-            if fraction != 0.0:
-                self.Entropy -= fraction * np.log2(fraction)
+        return birth_index
+
+    def _EventWeights(self):
+        """Weights of the Birth-Death cycles which change the population.
+
+        Returns:
+            np.array: weights of the pairs (type which multiplies, type which
+                dies), proportional to their probability in a single cycle;
+                pairs of the same type have zero weights.
+
+        """
+        size_array = np.asarray(self.curr_size_list)
+        weights = np.outer(
+            size_array * self._BirthFitnessArray,
+            size_array * self._DeathFitnessArray,
+        )
+        np.fill_diagonal(weights, 0.0)
+        return weights
+
+    def _NextEventGenerations(self):
+        """Draw the number of generations until the population changes.
+
+        Note:
+            Every Birth-Death cycle changes the subpopulations' cardinalities
+            with the same probability until it does, hence the number of
+            cycles follows a geometric distribution.
+
+        Returns:
+            int: number of generations up to (and including) the next
+                change of the population (None if no change is possible).
+
+        """
+        size_array = np.asarray(self.curr_size_list)
+        probability = self._EventWeights().sum() / (
+            np.sum(size_array * self._BirthFitnessArray)
+            * np.sum(size_array * self._DeathFitnessArray)
+        )
+        if probability <= 0.0:
+            return None
+        return int(self._NumpyRandom().geometric(min(probability, 1.0)))
+
+    def _SimulateEvent(self):
+        """Perform one Birth-Death cycle which changes the population.
+
+        Note:
+            The types to multiply and to die are drawn jointly, conditioned
+            on being different (the embedded jump chain of the process).
+
+        Returns:
+            int: index of the type which multiplied.
+
+        """
+        weights = self._EventWeights().ravel()
+        cumulative_weights = np.cumsum(weights)
+        pick = self._RandomUniform(cumulative_weights[-1])
+        index = int(np.searchsorted(cumulative_weights, pick, side="right"))
+        if index == len(weights):
+            # the pick fell on the upper bound of the wheel
+            index = int(np.flatnonzero(weights)[-1])
+        (birth_index, death_index) = divmod(index, len(self.init_label_list))
+        # update the list with population info
+        self.curr_size_list[birth_index] += 1
+        self.curr_size_list[death_index] -= 1
+
+        # re-evaluate the payoffs and fitnesses of all ind in the pop
+        self._UpdateAvgBirthPayoffForAll()
+        self._UpdateAvgDeathPayoffForAll()
+        self._UpdateBirthFitnessForAll()
+        self._UpdateDeathFitnessForAll()
+        # re-evaluate the population Entropy
+        self._UpdateEntropyChange(birth_index, death_index)
+
+        return birth_index
+
+    def _LogValues(self):
+        """Collect the current payoffs, fitnesses and entropy for the logs.
+
+        Returns:
+            np.array: values in the order of the float log columns.
+
+        """
+        return np.concatenate(
+            (
+                self._AvgBirthPayoffArray,
+                self._AvgDeathPayoffArray,
+                self._BirthFitnessArray,
+                self._DeathFitnessArray,
+                [self.Entropy],
+            )
+        )
 
     def PlotSize(self, df, path):
         """Plot the sub-populations' sizes after a simulation.
@@ -527,7 +841,7 @@ def PlotSize(self, df, path):
         df_copy = df[columns].copy()
         df_copy.columns = self.init_label_list
         df_copy.plot(linewidth=1.5, ax=ax, cmap=cmap)
-        population_size = len(self.population)
+        population_size = sum(self.init_size_list)
         ax.set_ylim([0, population_size])
         plt.xlabel("Generation", size=14)
         plt.ylabel("# Individuals", size=14)
@@ -0,0 +1,650 @@
+""".
+
+##############################################################################
+#
+#   Implementation of the exact Markov chain of the General Moran Process
+#
+#   AUTHOR: Maciej_Bak
+#   AFFILIATION: University_of_Basel
+#   AFFILIATION: Swiss_Institute_of_Bioinformatics
+#   CONTACT: wsciekly.maciek@gmail.com
+#   CREATED: 18-10-2026
+#   LICENSE: MIT
+#
+##############################################################################
+"""
+
+# imports
+import copy
+import math
+
+import numpy as np
+import pandas as pd
+import scipy.linalg
+import scipy.signal
+import scipy.sparse
+import scipy.sparse.linalg
+import scipy.special
+
+from moranpycess.CustomExceptions import IncorrectValueError
+from moranpycess.MoranProcess import MoranProcess
+
+
+class MoranProcessChain:
+    """Markov chain of the subpopulations' cardinalities."""
+
+    def __init__(
+        self,
+        size_list,
+        label_list,
+        BirthPayoffMatrix,
+        DeathPayoffMatrix,
+        TransitionMatrix=None,
+    ):
+        """Class initializer.
+
+        Note:
+            States of the chain are all the possible cardinalities of k
+            subpopulations of a population of size N, that is:
+            (N+k-1 choose k-1) states, and its transition probabilities are
+            the ones of a single Birth-Death cycle of the class MoranProcess.
+            Quantities of interest are obtained by solving sparse linear
+            systems instead of simulating the process.
+
+        Args:
+            size_list (list of int): cardinalities of subpopulations.
+            label_list (list of str): distinct labels of subpopulations.
+            BirthPayoffMatrix (np.array): payoff matrix for the birth process.
+            DeathPayoffMatrix (np.array): payoff matrix for the death process.
+            TransitionMatrix (np.array, optional): transition probabilities
+                between types. Defaults to None.
+
+        Attributes:
+            init_size_list (list of int): cardinalities of initial
+                subpopulations.
+            init_label_list (list of str): distinct labels of initial
+                subpopulations.
+            BirthPayoffMatrix (np.array): payoff matrix for the birth process.
+            DeathPayoffMatrix (np.array): payoff matrix for the death process.
+            TransitionMatrix (np.array, optional): transition probabilities
+                between types. Defaults to None.
+            w (float): selection pressure weight for the fitness calculation.
+
+        Raises:
+            AssertionError: on invalid arguments.
+            IncorrectValueError: on wrong values in the Transition Matrix.
+
+        """
+        # check if the argument lists length match
+        try:
+            assert len(size_list) == len(label_list)
+        except AssertionError as e:
+            e.args += ("Mismatch length of size and label lists",)
+            raise
+
+        # check if the argument matrices shape match
+        try:
+            assert len(BirthPayoffMatrix.shape) == 2
+            assert (
+                BirthPayoffMatrix.shape[0]
+                == BirthPayoffMatrix.shape[1]
+                == len(label_list)
+            )
+        except AssertionError as e:
+            e.args += ("Invalid Payoff Matrix",)
+            raise
+        try:
+            assert len(DeathPayoffMatrix.shape) == 2
+            assert (
+                DeathPayoffMatrix.shape[0]
+                == DeathPayoffMatrix.shape[1]
+                == len(label_list)
+            )
+        except AssertionError as e:
+            e.args += ("Invalid Payoff Matrix",)
+            raise
+
+        # check the transition matrix between types
+        if TransitionMatrix is not None:
+            try:
+                # check if the argument matrix shape match
+                assert len(TransitionMatrix.shape) == 2
+                assert (
+                    TransitionMatrix.shape[0]
+                    == TransitionMatrix.shape[1]
+                    == len(label_list)
+                )
+            except AssertionError as e:
+                e.args += ("Invalid Transition Matrix",)
+                raise
+            # check if the values are correct
+            message = "Transition probabilities need to add up to 1.0."
+            for v in np.sum(TransitionMatrix, axis=1):
+                if v != 1.0:
+                    raise IncorrectValueError(
+                        parameter="Transition Matrix",
+                        message=message,
+                    )
+
+        # keep record of the arguments
+        self.init_size_list = copy.deepcopy(size_list)
+        self.init_label_list = copy.deepcopy(label_list)
+        self.BirthPayoffMatrix = BirthPayoffMatrix.copy()
+        self.DeathPayoffMatrix = DeathPayoffMatrix.copy()
+        self.TransitionMatrix = copy.deepcopy(TransitionMatrix)
+
+        # introduce a payoff weight for the fitness calculation
+        self.w = 0.5
+
+        # states of the chain are enumerated only on demand
+        self._states = None
+
+    @property
+    def init_size_list(self):
+        """Python getter."""
+        return self._init_size_list
+
+    @init_size_list.setter
+    def init_size_list(self, init_size_list):
+        """Python setter."""
+        self._init_size_list = init_size_list
+
+    @property
+    def init_label_list(self):
+        """Python getter."""
+        return self._init_label_list
+
+    @init_label_list.setter
+    def init_label_list(self, init_label_list):
+        """Python setter."""
+        self._init_label_list = init_label_list
+
+    @property
+    def BirthPayoffMatrix(self):
+        """Python getter."""
+        return self._BirthPayoffMatrix
+
+    @BirthPayoffMatrix.setter
+    def BirthPayoffMatrix(self, BirthPayoffMatrix):
+        """Python setter."""
+        self._BirthPayoffMatrix = BirthPayoffMatrix
+
+    @property
+    def DeathPayoffMatrix(self):
+        """Python getter."""
+        return self._DeathPayoffMatrix
+
+    @DeathPayoffMatrix.setter
+    def DeathPayoffMatrix(self, DeathPayoffMatrix):
+        """Python setter."""
+        self._DeathPayoffMatrix = DeathPayoffMatrix
+
+    @property
+    def TransitionMatrix(self):
+        """Python getter."""
+        return self._TransitionMatrix
+
+    @TransitionMatrix.setter
+    def TransitionMatrix(self, TransitionMatrix):
+        """Python setter."""
+        self._TransitionMatrix = TransitionMatrix
+
+    @property
+    def w(self):
+        """Python getter."""
+        return self._w
+
+    @w.setter
+    def w(self, w):
+        """Python setter."""
+        self._w = w
+
+    def _Compositions(self, total, parts):
+        """Enumerate all the cardinalities of the subpopulations.
+
+        Args:
+            total (int): size of the population.
+            parts (int): number of the subpopulations.
+
+        Returns:
+            np.array: one state per row, in the lexicographic order.
+
+        """
+        partial = np.zeros((1, 0), dtype=np.int64)
+        for _ in range(parts - 1):
+            counts = total - partial.sum(axis=1) + 1
+            offsets = np.repeat(np.cumsum(counts) - counts, counts)
+            values = np.arange(counts.sum()) - offsets
+            partial = np.column_stack(
+                (np.repeat(partial, counts, axis=0), values)
+            )
+        return np.column_stack((partial, total - partial.sum(axis=1)))
+
+    def _States(self):
+        """Enumerate the states of the chain (only once).
+
+        Returns:
+            np.array: all the possible cardinalities of the subpopulations,
+                one state per row.
+
+        """
+        if self._states is None:
+            self._states = self._Compositions(
+                sum(self.init_size_list), len(self.init_label_list)
+            )
+        return self._states
+
+    def _StateIndex(self, states):
+        """Find the positions of the states in the chain.
+
+        Args:
+            states (np.array): one state per row.
+
+        Returns:
+            np.array: indices of the states.
+
+        """
+        # states are sorted lexicographically, hence so are their codes
+        base = sum(self.init_size_list) + 1
+        powers = base ** np.arange(len(self.init_label_list) - 2, -1, -1)
+        codes = self._States()[:, :-1] @ powers
+        return np.searchsorted(codes, np.asarray(states)[:, :-1] @ powers)
+
+    def _BirthDeathMatrix(self):
+        """Build the transition matrix of a single Birth-Death cycle.
+
+        Returns:
+            scipy.sparse.csr_matrix: transition probabilities between
+                the states of the chain.
+
+        """
+        states = self._States()
+        population_size = states.sum(axis=1)[0]
+        weights = []
+        for PayoffMatrix in [self.BirthPayoffMatrix, self.DeathPayoffMatrix]:
+            payoffs = (states @ PayoffMatrix.T - np.diag(PayoffMatrix)) / (
+                population_size - 1
+            )
+            type_weights = states * (1 - self.w + self.w * payoffs)
+            weights.append(
+                type_weights / type_weights.sum(axis=1, keepdims=True)
+            )
+        (birth_weights, death_weights) = weights
+
+        rows = []
+        columns = []
+        probabilities = []
+        ntypes = states.shape[1]
+        for birth_index in range(ntypes):
+            for death_index in range(ntypes):
+                if birth_index == death_index:
+                    continue
+                probability = (
+                    birth_weights[:, birth_index]
+                    * death_weights[:, death_index]
+                )
+                sources = np.flatnonzero(probability > 0)
+                targets = states[sources].copy()
+                targets[:, birth_index] += 1
+                targets[:, death_index] -= 1
+                rows.append(sources)
+                columns.append(self._StateIndex(targets))
+                probabilities.append(probability[sources])
+        # the remaining probability corresponds to no change of the state
+        off_diagonal = scipy.sparse.csr_matrix(
+            (
+                np.concatenate(probabilities),
+                (np.concatenate(rows), np.concatenate(columns)),
+            ),
+            shape=(len(states), len(states)),
+        )
+        diagonal = 1.0 - np.asarray(off_diagonal.sum(axis=1)).ravel()
+        return (off_diagonal + scipy.sparse.diags(diagonal)).tocsr()
+
+    def _AbsorptionSystem(self):
+        """Split the chain into the transient and the absorbing states.
+
+        Raises:
+            IncorrectValueError: if a TransitionMatrix is specified.
+
+        Returns:
+            tuple: indices of the transient states, matrix I-Q of the
+                transient part of the chain (Q) and the probabilities of
+                absorption in a single cycle (one column per type).
+
+        """
+        if self.TransitionMatrix is not None:
+            raise IncorrectValueError(
+                parameter="TransitionMatrix",
+                message="Fixation is not absorbing with type transitions.",
+            )
+        states = self._States()
+        population_size = sum(self.init_size_list)
+        absorbing = np.flatnonzero(states.max(axis=1) == population_size)
+        # type of the absorbing states in the order of the types
+        absorbing = absorbing[np.argmax(states[absorbing], axis=0)]
+        transient = np.setdiff1d(np.arange(len(states)), absorbing)
+        P = self._BirthDeathMatrix()
+        Q = P[transient][:, transient]
+        R = P[transient][:, absorbing].toarray()
+        identity = scipy.sparse.identity(len(transient), format="csr")
+        return (transient, (identity - Q).tocsr(), R)
+
+    def _Solve(self, A, b):
+        """Solve the linear system A x = b.
+
+        Note:
+            For two types the chain is a birth-death chain over
+            the cardinality of one type, hence the system is tridiagonal
+            and solved in O(N) with a banded solver.
+
+        Args:
+            A (scipy.sparse.csr_matrix): matrix of the system.
+            b (np.array): right-hand side of the system
+                (one column per system).
+
+        Returns:
+            np.array: solution of the system.
+
+        """
+        if len(self.init_label_list) == 2:
+            banded = np.zeros((3, A.shape[0]))
+            banded[0, 1:] = A.diagonal(1)
+            banded[1, :] = A.diagonal(0)
+            banded[2, :-1] = A.diagonal(-1)
+            return scipy.linalg.solve_banded((1, 1), banded, b)
+        solution = scipy.sparse.linalg.spsolve(A.tocsc(), b)
+        return np.asarray(solution).reshape(b.shape)
+
+    def _ExpectedVisits(self, transient, A):
+        """Calculate the expected numbers of visits in the transient states.
+
+        Args:
+            transient (np.array): indices of the transient states.
+            A (scipy.sparse.csr_matrix): matrix I-Q of the transient part
+                of the chain.
+
+        Returns:
+            np.array: expected numbers of visits in the transient states
+                starting from the initial population (None if the initial
+                population is absorbed already).
+
+        """
+        initial_index = self._StateIndex([self.init_size_list])[0]
+        position = np.searchsorted(transient, initial_index)
+        if position == len(transient) or transient[position] != initial_index:
+            return None
+        initial = np.zeros(len(transient))
+        initial[position] = 1.0
+        return self._Solve(A.T.tocsr(), initial)
+
+    def _AbsorbedInitially(self, values):
+        """Quantities of interest for an already absorbed population.
+
+        Args:
+            values (tuple): value for the fixed type and for the others.
+
+        Returns:
+            pd.Series: values indexed by the labels of the types.
+
+        """
+        fixed = np.asarray(self.init_size_list) == sum(self.init_size_list)
+        return pd.Series(
+            np.where(fixed, values[0], values[1]), index=self.init_label_list
+        )
+
+    def fixation_probabilities(self):
+        """Calculate the fixation probabilities of all the types.
+
+        Returns:
+            pd.Series: probability that a given type takes over the whole
+                population, starting from the initial population.
+
+        Raises:
+            IncorrectValueError: if a TransitionMatrix is specified.
+
+        """
+        (transient, A, R) = self._AbsorptionSystem()
+        visits = self._ExpectedVisits(transient, A)
+        if visits is None:
+            return self._AbsorbedInitially((1.0, 0.0))
+        return pd.Series(visits @ R, index=self.init_label_list)
+
+    def absorption_time(self):
+        """Calculate the mean number of generations until the fixation.
+
+        Returns:
+            float: expected number of Birth-Death cycles until one type
+                takes over the whole population, starting from the initial
+                population.
+
+        Raises:
+            IncorrectValueError: if a TransitionMatrix is specified.
+
+        """
+        (transient, A, R) = self._AbsorptionSystem()
+        visits = self._ExpectedVisits(transient, A)
+        if visits is None:
+            return 0.0
+        return float(visits.sum())
+
+    def fixation_times(self):
+        """Calculate the mean fixation times conditioned on the fixed type.
+
+        Returns:
+            pd.Series: expected number of Birth-Death cycles until a given
+                type takes over the whole population, conditioned on its
+                fixation (NaN for types which cannot be fixed).
+
+        Raises:
+            IncorrectValueError: if a TransitionMatrix is specified.
+
+        """
+        (transient, A, R) = self._AbsorptionSystem()
+        visits = self._ExpectedVisits(transient, A)
+        if visits is None:
+            return self._AbsorbedInitially((0.0, np.nan))
+        # fixation probabilities starting from every transient state
+        probabilities = self._Solve(A, R)
+        fixation = visits @ R
+        times = np.full(len(fixation), np.nan)
+        fixable = fixation > 0
+        times[fixable] = (visits @ probabilities)[fixable] / fixation[fixable]
+        return pd.Series(times, index=self.init_label_list)
+
+    def _MultinomialPMF(self, splits, probabilities):
+        """Calculate the probabilities of the outcomes of a multinomial draw.
+
+        Args:
+            splits (np.array): outcomes of the draw, one per row.
+            probabilities (np.array): probabilities of the categories.
+
+        Returns:
+            np.array: probabilities of the outcomes.
+
+        """
+        ntrials = splits[0].sum() if len(splits) else 0
+        log_pmf = (
+            scipy.special.gammaln(ntrials + 1)
+            - scipy.special.gammaln(splits + 1).sum(axis=1)
+            + scipy.special.xlogy(splits, probabilities).sum(axis=1)
+        )
+        return np.exp(log_pmf)
+
+    def _TransitionKernel(self):
+        """Build the transition matrix of the type transitions.
+
+        Note:
+            Every individual switches its type independently, hence
+            the new cardinalities are the sum of one multinomial draw per
+            source type (see: MoranProcess._TransitionCounts) and their
+            distribution is the convolution of these draws. Distributions
+            are kept on a dense grid over the cardinalities of all the types
+            but the last one.
+            The matrix is dense: with positive transition probabilities
+            every state can be reached from every other one in a single
+            cycle, hence a sparse format would store all the S^2 entries
+            anyway. Its size is bounded by the caller (see: max_states).
+
+        Returns:
+            np.array: transition probabilities between the states
+                of the chain.
+
+        """
+        states = self._States()
+        ntypes = len(self.init_label_list)
+        kernel = np.zeros((len(states), len(states)))
+        # distributions of the draws are shared between the states
+        draws = {}
+        for state_index, state in enumerate(states):
+            distribution = np.ones((1,) * (ntypes - 1))
+            for source, type_size in enumerate(state):
+                if type_size == 0:
+                    continue
+                if (source, type_size) not in draws:
+                    splits = self._Compositions(type_size, ntypes)
+                    draw = np.zeros((type_size + 1,) * (ntypes - 1))
+                    draw[tuple(splits[:, :-1].T)] = self._MultinomialPMF(
+                        splits, self.TransitionMatrix[source]
+                    )
+                    draws[(source, type_size)] = draw
+                distribution = scipy.signal.convolve(
+                    distribution, draws[(source, type_size)]
+                )
+            kernel[state_index] = distribution[tuple(states[:, :-1].T)]
+        # clip the round-off errors of the convolutions
+        np.clip(kernel, 0.0, None, out=kernel)
+        return kernel / kernel.sum(axis=1, keepdims=True)
+
+    def _NumberOfStates(self):
+        """Count the states of the chain without enumerating them.
+
+        Returns:
+            int: number of compositions of the population size
+                into the cardinalities of all the types.
+
+        """
+        ntypes = len(self.init_label_list)
+        return math.comb(sum(self.init_size_list) + ntypes - 1, ntypes - 1)
+
+    def stationary_distribution(self, max_states=2000):
+        """Calculate the stationary distribution of the chain.
+
+        Note:
+            With type transitions the chain does not get absorbed and
+            (for an irreducible chain) the long-run frequencies of its states
+            do not depend on the initial population. They are obtained
+            by solving the linear system of the balance equations,
+            with one of them replaced by the normalization.
+            The transition matrix of the type transitions is dense
+            (see: _TransitionKernel), hence the system is solved directly,
+            with O(S^2) memory and O(S^3) time for S states of the chain.
+
+        Args:
+            max_states (int, optional): maximal number of states of the chain
+                which is solved. Defaults to 2000.
+
+        Returns:
+            pd.DataFrame: cardinalities of subpopulations and the stationary
+                probability of the state, one row per state of the chain.
+
+        Raises:
+            IncorrectValueError: if the TransitionMatrix is not specified
+                or the chain has more than max_states states.
+            np.linalg.LinAlgError: if the chain is not irreducible.
+
+        """
+        if self.TransitionMatrix is None:
+            raise IncorrectValueError(
+                parameter="TransitionMatrix",
+                message="Stationary distribution requires type transitions.",
+            )
+        nstates = self._NumberOfStates()
+        if nstates > max_states:
+            raise IncorrectValueError(
+                parameter="max_states",
+                message=f"The chain has {nstates} states. "
+                "Please use stationary_summary for a simulated estimate.",
+            )
+        states = self._States()
+        # every cycle is a Birth-Death step followed by type transitions
+        P = self._BirthDeathMatrix() @ self._TransitionKernel()
+        A = np.asarray(P).T - np.identity(len(states))
+        A[-1, :] = 1.0
+        b = np.zeros(len(states))
+        b[-1] = 1.0
+        # clip the round-off errors of the solver
+        probabilities = np.clip(np.linalg.solve(A, b), 0.0, None)
+        columns = {}
+        for index, label in enumerate(self.init_label_list):
+            columns[label + "__size"] = states[:, index]
+        columns["probability"] = probabilities / probabilities.sum()
+        return pd.DataFrame(columns)
+
+    def stationary_summary(
+        self, max_states=2000, generations=10**6, burn_in=10**5, rng=None
+    ):
+        """Calculate the long-run means of the subpopulations' sizes.
+
+        Note:
+            Chains with at most max_states states are solved exactly
+            (see: stationary_distribution). Larger systems are simulated
+            instead with a fixed-memory summary of the logs:
+            the population evolves for burn_in generations and the means
+            are then taken over the following generations.
+
+        Args:
+            max_states (int, optional): maximal number of states of the chain
+                which is solved exactly. Defaults to 2000.
+            generations (int, optional): number of the averaged generations
+                of the simulation. Defaults to 10**6.
+            burn_in (int, optional): number of the discarded generations
+                of the simulation. Defaults to 10**5.
+            rng (np.random.Generator, optional): source of randomness
+                of the simulation. If None the global np.random module
+                is used. Defaults to None.
+
+        Returns:
+            pd.Series: mean subpopulations' sizes and the mean entropy.
+
+        Raises:
+            IncorrectValueError: if the TransitionMatrix is not specified.
+
+        """
+        if self.TransitionMatrix is None:
+            raise IncorrectValueError(
+                parameter="TransitionMatrix",
+                message="Stationary distribution requires type transitions.",
+            )
+        ntypes = len(self.init_label_list)
+        mean_columns = [label + "__MeanSize" for label in self.init_label_list]
+
+        if self._NumberOfStates() <= max_states:
+            distribution = self.stationary_distribution(max_states)
+            probabilities = distribution["probability"].to_numpy()
+            sizes = distribution.iloc[:, :ntypes].to_numpy()
+            fractions = sizes / sum(self.init_size_list)
+            entropy = -scipy.special.xlogy(fractions, fractions).sum(
+                axis=1
+            ) / np.log(2)
+            summary = dict(zip(mean_columns, probabilities @ sizes))
+            summary["MeanEntropy"] = probabilities @ entropy
+            return pd.Series(summary)
+
+        # streaming estimate from a single long simulation
+        process = MoranProcess(
+            size_list=self.init_size_list,
+            label_list=self.init_label_list,
+            BirthPayoffMatrix=self.BirthPayoffMatrix,
+            DeathPayoffMatrix=self.DeathPayoffMatrix,
+            TransitionMatrix=self.TransitionMatrix,
+            track_individuals=False,
+            rng=rng,
+        )
+        process.w = self.w
+        process._UpdateBirthFitnessForAll()
+        process._UpdateDeathFitnessForAll()
+        if burn_in > 0:
+            process.simulate(burn_in, summary_only=True)
+        log = process.simulate(generations, summary_only=True)
+        return log[mean_columns + ["MeanEntropy"]].astype(float)
@@ -0,0 +1,300 @@
+""".
+
+##############################################################################
+#
+#   Implementation of an ensemble of independent Moran Processes
+#
+#   AUTHOR: Maciej_Bak
+#   AFFILIATION: University_of_Basel
+#   AFFILIATION: Swiss_Institute_of_Bioinformatics
+#   CONTACT: wsciekly.maciek@gmail.com
+#   CREATED: 18-10-2026
+#   LICENSE: MIT
+#
+##############################################################################
+"""
+
+# imports
+import copy
+
+import numpy as np
+import pandas as pd
+
+from moranpycess.CustomExceptions import IncorrectValueError
+
+
+class MoranProcessEnsemble:
+    """Batch of independent replicates of the General Moran Process."""
+
+    def __init__(
+        self,
+        size_list,
+        label_list,
+        BirthPayoffMatrix,
+        DeathPayoffMatrix,
+        replicates,
+        rng=None,
+    ):
+        """Class initializer.
+
+        Note:
+            Replicates are represented by the subpopulations' cardinalities
+            only (one row of an integer array per replicate) and all of them
+            are advanced together, with one vectorized random draw
+            per Birth-Death step.
+
+        Args:
+            size_list (list of int): cardinalities of subpopulations.
+            label_list (list of str): distinct labels of subpopulations.
+            BirthPayoffMatrix (np.array): payoff matrix for the birth process.
+            DeathPayoffMatrix (np.array): payoff matrix for the death process.
+            replicates (int): number of independent replicates.
+            rng (np.random.Generator, optional): source of randomness.
+                If None the global np.random module is used.
+                Defaults to None.
+
+        Attributes:
+            init_size_list (list of int): cardinalities of initial
+                subpopulations.
+            init_label_list (list of str): distinct labels of initial
+                subpopulations.
+            BirthPayoffMatrix (np.array): payoff matrix for the birth process.
+            DeathPayoffMatrix (np.array): payoff matrix for the death process.
+            replicates (int): number of independent replicates.
+            w (float): selection pressure weight for the fitness calculation.
+            counts (np.array): current cardinalities of subpopulations,
+                one row per replicate.
+            rng (np.random.Generator): source of randomness
+                (None for the global np.random module).
+
+        Raises:
+            AssertionError: on invalid arguments.
+            IncorrectValueError: on a non-positive number of replicates.
+
+        """
+        # check if the argument lists length match
+        try:
+            assert len(size_list) == len(label_list)
+        except AssertionError as e:
+            e.args += ("Mismatch length of size and label lists",)
+            raise
+
+        # check if the argument matrices shape match
+        try:
+            assert len(BirthPayoffMatrix.shape) == 2
+            assert (
+                BirthPayoffMatrix.shape[0]
+                == BirthPayoffMatrix.shape[1]
+                == len(label_list)
+            )
+        except AssertionError as e:
+            e.args += ("Invalid Payoff Matrix",)
+            raise
+        try:
+            assert len(DeathPayoffMatrix.shape) == 2
+            assert (
+                DeathPayoffMatrix.shape[0]
+                == DeathPayoffMatrix.shape[1]
+                == len(label_list)
+            )
+        except AssertionError as e:
+            e.args += ("Invalid Payoff Matrix",)
+            raise
+
+        if replicates < 1:
+            raise IncorrectValueError(
+                parameter="replicates",
+                message="Number of replicates needs to be a positive integer.",
+            )
+
+        # keep record of the arguments
+        self.init_size_list = copy.deepcopy(size_list)
+        self.init_label_list = copy.deepcopy(label_list)
+        self.BirthPayoffMatrix = BirthPayoffMatrix.copy()
+        self.DeathPayoffMatrix = DeathPayoffMatrix.copy()
+        self.replicates = replicates
+        self.rng = rng
+
+        # introduce a payoff weight for the fitness calculation
+        self.w = 0.5
+
+        # all replicates start from the same population
+        self.counts = np.tile(
+            np.asarray(size_list, dtype=np.int64), (replicates, 1)
+        )
+
+    @property
+    def init_size_list(self):
+        """Python getter."""
+        return self._init_size_list
+
+    @init_size_list.setter
+    def init_size_list(self, init_size_list):
+        """Python setter."""
+        self._init_size_list = init_size_list
+
+    @property
+    def init_label_list(self):
+        """Python getter."""
+        return self._init_label_list
+
+    @init_label_list.setter
+    def init_label_list(self, init_label_list):
+        """Python setter."""
+        self._init_label_list = init_label_list
+
+    @property
+    def BirthPayoffMatrix(self):
+        """Python getter."""
+        return self._BirthPayoffMatrix
+
+    @BirthPayoffMatrix.setter
+    def BirthPayoffMatrix(self, BirthPayoffMatrix):
+        """Python setter."""
+        self._BirthPayoffMatrix = BirthPayoffMatrix
+
+    @property
+    def DeathPayoffMatrix(self):
+        """Python getter."""
+        return self._DeathPayoffMatrix
+
+    @DeathPayoffMatrix.setter
+    def DeathPayoffMatrix(self, DeathPayoffMatrix):
+        """Python setter."""
+        self._DeathPayoffMatrix = DeathPayoffMatrix
+
+    @property
+    def replicates(self):
+        """Python getter."""
+        return self._replicates
+
+    @replicates.setter
+    def replicates(self, replicates):
+        """Python setter."""
+        self._replicates = replicates
+
+    @property
+    def w(self):
+        """Python getter."""
+        return self._w
+
+    @w.setter
+    def w(self, w):
+        """Python setter."""
+        self._w = w
+
+    @property
+    def counts(self):
+        """Python getter."""
+        return self._counts
+
+    @counts.setter
+    def counts(self, counts):
+        """Python setter."""
+        self._counts = counts
+
+    @property
+    def rng(self):
+        """Python getter."""
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng):
+        """Python setter."""
+        self._rng = rng
+
+    def _roulette_wheel_selection(self, counts, PayoffMatrix):
+        """Select one type per replicate based on fitness.
+
+        Args:
+            counts (np.array): cardinalities of subpopulations,
+                one row per replicate.
+            PayoffMatrix (np.array): payoff matrix of the process.
+
+        Returns:
+            np.array: indices of the selected types, one per replicate.
+
+        """
+        population_size = sum(self.init_size_list)
+        payoffs = (counts @ PayoffMatrix.T - np.diag(PayoffMatrix)) / (
+            population_size - 1
+        )
+        weights = counts * (1 - self.w + self.w * payoffs)
+        cumulative_weights = np.cumsum(weights, axis=1)
+        random_source = np.random if self.rng is None else self.rng
+        picks = random_source.uniform(0, cumulative_weights[:, -1])
+        type_index = np.sum(cumulative_weights <= picks[:, None], axis=1)
+        overflow = np.flatnonzero(type_index == counts.shape[1])
+        if overflow.size:
+            # the pick fell on the upper bound of the wheel
+            nonzero = weights[overflow, ::-1] > 0
+            type_index[overflow] = (
+                counts.shape[1] - 1 - np.argmax(nonzero, axis=1)
+            )
+        return type_index
+
+    def simulate(self, generations):
+        """Simulate evolution of all the replicates.
+
+        Note:
+            Every simulation starts from the initial population. Replicates
+            in which one type took over the whole population are absorbed
+            and are not evolved any further.
+
+        Args:
+            generations (int): maximal number of time steps.
+
+        Returns:
+            pd.DataFrame: table with the final cardinalities of
+                subpopulations, the generation of absorption and
+                the label of the fixed type (missing values for
+                replicates which were not absorbed), one row per replicate.
+
+        """
+        population_size = sum(self.init_size_list)
+        counts = np.tile(
+            np.asarray(self.init_size_list, dtype=np.int64),
+            (self.replicates, 1),
+        )
+        fixation_generation = np.zeros(self.replicates, dtype=np.int64)
+        fixed_index = np.argmax(counts, axis=1)
+        absorbed = counts.max(axis=1) == population_size
+        active = np.flatnonzero(~absorbed)
+
+        for g in range(1, generations + 1):
+            if active.size == 0:
+                break
+            # select one type to multiply and one type to die per replicate
+            active_counts = counts[active]
+            birth_index = self._roulette_wheel_selection(
+                active_counts, self.BirthPayoffMatrix
+            )
+            death_index = self._roulette_wheel_selection(
+                active_counts, self.DeathPayoffMatrix
+            )
+            counts[active, birth_index] += 1
+            counts[active, death_index] -= 1
+            # only the type which multiplied can take over the population
+            fixed = counts[active, birth_index] == population_size
+            if fixed.any():
+                absorbed[active[fixed]] = True
+                fixation_generation[active[fixed]] = g
+                fixed_index[active[fixed]] = birth_index[fixed]
+                active = active[~fixed]
+
+        self.counts = counts
+
+        # prepare a table with the outcomes of all replicates
+        columns = {}
+        for index, label in enumerate(self.init_label_list):
+            columns[label + "__size"] = counts[:, index]
+        columns["fixation_generation"] = pd.array(
+            fixation_generation, dtype="Int64"
+        )
+        columns["fixation_generation"][~absorbed] = pd.NA
+        columns["fixed_label"] = [
+            self.init_label_list[index] if is_absorbed else None
+            for index, is_absorbed in zip(fixed_index, absorbed)
+        ]
+        index = pd.RangeIndex(self.replicates, name="replicate")
+        return pd.DataFrame(columns, index=index)
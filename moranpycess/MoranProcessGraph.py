@@ -0,0 +1,1027 @@
+""".
+
+##############################################################################
+#
+#   Implementation of the population evolution on a graph
+#
+#   AUTHOR: Maciej_Bak
+#   AFFILIATION: University_of_Basel
+#   AFFILIATION: Swiss_Institute_of_Bioinformatics
+#   CONTACT: wsciekly.maciek@gmail.com
+#   CREATED: 18-10-2026
+#   LICENSE: MIT
+#
+##############################################################################
+"""
+
+# imports
+import copy
+import random
+
+import matplotlib.pyplot as plt
+import numpy as np
+import scipy.sparse
+
+from moranpycess.CustomExceptions import IncorrectValueError
+from moranpycess.EntropyTracker import EntropyTracker
+from moranpycess.Individual import Individual
+from moranpycess.SimulationDriver import SimulationDriver
+from moranpycess.SumTree import SumTree
+
+
+class MoranProcessGraph(SimulationDriver, EntropyTracker):
+    """Graph-structured Moran Process with multiple types of individuals."""
+
+    def __init__(
+        self,
+        size_list,
+        label_list,
+        node_labels,
+        adjacency,
+        BirthPayoffMatrix,
+        DeathPayoffMatrix,
+        TransitionMatrix=None,
+        rng=None,
+    ):
+        """Class initializer.
+
+        Args:
+            size_list (list of int): cardinalities of subpopulations.
+            label_list (list of str): distinct labels of subpopulations.
+            node_labels (np.array): labels of the Individuals in the nodes
+                of the graph.
+            adjacency (scipy.sparse matrix): adjacency matrix of the graph.
+            BirthPayoffMatrix (np.array): payoff matrix for the birth process.
+            DeathPayoffMatrix (np.array): payoff matrix for the death process.
+            TransitionMatrix (np.array, optional): transition probabilities
+                between types. Defaults to None.
+            rng (np.random.Generator, optional): source of randomness.
+                If None the global random and np.random modules are used.
+                Defaults to None.
+
+        Note:
+            Stored entries in the row i of the adjacency matrix (in CSR
+            format) are the neighbours of the Individual i: its partners in
+            the game and the candidates to be replaced by its offspring.
+            Values of the entries are ignored and repeated entries count
+            as many times as they are repeated. Every Individual needs to
+            have at least one neighbour.
+            The population is stored as a compact integer array of types
+            with parallel float arrays of payoffs and fitnesses, indexed by
+            the nodes; neighbours are looked up in the arrays of the CSR
+            format. Individual objects are created only on access
+            to population.
+
+        Attributes:
+            population (np.array of Individual): snapshot of the entire
+                population: a read-only copy built on every access
+                (O(N)); modifications of the Individuals are not
+                reflected in the process. See: label_at, fitness_at.
+            init_size_list (list of int): cardinalities of initial
+                subpopulations.
+            curr_size_list (list of int): cardinalities of current
+                subpopulations.
+            init_label_list (list of str): distinct labels of initial
+                subpopulations.
+            init_node_labels (np.array): initial labels of the Individuals
+                in the nodes of the graph.
+            curr_node_labels (np.array): current labels of the Individuals
+                in the nodes of the graph.
+            adjacency (scipy.sparse.csr_matrix): adjacency matrix of
+                the graph.
+            BirthPayoffMatrix (np.array): payoff matrix for the birth process.
+            DeathPayoffMatrix (np.array): payoff matrix for the death process.
+            w (float): selection pressure weight for the fitness calculation.
+            Entropy (float): current entropy of the whole population.
+            TransitionMatrix (np.array, optional): transition probabilities
+                between types. Defaults to None.
+            fixation_generation (int): generation in which one type took
+                over the whole population (None if not detected).
+            fixed_label (str): label of the type which took over the whole
+                population (None if not detected).
+            rng (np.random.Generator): source of randomness
+                (None for the global random and np.random modules).
+
+        Raises:
+            AssertionError: on invalid arguments.
+            IncorrectValueError: on wrong values in the Transition Matrix.
+
+        """
+        # check if the argument lists length match
+        try:
+            assert len(size_list) == len(label_list)
+        except AssertionError as e:
+            e.args += ("Mismatch length of size and label lists",)
+            raise
+
+        # keep record of the argument lists
+        self.init_size_list = copy.deepcopy(size_list)
+        self.curr_size_list = copy.deepcopy(size_list)
+        self.init_label_list = copy.deepcopy(label_list)
+        self.init_node_labels = copy.deepcopy(node_labels)
+
+        # check if the argument matrices shape match
+        try:
+            assert len(BirthPayoffMatrix.shape) == 2
+            assert (
+                BirthPayoffMatrix.shape[0]
+                == BirthPayoffMatrix.shape[1]
+                == len(label_list)
+            )
+        except AssertionError as e:
+            e.args += ("Invalid Payoff Matrix",)
+            raise
+        try:
+            assert len(DeathPayoffMatrix.shape) == 2
+            assert (
+                DeathPayoffMatrix.shape[0]
+                == DeathPayoffMatrix.shape[1]
+                == len(label_list)
+            )
+        except AssertionError as e:
+            e.args += ("Invalid Payoff Matrix",)
+            raise
+
+        # keep record of the argument matrices
+        self.BirthPayoffMatrix = BirthPayoffMatrix.copy()
+        self.DeathPayoffMatrix = DeathPayoffMatrix.copy()
+
+        # introduce a payoff weight for the fitness calculation
+        self.w = 0.5
+
+        # check if the labels argument is correct
+        try:
+            unique, counts = np.unique(node_labels, return_counts=True)
+            labels_dict = dict(zip(unique, counts))
+            for label in unique:
+                assert label in self.init_label_list
+            for i in range(len(unique)):
+                assert (
+                    self.init_size_list[i]
+                    == labels_dict[self.init_label_list[i]]
+                )
+        except AssertionError as e:
+            e.args += ("Invalid Population Labels",)
+            raise
+
+        # check if the adjacency argument is correct
+        nnodes = np.size(node_labels)
+        try:
+            assert scipy.sparse.issparse(adjacency)
+            assert adjacency.shape == (nnodes, nnodes)
+            adjacency = scipy.sparse.csr_matrix(adjacency, copy=True)
+            adjacency.eliminate_zeros()
+            assert (np.diff(adjacency.indptr) > 0).all()
+        except AssertionError as e:
+            e.args += ("Invalid Adjacency Matrix",)
+            raise
+        self.adjacency = adjacency
+
+        # neighbours in the CSR format: out-going and in-coming edges
+        self._indptr = adjacency.indptr
+        self._indices = adjacency.indices
+        self._degree_array = np.diff(self._indptr)
+        self._IndexInNeighbours()
+
+        # encode the population as an array of type indices
+        type_dtype = np.int8 if len(label_list) <= 127 else np.int16
+        label_indices = np.array(
+            [self.init_label_list.index(label) for label in unique],
+            dtype=type_dtype,
+        )
+        self._type_array = label_indices[
+            np.unique(np.ravel(node_labels), return_inverse=True)[1]
+        ].reshape(nnodes)
+        id_dtype = np.int32 if nnodes < 2**31 else np.int64
+        self._id_array = np.arange(nnodes, dtype=id_dtype)
+        self._AvgBirthPayoffArray = np.zeros(nnodes)
+        self._AvgDeathPayoffArray = np.zeros(nnodes)
+        self._BirthFitnessArray = np.zeros(nnodes)
+        self._DeathFitnessArray = np.zeros(nnodes)
+        max_degree = self._degree_array.max()
+        if max_degree <= np.iinfo(np.uint8).max:
+            count_dtype = np.uint8
+        elif max_degree <= np.iinfo(np.uint16).max:
+            count_dtype = np.uint16
+        else:
+            count_dtype = np.uint32
+        self._NeighbourCountArray = np.zeros(
+            (nnodes, len(label_list)), dtype=count_dtype
+        )
+
+        # evaluate payoffs, fitnesses and entropy of the whole population
+        # at once and index the birth fitnesses for the roulette wheel
+        self._BirthFitnessTree = SumTree(self._BirthFitnessArray)
+        self._UpdatePopulation()
+
+        # assign the transition matrix between types
+        if TransitionMatrix is not None:
+            try:
+                # check if the argument matrix shape match
+                assert len(TransitionMatrix.shape) == 2
+                assert (
+                    TransitionMatrix.shape[0]
+                    == TransitionMatrix.shape[1]
+                    == len(label_list)
+                )
+            except AssertionError as e:
+                e.args += ("Invalid Transition Matrix",)
+                raise
+            # check if the values are correct
+            message = "Transition probabilities need to add up to 1.0."
+            for v in np.sum(TransitionMatrix, axis=1):
+                if v != 1.0:
+                    raise IncorrectValueError(
+                        parameter="Transition Matrix",
+                        message=message,
+                    )
+        self.TransitionMatrix = copy.deepcopy(TransitionMatrix)
+
+        # absorption is detected only on demand (see: simulate)
+        self.fixation_generation = None
+        self.fixed_label = None
+
+        # keep record of the source of randomness
+        self.rng = rng
+
+    @property
+    def population(self):
+        """Python getter.
+
+        Note:
+            Individuals are created from the arrays of types, payoffs and
+            fitnesses on every access, hence modifications of the returned
+            objects do not affect the process (assign a new population
+            instead). Single Individuals are read in O(1) with
+            label_at and fitness_at.
+
+        """
+        population = np.empty(self._type_array.shape, dtype=Individual)
+        for node in range(self._type_array.size):
+            ind = Individual(
+                ID=int(self._id_array[node]),
+                label=self.init_label_list[self._type_array[node]],
+            )
+            ind.AvgBirthPayoff = float(self._AvgBirthPayoffArray[node])
+            ind.AvgDeathPayoff = float(self._AvgDeathPayoffArray[node])
+            ind.BirthFitness = float(self._BirthFitnessArray[node])
+            ind.DeathFitness = float(self._DeathFitnessArray[node])
+            population[node] = ind
+        return self._Layout(population)
+
+    @population.setter
+    def population(self, population):
+        """Python setter.
+
+        Note:
+            Payoffs and fitnesses are re-evaluated based on the labels.
+
+        """
+        for node, ind in enumerate(np.ravel(population)):
+            self._type_array[node] = self.init_label_list.index(ind.label)
+            self._id_array[node] = ind.ID
+        self._UpdatePopulation()
+
+    @property
+    def init_size_list(self):
+        """Python getter."""
+        return self._init_size_list
+
+    @init_size_list.setter
+    def init_size_list(self, init_size_list):
+        """Python setter."""
+        self._init_size_list = init_size_list
+
+    @property
+    def curr_size_list(self):
+        """Python getter."""
+        return self._curr_size_list
+
+    @curr_size_list.setter
+    def curr_size_list(self, curr_size_list):
+        """Python setter."""
+        self._curr_size_list = curr_size_list
+
+    @property
+    def init_label_list(self):
+        """Python getter."""
+        return self._init_label_list
+
+    @init_label_list.setter
+    def init_label_list(self, init_label_list):
+        """Python setter."""
+        self._init_label_list = init_label_list
+
+    @property
+    def init_node_labels(self):
+        """Python getter."""
+        return self._init_node_labels
+
+    @init_node_labels.setter
+    def init_node_labels(self, init_node_labels):
+        """Python setter."""
+        self._init_node_labels = init_node_labels
+
+    @property
+    def curr_node_labels(self):
+        """Python getter.
+
+        Note:
+            Labels are decoded from the type indices on every access,
+            hence the simulation does not need to keep them in sync.
+
+        """
+        return np.asarray(self.init_label_list)[self._type_array]
+
+    @curr_node_labels.setter
+    def curr_node_labels(self, curr_node_labels):
+        """Python setter.
+
+        Note:
+            Payoffs and fitnesses are re-evaluated based on the labels.
+
+        """
+        self._type_array[:] = [
+            self.init_label_list.index(label)
+            for label in np.ravel(curr_node_labels)
+        ]
+        self._UpdatePopulation()
+
+    @property
+    def adjacency(self):
+        """Python getter."""
+        return self._adjacency
+
+    @adjacency.setter
+    def adjacency(self, adjacency):
+        """Python setter."""
+        self._adjacency = adjacency
+
+    @property
+    def BirthPayoffMatrix(self):
+        """Python getter."""
+        return self._BirthPayoffMatrix
+
+    @BirthPayoffMatrix.setter
+    def BirthPayoffMatrix(self, BirthPayoffMatrix):
+        """Python setter."""
+        self._BirthPayoffMatrix = BirthPayoffMatrix
+
+    @property
+    def DeathPayoffMatrix(self):
+        """Python getter."""
+        return self._DeathPayoffMatrix
+
+    @DeathPayoffMatrix.setter
+    def DeathPayoffMatrix(self, DeathPayoffMatrix):
+        """Python setter."""
+        self._DeathPayoffMatrix = DeathPayoffMatrix
+
+    @property
+    def w(self):
+        """Python getter."""
+        return self._w
+
+    @w.setter
+    def w(self, w):
+        """Python setter."""
+        self._w = w
+
+    @property
+    def Entropy(self):
+        """Python getter."""
+        return self._Entropy
+
+    @Entropy.setter
+    def Entropy(self, Entropy):
+        """Python setter."""
+        self._Entropy = Entropy
+
+    @property
+    def TransitionMatrix(self):
+        """Python getter."""
+        return self._TransitionMatrix
+
+    @TransitionMatrix.setter
+    def TransitionMatrix(self, TransitionMatrix):
+        """Python setter."""
+        self._TransitionMatrix = TransitionMatrix
+
+    @property
+    def fixation_generation(self):
+        """Python getter."""
+        return self._fixation_generation
+
+    @fixation_generation.setter
+    def fixation_generation(self, fixation_generation):
+        """Python setter."""
+        self._fixation_generation = fixation_generation
+
+    @property
+    def fixed_label(self):
+        """Python getter."""
+        return self._fixed_label
+
+    @fixed_label.setter
+    def fixed_label(self, fixed_label):
+        """Python setter."""
+        self._fixed_label = fixed_label
+
+    @property
+    def rng(self):
+        """Python getter."""
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng):
+        """Python setter."""
+        self._rng = rng
+
+    def _RandomUniform(self, high):
+        """Draw a number uniformly from the interval [0, high].
+
+        Args:
+            high (float): upper bound of the interval.
+
+        Returns:
+            float: random number.
+
+        """
+        if self.rng is None:
+            return random.uniform(0, high)
+        return self.rng.uniform(0, high)
+
+    def _NumpyRandom(self):
+        """Select the source of the NumPy random draws.
+
+        Returns:
+            np.random.Generator: explicit generator of the process
+                or the global np.random module.
+
+        """
+        if self.rng is None:
+            return np.random
+        return self.rng
+
+    def _Layout(self, values):
+        """Arrange the values of all the nodes as the population.
+
+        Args:
+            values (np.array): values indexed by the nodes.
+
+        Returns:
+            np.array: values in the layout of the population
+                (one value per node for a graph).
+
+        """
+        return values
+
+    def _Node(self, site):
+        """Find the node of a given site of the population.
+
+        Args:
+            site (int): node of the Individual.
+
+        Returns:
+            int: node of the Individual.
+
+        """
+        return int(site)
+
+    def label_at(self, site):
+        """Read the label of one Individual.
+
+        Args:
+            site (int): node of the Individual
+                (coordinates in the grid for the lattices).
+
+        Returns:
+            str: label of the Individual.
+
+        """
+        return self.init_label_list[self._type_array[self._Node(site)]]
+
+    def fitness_at(self, site):
+        """Read the fitnesses of one Individual.
+
+        Args:
+            site (int): node of the Individual
+                (coordinates in the grid for the lattices).
+
+        Returns:
+            tuple: Birth Fitness and Death Fitness of the Individual.
+
+        """
+        node = self._Node(site)
+        return (
+            float(self._BirthFitnessArray[node]),
+            float(self._DeathFitnessArray[node]),
+        )
+
+    def _Neighbours(self, node):
+        """Find the neighbours of a given Individual.
+
+        Args:
+            node (int): node of the Individual.
+
+        Returns:
+            np.array: nodes of the neighbours.
+
+        """
+        start = self._indptr[node]
+        stop = self._indptr[node + 1]
+        return self._indices[start:stop]
+
+    def _EdgeSources(self):
+        """Find the source node of every stored edge of the graph.
+
+        Note:
+            Computed on demand, so that no array as long as the list
+            of edges is kept besides the adjacency itself.
+
+        Returns:
+            np.array: nodes of the Individuals, one per stored edge.
+
+        """
+        nodes = np.arange(self._degree_array.size, dtype=self._indices.dtype)
+        return np.repeat(nodes, self._degree_array)
+
+    def _IndexInNeighbours(self):
+        """Index the in-coming edges of the graph in the CSR format.
+
+        Note:
+            The transposed structure of the adjacency matrix, with the
+            Individuals which have a given Individual as a neighbour
+            sorted by their nodes (repeated edges are kept).
+
+        """
+        nnodes = self._degree_array.size
+        structure = scipy.sparse.csr_matrix(
+            (
+                np.ones(self._indices.size, dtype=bool),
+                self._indices,
+                self._indptr,
+            ),
+            shape=(nnodes, nnodes),
+        )
+        transposed = structure.transpose().tocsr()
+        self._in_indptr = transposed.indptr
+        self._in_indices = transposed.indices
+
+    def _InNeighbours(self, node):
+        """Find the Individuals which have a given Individual as neighbour.
+
+        Note:
+            Same as the neighbours for an undirected graph.
+
+        Args:
+            node (int): node of the Individual.
+
+        Returns:
+            np.array: nodes of the Individuals.
+
+        """
+        start = self._in_indptr[node]
+        stop = self._in_indptr[node + 1]
+        return self._in_indices[start:stop]
+
+    def _UpdatePopulation(self):
+        """Re-evaluate the whole population from the types of the nodes.
+
+        Note:
+            Neighbours' types are counted for all the edges of the graph
+            at once, hence all the nodes are updated together.
+            Cardinalities of subpopulations and the entropy are
+            recounted as well.
+
+        """
+        self.curr_size_list = np.bincount(
+            self._type_array, minlength=len(self.init_label_list)
+        ).tolist()
+        self._UpdateEntropy()
+        self._NeighbourCountArray[...] = self._CountNeighbourTypes()
+        nodes = np.arange(self._type_array.size)
+        self._UpdateBirthPayoff(nodes)
+        self._UpdateDeathPayoff(nodes)
+        self._UpdateBirthFitness(nodes)
+        self._UpdateDeathFitness(nodes)
+        self._BirthFitnessTree.rebuild(self._BirthFitnessArray)
+
+    def _CountNeighbourTypes(self):
+        """Count the neighbours of every type for all the Individuals.
+
+        Returns:
+            np.array: counts of the neighbours' types, one row per node.
+
+        """
+        ntypes = len(self.init_label_list)
+        nnodes = self._type_array.size
+        edges = np.ravel_multi_index(
+            (self._EdgeSources(), self._type_array[self._indices]),
+            (nnodes, ntypes),
+        )
+        return np.bincount(edges, minlength=nnodes * ntypes).reshape(
+            nnodes, ntypes
+        )
+
+    def _UpdateNeighbourhood(self, node, birth_index, death_index):
+        """Re-evaluate the neighbourhood of a replaced Individual.
+
+        Note:
+            Only the replaced Individual and the ones which have it as
+            a neighbour are affected by a change of its type.
+
+        Args:
+            node (int): node of the replaced Individual.
+            birth_index (int): index of the new type.
+            death_index (int): index of the previous type.
+
+        """
+        affected = self._InNeighbours(node)
+        # update the types counts in the neighbourhood
+        # (the same Individual may be affected more than once)
+        np.subtract.at(self._NeighbourCountArray[:, death_index], affected, 1)
+        np.add.at(self._NeighbourCountArray[:, birth_index], affected, 1)
+        # re-evaluate payoffs & fitnesses of affected ind in the pop
+        nodes = np.unique(np.append(affected, node))
+        self._UpdateBirthPayoff(nodes)
+        self._UpdateDeathPayoff(nodes)
+        self._UpdateBirthFitness(nodes)
+        self._UpdateDeathFitness(nodes)
+        self._BirthFitnessTree.update(nodes, self._BirthFitnessArray[nodes])
+
+    def _UpdateActiveWeights(self):
+        """Evaluate the active weights of the whole population.
+
+        Note:
+            Active weight of an Individual is its Birth Fitness times
+            the probability that the offspring replaces a neighbour of
+            a different type. The sum over the population divided by
+            the sum of the Birth Fitnesses is the probability that
+            a Birth-Death cycle changes the population.
+
+        """
+        edge_scores = self._DeathFitnessArray[self._indices]
+        different = (
+            self._type_array[self._indices]
+            != self._type_array[self._EdgeSources()]
+        )
+        starts = self._indptr[:-1]
+        death_sum = np.add.reduceat(edge_scores, starts)
+        other_sum = np.add.reduceat(edge_scores * different, starts)
+        self._ActiveWeightArray = np.divide(
+            self._BirthFitnessArray * other_sum,
+            death_sum,
+            out=np.zeros(self._type_array.shape),
+            where=death_sum > 0,
+        )
+        self._ActiveWeightTree = SumTree(self._ActiveWeightArray)
+
+    def _UpdateActiveWeight(self, node):
+        """Calculate the active weight for a given Individual.
+
+        Args:
+            node (int): node of the Individual.
+
+        """
+        neighbours = self._Neighbours(node)
+        scores = self._DeathFitnessArray[neighbours]
+        death_sum = scores.sum()
+        other_sum = scores[
+            self._type_array[neighbours] != self._type_array[node]
+        ].sum()
+        if death_sum > 0:
+            self._ActiveWeightArray[node] = (
+                self._BirthFitnessArray[node] * other_sum / death_sum
+            )
+        else:
+            self._ActiveWeightArray[node] = 0.0
+
+    def _UpdateNeighbourCounts(self, node):
+        """Count the types of the neighbours of a given Individual.
+
+        Args:
+            node (int): node of the Individual.
+
+        """
+        self._NeighbourCountArray[node] = np.bincount(
+            self._type_array[self._Neighbours(node)],
+            minlength=len(self.init_label_list),
+        )
+
+    def _UpdateBirthPayoff(self, node):
+        """Calculate Birth Payoff for given Individuals.
+
+        Note:
+            Payoff is the product of the row of the payoff matrix with
+            the counts of the neighbours' types, averaged over
+            the neighbours.
+
+        Args:
+            node (int or np.array): node(s) of the Individual(s).
+
+        """
+        payoff = np.sum(
+            self.BirthPayoffMatrix[self._type_array[node]]
+            * self._NeighbourCountArray[node],
+            axis=-1,
+        )
+        self._AvgBirthPayoffArray[node] = payoff / self._degree_array[node]
+
+    def _UpdateDeathPayoff(self, node):
+        """Calculate Death Payoff for given Individuals.
+
+        Note:
+            Payoff is the product of the row of the payoff matrix with
+            the counts of the neighbours' types, averaged over
+            the neighbours.
+
+        Args:
+            node (int or np.array): node(s) of the Individual(s).
+
+        """
+        payoff = np.sum(
+            self.DeathPayoffMatrix[self._type_array[node]]
+            * self._NeighbourCountArray[node],
+            axis=-1,
+        )
+        self._AvgDeathPayoffArray[node] = payoff / self._degree_array[node]
+
+    def _UpdateBirthFitness(self, node):
+        """Calculate Birth Fitness for given Individuals.
+
+        Args:
+            node (int or np.array): node(s) of the Individual(s).
+
+        """
+        self._BirthFitnessArray[node] = (
+            1 - self.w + self.w * self._AvgBirthPayoffArray[node]
+        )
+
+    def _UpdateDeathFitness(self, node):
+        """Calculate Death Fitness for given Individuals.
+
+        Args:
+            node (int or np.array): node(s) of the Individual(s).
+
+        """
+        self._DeathFitnessArray[node] = (
+            1 - self.w + self.w * self._AvgDeathPayoffArray[node]
+        )
+
+    def _roulette_wheel_selection_Birth(self):
+        """Select one individual according to the Birth Fitness.
+
+        Note:
+            Birth Fitnesses of all Individuals are kept in a sum tree,
+            hence the selection costs O(log N) instead of O(N).
+
+        Returns:
+            int: node of the selected Individual.
+
+        """
+        pick = self._RandomUniform(self._BirthFitnessTree.total)
+        return self._BirthFitnessTree.search(pick)
+
+    def __roulette_wheel_selection_Neighbour(self, neighbours):
+        """Select one of the neighbours according to the Death Fitness.
+
+        Args:
+            neighbours (np.array): nodes of the candidates.
+
+        Returns:
+            int: node of the selected Individual.
+
+        """
+        cumulative_scores = np.cumsum(self._DeathFitnessArray[neighbours])
+        pick = self._RandomUniform(cumulative_scores[-1])
+        position = np.searchsorted(cumulative_scores, pick, side="right")
+        # the pick might fall on the upper bound of the wheel
+        return int(neighbours[min(position, len(neighbours) - 1)])
+
+    def _roulette_wheel_selection_Death(self, node):
+        """Select one individual according to the Death Fitness.
+
+        Note:
+            Select from neighbours of the Individual in argument.
+
+        Args:
+            node (int): node of an Individual.
+
+        Returns:
+            int: node of the selected Individual.
+
+        """
+        return self.__roulette_wheel_selection_Neighbour(
+            self._Neighbours(node)
+        )
+
+    def _roulette_wheel_selection_ActiveDeath(self, node):
+        """Select one individual of a different type by the Death Fitness.
+
+        Note:
+            Select from neighbours of the Individual in argument
+            which are of a different type than the Individual.
+
+        Args:
+            node (int): node of an Individual.
+
+        Returns:
+            int: node of the selected Individual.
+
+        """
+        neighbours = self._Neighbours(node)
+        return self.__roulette_wheel_selection_Neighbour(
+            neighbours[self._type_array[neighbours] != self._type_array[node]]
+        )
+
+    def _PrepareRejectionFree(self):
+        """Prepare the process for the rejection-free simulation.
+
+        Note:
+            Active weights are not kept up to date by the Birth-Death
+            cycles, hence they are evaluated for the whole graph.
+
+        """
+        self._UpdateActiveWeights()
+
+    def _LogColumns(self):
+        """Names of the columns of the simulation logs.
+
+        Returns:
+            tuple: names of the integer and of the float columns.
+
+        """
+        size_columns = [label + "__size" for label in self.init_label_list]
+        value_columns = ["Entropy"]
+        return (size_columns, value_columns)
+
+    def _LogValues(self):
+        """Collect the current entropy for the logs.
+
+        Returns:
+            list of float: values in the order of the float log columns.
+
+        """
+        return [self.Entropy]
+
+    def _SimulateGeneration(self):
+        """Perform one Birth-Death cycle (followed by type transitions).
+
+        Returns:
+            int: index of the type which multiplied.
+
+        """
+        # select one individual to multiply
+        node = self._roulette_wheel_selection_Birth()
+        birth_index = int(self._type_array[node])
+        birth_ID = self._id_array[node]
+        # select one individual to die
+        node = self._roulette_wheel_selection_Death(node)
+        death_index = int(self._type_array[node])
+        # copy the selected individual in place of the one which dies
+        self._type_array[node] = birth_index
+        self._id_array[node] = birth_ID
+        # update the list with population info
+        self.curr_size_list[birth_index] += 1
+        self.curr_size_list[death_index] -= 1
+
+        # perform transitions (if TransitionMatrix was specified)
+        if self.TransitionMatrix is not None:
+            # draw the new types of all the Individuals at once
+            cumulative = np.cumsum(self.TransitionMatrix, axis=1, dtype=float)
+            cumulative /= cumulative[:, -1:]
+            picks = self._NumpyRandom().random(self._type_array.shape)
+            self._type_array[:] = np.sum(
+                picks[:, np.newaxis] >= cumulative[self._type_array], axis=-1
+            )
+
+        # after each birth-death cycle:
+
+        # update scores, cardinalities and entropy of all individuals
+        # (if TransitionMatrix present)
+        if self.TransitionMatrix is not None:
+            self._UpdatePopulation()
+        # in other case:
+        # re-evaluate the payoffs and fitnesses of only
+        # the affected neigbours Individuals in the population
+        # (only a change of the type affects the neighbourhood)
+        elif birth_index != death_index:
+            self._UpdateNeighbourhood(node, birth_index, death_index)
+            self._UpdateEntropyChange(birth_index, death_index)
+
+        return birth_index
+
+    def _NextEventGenerations(self):
+        """Draw the number of generations until the population changes.
+
+        Note:
+            Every Birth-Death cycle changes the population with the same
+            probability until it does, hence the number of cycles follows
+            a geometric distribution.
+
+        Returns:
+            int: number of generations up to (and including) the next
+                change of the population (None if no change is possible).
+
+        """
+        probability = (
+            self._ActiveWeightTree.total / self._BirthFitnessTree.total
+        )
+        if probability <= 0.0:
+            return None
+        return int(self._NumpyRandom().geometric(min(probability, 1.0)))
+
+    def _SimulateEvent(self):
+        """Perform one Birth-Death cycle which changes the population.
+
+        Note:
+            The individual to multiply is selected according to the active
+            weights and the individual to die among its neighbours of
+            a different type, which is the Birth-Death cycle conditioned
+            on a change of the population.
+
+        Returns:
+            int: index of the type which multiplied.
+
+        """
+        # select one individual to multiply
+        pick = self._RandomUniform(self._ActiveWeightTree.total)
+        node = self._ActiveWeightTree.search(pick)
+        birth_index = int(self._type_array[node])
+        birth_ID = self._id_array[node]
+        # select one individual of a different type to die
+        node = self._roulette_wheel_selection_ActiveDeath(node)
+        death_index = int(self._type_array[node])
+        # copy the selected individual in place of the one which dies
+        self._type_array[node] = birth_index
+        self._id_array[node] = birth_ID
+        # update the list with population info
+        self.curr_size_list[birth_index] += 1
+        self.curr_size_list[death_index] -= 1
+        self._UpdateNeighbourhood(node, birth_index, death_index)
+
+        # re-evaluate the active weights of the Individuals which have
+        # the replaced one or one of the re-evaluated ones as neighbour
+        first = np.append(self._InNeighbours(node), node)
+        nodes = np.unique(
+            np.concatenate(
+                [first] + [self._InNeighbours(other) for other in first]
+            )
+        )
+        for other in nodes:
+            self._UpdateActiveWeight(other)
+        self._ActiveWeightTree.update(nodes, self._ActiveWeightArray[nodes])
+
+        # re-evaluate the population Entropy
+        self._UpdateEntropyChange(birth_index, death_index)
+
+        return birth_index
+
+    def PlotSize(self, df, path):
+        """Plot the sub-populations' sizes after a simulation.
+
+        Args:
+            df (pd.DataFrame): table with simulation logs.
+            path (str): path for the plot.
+
+        """
+        plt.figure(figsize=(14, 6))
+        ax = plt.gca()
+        ax.tick_params(width=1)
+        for axis in ["top", "bottom", "left", "right"]:
+            ax.spines[axis].set_linewidth(1)
+        cmap = plt.get_cmap("coolwarm")
+        columns = [label + "__size" for label in self.init_label_list]
+        df_copy = df[columns].copy()
+        df_copy.columns = self.init_label_list
+        df_copy.plot(linewidth=1.5, ax=ax, cmap=cmap)
+        population_size = self._type_array.size
+        ax.set_ylim([0, population_size])
+        plt.xlabel("Generation", size=14)
+        plt.ylabel("# Individuals", size=14)
+        ax.tick_params(axis="both", which="major", labelsize=12)
+        ax.legend(loc=4, fontsize=20)
+        plt.savefig(fname=path, dpi=300)
+
+    def PlotEntropy(self, df, path):
+        """Plot the whole populations entropy after a simulation.
+
+        Args:
+            df (pd.DataFrame): table with simulation logs.
+            path (str): path for the plot.
+
+        """
+        plt.figure(figsize=(14, 6))
+        ax = plt.gca()
+        ax.tick_params(width=1)
+        for axis in ["top", "bottom", "left", "right"]:
+            ax.spines[axis].set_linewidth(1)
+        df["Entropy"].plot(
+            color="black", linewidth=1.5, ax=ax, label="Entropy"
+        )
+        plt.xlabel("Generation", size=14)
+        plt.ylabel("", size=14)
+        ax.tick_params(axis="both", which="major", labelsize=12)
+        ax.legend(loc=4, fontsize=20)
+        plt.savefig(fname=path, dpi=300)
@@ -0,0 +1,494 @@
+""".
+
+##############################################################################
+#
+#   Implementation of the mean-field approximation of the Moran Process
+#
+#   AUTHOR: Maciej_Bak
+#   AFFILIATION: University_of_Basel
+#   AFFILIATION: Swiss_Institute_of_Bioinformatics
+#   CONTACT: wsciekly.maciek@gmail.com
+#   CREATED: 18-10-2026
+#   LICENSE: MIT
+#
+##############################################################################
+"""
+
+# imports
+import copy
+import math
+
+import numpy as np
+import pandas as pd
+import scipy.integrate
+import scipy.special
+
+from moranpycess.CustomExceptions import IncorrectValueError
+
+
+class MoranProcessMeanField:
+    """Mean-field dynamics of the General Moran Process."""
+
+    def __init__(
+        self,
+        size_list,
+        label_list,
+        BirthPayoffMatrix,
+        DeathPayoffMatrix,
+        TransitionMatrix=None,
+        rng=None,
+    ):
+        """Class initializer.
+
+        Note:
+            In a single Birth-Death cycle the expected change of
+            the cardinality of a type is the difference between
+            the probabilities that it is selected to multiply and to die.
+            For large populations the cardinalities follow these expected
+            changes closely, hence they are integrated as an ordinary
+            differential equation (time measured in Birth-Death cycles)
+            instead of being simulated. Optionally the fluctuations of
+            a finite population are added in the diffusion approximation.
+
+        Args:
+            size_list (list of int): cardinalities of subpopulations.
+            label_list (list of str): distinct labels of subpopulations.
+            BirthPayoffMatrix (np.array): payoff matrix for the birth process.
+            DeathPayoffMatrix (np.array): payoff matrix for the death process.
+            TransitionMatrix (np.array, optional): transition probabilities
+                between types. Defaults to None.
+            rng (np.random.Generator, optional): source of randomness
+                of the fluctuations. If None the global np.random module
+                is used. Defaults to None.
+
+        Attributes:
+            init_size_list (list of int): cardinalities of initial
+                subpopulations.
+            init_label_list (list of str): distinct labels of initial
+                subpopulations.
+            BirthPayoffMatrix (np.array): payoff matrix for the birth process.
+            DeathPayoffMatrix (np.array): payoff matrix for the death process.
+            TransitionMatrix (np.array, optional): transition probabilities
+                between types. Defaults to None.
+            w (float): selection pressure weight for the fitness calculation.
+            rng (np.random.Generator): source of randomness
+                (None for the global np.random module).
+
+        Raises:
+            AssertionError: on invalid arguments.
+            IncorrectValueError: on wrong values in the Transition Matrix.
+
+        """
+        # check if the argument lists length match
+        try:
+            assert len(size_list) == len(label_list)
+        except AssertionError as e:
+            e.args += ("Mismatch length of size and label lists",)
+            raise
+
+        # check if the argument matrices shape match
+        try:
+            assert len(BirthPayoffMatrix.shape) == 2
+            assert (
+                BirthPayoffMatrix.shape[0]
+                == BirthPayoffMatrix.shape[1]
+                == len(label_list)
+            )
+        except AssertionError as e:
+            e.args += ("Invalid Payoff Matrix",)
+            raise
+        try:
+            assert len(DeathPayoffMatrix.shape) == 2
+            assert (
+                DeathPayoffMatrix.shape[0]
+                == DeathPayoffMatrix.shape[1]
+                == len(label_list)
+            )
+        except AssertionError as e:
+            e.args += ("Invalid Payoff Matrix",)
+            raise
+
+        # check the transition matrix between types
+        if TransitionMatrix is not None:
+            try:
+                # check if the argument matrix shape match
+                assert len(TransitionMatrix.shape) == 2
+                assert (
+                    TransitionMatrix.shape[0]
+                    == TransitionMatrix.shape[1]
+                    == len(label_list)
+                )
+            except AssertionError as e:
+                e.args += ("Invalid Transition Matrix",)
+                raise
+            # check if the values are correct
+            message = "Transition probabilities need to add up to 1.0."
+            for v in np.sum(TransitionMatrix, axis=1):
+                if v != 1.0:
+                    raise IncorrectValueError(
+                        parameter="Transition Matrix",
+                        message=message,
+                    )
+
+        # keep record of the arguments
+        self.init_size_list = copy.deepcopy(size_list)
+        self.init_label_list = copy.deepcopy(label_list)
+        self.BirthPayoffMatrix = BirthPayoffMatrix.copy()
+        self.DeathPayoffMatrix = DeathPayoffMatrix.copy()
+        self.TransitionMatrix = copy.deepcopy(TransitionMatrix)
+        self.rng = rng
+
+        # introduce a payoff weight for the fitness calculation
+        self.w = 0.5
+
+    @property
+    def init_size_list(self):
+        """Python getter."""
+        return self._init_size_list
+
+    @init_size_list.setter
+    def init_size_list(self, init_size_list):
+        """Python setter."""
+        self._init_size_list = init_size_list
+
+    @property
+    def init_label_list(self):
+        """Python getter."""
+        return self._init_label_list
+
+    @init_label_list.setter
+    def init_label_list(self, init_label_list):
+        """Python setter."""
+        self._init_label_list = init_label_list
+
+    @property
+    def BirthPayoffMatrix(self):
+        """Python getter."""
+        return self._BirthPayoffMatrix
+
+    @BirthPayoffMatrix.setter
+    def BirthPayoffMatrix(self, BirthPayoffMatrix):
+        """Python setter."""
+        self._BirthPayoffMatrix = BirthPayoffMatrix
+
+    @property
+    def DeathPayoffMatrix(self):
+        """Python getter."""
+        return self._DeathPayoffMatrix
+
+    @DeathPayoffMatrix.setter
+    def DeathPayoffMatrix(self, DeathPayoffMatrix):
+        """Python setter."""
+        self._DeathPayoffMatrix = DeathPayoffMatrix
+
+    @property
+    def TransitionMatrix(self):
+        """Python getter."""
+        return self._TransitionMatrix
+
+    @TransitionMatrix.setter
+    def TransitionMatrix(self, TransitionMatrix):
+        """Python setter."""
+        self._TransitionMatrix = TransitionMatrix
+
+    @property
+    def w(self):
+        """Python getter."""
+        return self._w
+
+    @w.setter
+    def w(self, w):
+        """Python setter."""
+        self._w = w
+
+    @property
+    def rng(self):
+        """Python getter."""
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng):
+        """Python setter."""
+        self._rng = rng
+
+    def _NumpyRandom(self):
+        """Source of the NumPy random draws.
+
+        Returns:
+            np.random.Generator: the generator of the process
+                (the global np.random module if it was not specified).
+
+        """
+        if self.rng is None:
+            return np.random
+        return self.rng
+
+    def _Fitnesses(self, sizes, PayoffMatrix):
+        """Calculate the avg payoffs and the fitnesses of distinct types.
+
+        Args:
+            sizes (np.array): cardinalities of subpopulations
+                (one row per state).
+            PayoffMatrix (np.array): payoff matrix of the process.
+
+        Returns:
+            tuple: avg payoffs and fitnesses of distinct types.
+
+        """
+        population_size = sum(self.init_size_list)
+        payoffs = (sizes @ PayoffMatrix.T - np.diag(PayoffMatrix)) / (
+            population_size - 1
+        )
+        return (payoffs, 1 - self.w + self.w * payoffs)
+
+    def _SelectionProbabilities(self, sizes):
+        """Calculate the probabilities of the selection of distinct types.
+
+        Args:
+            sizes (np.array): cardinalities of subpopulations.
+
+        Returns:
+            tuple: probabilities that a type is selected to multiply
+                and to die in a single Birth-Death cycle.
+
+        """
+        probabilities = []
+        for PayoffMatrix in [self.BirthPayoffMatrix, self.DeathPayoffMatrix]:
+            (payoffs, fitnesses) = self._Fitnesses(sizes, PayoffMatrix)
+            weights = sizes * fitnesses
+            probabilities.append(weights / weights.sum())
+        return tuple(probabilities)
+
+    def _Drift(self, sizes):
+        """Calculate the expected change of the cardinalities in one cycle.
+
+        Args:
+            sizes (np.array): cardinalities of subpopulations.
+
+        Returns:
+            np.array: expected changes of the cardinalities.
+
+        """
+        (birth, death) = self._SelectionProbabilities(sizes)
+        return birth - death
+
+    def _CategoricalNoise(self, probabilities, ntrials):
+        """Draw the fluctuations of the counts of a multinomial draw.
+
+        Note:
+            The covariance of the counts is n*(diag(p) - p p^T) and it is
+            reproduced by a Gaussian vector sqrt(n*p)*z corrected by
+            its sum times p, which keeps the total unchanged.
+
+        Args:
+            probabilities (np.array): probabilities of the categories.
+            ntrials (float): number of the trials.
+
+        Returns:
+            np.array: deviations of the counts from their expectations.
+
+        """
+        z = self._NumpyRandom().standard_normal(len(probabilities))
+        deviations = np.sqrt(ntrials * probabilities) * z
+        return deviations - probabilities * deviations.sum()
+
+    def _Project(self, sizes):
+        """Keep the cardinalities non-negative after a noisy step.
+
+        Args:
+            sizes (np.array): cardinalities of subpopulations.
+
+        Returns:
+            np.array: cardinalities rescaled to the population size.
+
+        """
+        sizes = np.clip(sizes, 0.0, None)
+        return sizes * (sum(self.init_size_list) / sizes.sum())
+
+    def _DiffusionStep(self, sizes, ncycles):
+        """Advance the cardinalities over a number of Birth-Death cycles.
+
+        Note:
+            Euler-Maruyama step of the diffusion approximation: in every
+            cycle one type multiplies and one (independently selected) type
+            dies, hence the fluctuations of the cardinalities are the ones
+            of two categorical draws.
+
+        Args:
+            sizes (np.array): cardinalities of subpopulations.
+            ncycles (float): length of the step.
+
+        Returns:
+            np.array: cardinalities after the step.
+
+        """
+        (birth, death) = self._SelectionProbabilities(sizes)
+        sizes = (
+            sizes
+            + ncycles * (birth - death)
+            + self._CategoricalNoise(birth, ncycles)
+            - self._CategoricalNoise(death, ncycles)
+        )
+        return self._Project(sizes)
+
+    def _TransitionStep(self, sizes, noise):
+        """Perform type transitions on the cardinalities.
+
+        Args:
+            sizes (np.array): cardinalities of subpopulations.
+            noise (bool): add the fluctuations of the transitions.
+
+        Returns:
+            np.array: cardinalities after the transitions.
+
+        """
+        new_sizes = sizes @ self.TransitionMatrix
+        if noise:
+            for row_index, type_size in enumerate(sizes):
+                new_sizes += self._CategoricalNoise(
+                    self.TransitionMatrix[row_index,], type_size
+                )
+            new_sizes = self._Project(new_sizes)
+        return new_sizes
+
+    def _LogColumns(self):
+        """Names of the columns of the simulation logs.
+
+        Returns:
+            tuple: names of the size and of the value columns.
+
+        """
+        size_columns = [label + "__size" for label in self.init_label_list]
+        value_columns = (
+            [label + "__AvgBirthPayoff" for label in self.init_label_list]
+            + [label + "__AvgDeathPayoff" for label in self.init_label_list]
+            + [label + "__BirthFitness" for label in self.init_label_list]
+            + [label + "__DeathFitness" for label in self.init_label_list]
+            + ["Entropy"]
+        )
+        return (size_columns, value_columns)
+
+    def _LogTable(self, generations, sizes):
+        """Build the simulation logs from the logged cardinalities.
+
+        Args:
+            generations (np.array): logged generations.
+            sizes (np.array): cardinalities of subpopulations
+                (one row per logged generation).
+
+        Returns:
+            pd.DataFrame: table with simulation logs.
+
+        """
+        (birth_payoffs, birth_fitnesses) = self._Fitnesses(
+            sizes, self.BirthPayoffMatrix
+        )
+        (death_payoffs, death_fitnesses) = self._Fitnesses(
+            sizes, self.DeathPayoffMatrix
+        )
+        fractions = sizes / sum(self.init_size_list)
+        entropy = -scipy.special.xlogy(fractions, fractions).sum(
+            axis=1
+        ) / np.log(2)
+        values = np.column_stack(
+            (
+                birth_payoffs,
+                death_payoffs,
+                birth_fitnesses,
+                death_fitnesses,
+                entropy,
+            )
+        )
+        (size_columns, value_columns) = self._LogColumns()
+        columns = {}
+        for index, name in enumerate(size_columns):
+            columns[name] = sizes[:, index]
+        for index, name in enumerate(value_columns):
+            columns[name] = values[:, index]
+        index = pd.Index(generations, name="generation")
+        return pd.DataFrame(columns, index=index)
+
+    def simulate(self, generations, record_every=1, noise=False, step=None):
+        """Integrate the mean-field dynamics of the population.
+
+        Note:
+            Without type transitions the deterministic dynamics are
+            integrated with an adaptive ODE solver, hence the cost does not
+            depend on the population size nor on the number of generations.
+            With type transitions every individual may switch its type
+            in every cycle, hence the expected cardinalities are advanced
+            one Birth-Death cycle at a time.
+
+        Args:
+            generations (int): number of time steps.
+            record_every (int, optional): interval (in generations) between
+                the logged states of the population; the initial and
+                the final states are always logged. Defaults to 1.
+            noise (bool, optional): add the fluctuations of a finite
+                population in the diffusion approximation. Defaults to False.
+            step (int, optional): maximal length (in generations) of
+                the integration steps with noise. If None one hundredth of
+                the population size is used. Defaults to None.
+
+        Raises:
+            IncorrectValueError: on a non-positive logging interval or
+                integration step.
+
+        Returns:
+            pd.DataFrame: table with simulation logs with the same columns
+                as the ones of MoranProcess.simulate; the cardinalities are
+                not rounded to integers.
+
+        """
+        if record_every < 1:
+            raise IncorrectValueError(
+                parameter="record_every",
+                message="Logging interval needs to be a positive integer.",
+            )
+        if step is not None and step < 1:
+            raise IncorrectValueError(
+                parameter="step",
+                message="Integration step needs to be a positive integer.",
+            )
+        population_size = sum(self.init_size_list)
+        if step is None:
+            step = max(1, population_size // 100)
+        logged = np.arange(0, generations + 1, record_every)
+        if logged[-1] != generations:
+            logged = np.append(logged, generations)
+        sizes = np.asarray(self.init_size_list, dtype=float)
+        log_sizes = np.zeros((len(logged), len(sizes)))
+        log_sizes[0] = sizes
+
+        if self.TransitionMatrix is not None:
+            # advance the expected cardinalities cycle by cycle
+            row = 1
+            for g in range(1, generations + 1):
+                if noise:
+                    sizes = self._DiffusionStep(sizes, 1)
+                else:
+                    sizes = sizes + self._Drift(sizes)
+                sizes = self._TransitionStep(sizes, noise)
+                if g == logged[row]:
+                    log_sizes[row] = sizes
+                    row += 1
+        elif noise:
+            # integrate the diffusion between the logged generations
+            for row in range(1, len(logged)):
+                interval = logged[row] - logged[row - 1]
+                nsteps = math.ceil(interval / step)
+                for _ in range(nsteps):
+                    sizes = self._DiffusionStep(sizes, interval / nsteps)
+                log_sizes[row] = sizes
+        elif generations > 0:
+            solution = scipy.integrate.solve_ivp(
+                lambda t, y: self._Drift(y),
+                (0, generations),
+                sizes,
+                t_eval=logged,
+                rtol=1e-8,
+                atol=1e-8,
+            )
+            log_sizes = solution.y.T
+
+        return self._LogTable(logged, log_sizes)
@@ -0,0 +1,450 @@
+""".
+
+##############################################################################
+#
+#   Implementation of the population evolution on an N-dimensional lattice
+#
+#   AUTHOR: Maciej_Bak
+#   AFFILIATION: University_of_Basel
+#   AFFILIATION: Swiss_Institute_of_Bioinformatics
+#   CONTACT: wsciekly.maciek@gmail.com
+#   CREATED: 18-10-2026
+#   LICENSE: MIT
+#
+##############################################################################
+"""
+
+# imports
+import copy
+import itertools
+
+import numpy as np
+import scipy.sparse
+
+from moranpycess.CustomExceptions import IncorrectValueError
+from moranpycess.MoranProcessGraph import MoranProcessGraph
+
+
+class MoranProcessND(MoranProcessGraph):
+    """N-dimensional Moran Process with multiple types of individuals."""
+
+    def __init__(
+        self,
+        size_list,
+        label_list,
+        grid,
+        BirthPayoffMatrix,
+        DeathPayoffMatrix,
+        TransitionMatrix=None,
+        rng=None,
+        neighbourhood="moore",
+        radius=1,
+        boundary="periodic",
+    ):
+        """Class initializer.
+
+        Args:
+            size_list (list of int): cardinalities of subpopulations.
+            label_list (list of str): distinct labels of subpopulations.
+            grid (np.array): subpopulations' position in N dimensions
+                (a 1-dimensional grid is a ring).
+            BirthPayoffMatrix (np.array): payoff matrix for the birth process.
+            DeathPayoffMatrix (np.array): payoff matrix for the death process.
+            TransitionMatrix (np.array, optional): transition probabilities
+                between types. Defaults to None.
+            rng (np.random.Generator, optional): source of randomness.
+                If None the global random and np.random modules are used.
+                Defaults to None.
+            neighbourhood (str, optional): shape of the neighbourhood:
+                "moore" (sites which differ by at most
+                radius in every coordinate), "von_neumann" (sites within
+                the Manhattan distance of radius) or "hexagonal" (in 2D only:
+                sites within the hexagonal distance of radius, the grid being
+                indexed by the axial coordinates). Defaults to "moore".
+            radius (int, optional): radius of the neighbourhood.
+                Defaults to 1.
+            boundary (str, optional): boundary conditions of the lattice:
+                "periodic" (coordinates wrap around) or "reflecting"
+                (coordinates are mirrored at the edges of the grid).
+                Defaults to "periodic".
+
+        Note:
+            The lattice is a graph in which the neighbours of every site
+            form its neighbourhood; sites are the nodes of the graph
+            in the row-major order. Neighbours of all the sites are found
+            once, in a table with one row per site. A neighbour which is
+            found more than once (in small or reflecting lattices)
+            is counted with multiplicity. See: MoranProcessGraph.
+
+        Attributes:
+            population (np.array of Individual): snapshot of the entire
+                population: a read-only copy built on every access
+                (O(N)); modifications of the Individuals are not
+                reflected in the process. See: label_at, fitness_at.
+            init_size_list (list of int): cardinalities of initial
+                subpopulations.
+            curr_size_list (list of int): cardinalities of current
+                subpopulations.
+            init_label_list (list of str): distinct labels of initial
+                subpopulations.
+            BirthPayoffMatrix (np.array): payoff matrix for the birth process.
+            DeathPayoffMatrix (np.array): payoff matrix for the death process.
+            w (float): selection pressure weight for the fitness calculation.
+            Entropy (float): current entropy of the whole population.
+            TransitionMatrix (np.array, optional): transition probabilities
+                between types. Defaults to None.
+            fixation_generation (int): generation in which one type took
+                over the whole population (None if not detected).
+            fixed_label (str): label of the type which took over the whole
+                population (None if not detected).
+            rng (np.random.Generator): source of randomness
+                (None for the global random and np.random modules).
+            init_grid (np.array): subpopulations' initial position
+                in N dimensions.
+            curr_grid (np.array): subpopulations' current position
+                in N dimensions.
+            neighbourhood (str): shape of the neighbourhood.
+            radius (int): radius of the neighbourhood.
+            boundary (str): boundary conditions of the lattice.
+
+        Raises:
+            AssertionError: on invalid arguments.
+            IncorrectValueError: on wrong values in the Transition Matrix
+                or of the neighbourhood.
+
+        """
+        self.init_grid = copy.deepcopy(grid)
+        self.neighbourhood = neighbourhood
+        self.radius = radius
+        self.boundary = boundary
+        # neighbours of all the sites: one row per site
+        self._neighbour_table = self._NeighbourTable(np.shape(grid))
+        super().__init__(
+            size_list=size_list,
+            label_list=label_list,
+            node_labels=np.ravel(grid),
+            adjacency=self._LatticeAdjacency(self._neighbour_table),
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+            TransitionMatrix=TransitionMatrix,
+            rng=rng,
+        )
+        # view of the types in the layout of the lattice
+        self._type_grid = self._Layout(self._type_array)
+        # keep a single copy: the table is a view of the adjacency matrix
+        self._neighbour_table = self._indices.reshape(
+            self._neighbour_table.shape
+        )
+
+    @property
+    def init_grid(self):
+        """Python getter."""
+        return self._init_grid
+
+    @init_grid.setter
+    def init_grid(self, init_grid):
+        """Python setter."""
+        self._init_grid = init_grid
+
+    @property
+    def curr_grid(self):
+        """Python getter.
+
+        Note:
+            Labels are decoded from the type indices on every access,
+            hence the simulation does not need to keep them in sync.
+
+        """
+        return self._Layout(self.curr_node_labels)
+
+    @curr_grid.setter
+    def curr_grid(self, curr_grid):
+        """Python setter.
+
+        Note:
+            Payoffs and fitnesses are re-evaluated based on the labels.
+
+        """
+        self.curr_node_labels = curr_grid
+
+    @property
+    def neighbourhood(self):
+        """Python getter."""
+        return self._neighbourhood
+
+    @neighbourhood.setter
+    def neighbourhood(self, neighbourhood):
+        """Python setter."""
+        self._neighbourhood = neighbourhood
+
+    @property
+    def radius(self):
+        """Python getter."""
+        return self._radius
+
+    @radius.setter
+    def radius(self, radius):
+        """Python setter."""
+        self._radius = radius
+
+    @property
+    def boundary(self):
+        """Python getter."""
+        return self._boundary
+
+    @boundary.setter
+    def boundary(self, boundary):
+        """Python setter."""
+        self._boundary = boundary
+
+    @property
+    def adjacency(self):
+        """Python getter.
+
+        Note:
+            Built from the table of neighbours on every access.
+
+        """
+        return self._LatticeAdjacency(self._neighbour_table)
+
+    @adjacency.setter
+    def adjacency(self, adjacency):
+        """Python setter.
+
+        Note:
+            The lattice is defined by its table of neighbours,
+            hence the matrix (with its values) is not kept.
+
+        """
+
+    def _NeighbourShifts(self, ndim):
+        """Find the shifts of coordinates between a site and its neighbours.
+
+        Args:
+            ndim (int): number of dimensions of the grid.
+
+        Returns:
+            list of tuple: shifts in the lexicographic order.
+
+        Raises:
+            IncorrectValueError: on a wrong shape or radius
+                of the neighbourhood.
+
+        """
+        norms = {
+            "moore": lambda shift: max(abs(d) for d in shift),
+            "von_neumann": lambda shift: sum(abs(d) for d in shift),
+        }
+        if ndim == 2:
+            norms["hexagonal"] = lambda shift: max(
+                abs(shift[0]), abs(shift[1]), abs(shift[0] + shift[1])
+            )
+        if self.neighbourhood not in norms:
+            raise IncorrectValueError(
+                parameter="neighbourhood",
+                message="Expected one of: " + ", ".join(norms) + ".",
+            )
+        if int(self.radius) != self.radius or self.radius < 1:
+            raise IncorrectValueError(
+                parameter="radius",
+                message="Radius needs to be a positive integer.",
+            )
+        radius = int(self.radius)
+        norm = norms[self.neighbourhood]
+        return [
+            shift
+            for shift in itertools.product(
+                range(-radius, radius + 1), repeat=ndim
+            )
+            if 0 < norm(shift) <= radius
+        ]
+
+    def _BoundaryCoordinates(self, coordinates, length):
+        """Map the coordinates along one axis onto the grid.
+
+        Args:
+            coordinates (np.array): coordinates, possibly outside the grid.
+            length (int): length of the grid along the axis.
+
+        Returns:
+            np.array: coordinates inside the grid.
+
+        Raises:
+            IncorrectValueError: on wrong boundary conditions.
+
+        """
+        if self.boundary == "periodic":
+            return coordinates % length
+        if self.boundary == "reflecting":
+            if length == 1:
+                return np.zeros_like(coordinates)
+            # the edges of the grid are the mirrors
+            period = 2 * (length - 1)
+            coordinates = np.abs(coordinates) % period
+            return np.where(
+                coordinates < length, coordinates, period - coordinates
+            )
+        raise IncorrectValueError(
+            parameter="boundary",
+            message="Expected one of: periodic, reflecting.",
+        )
+
+    def _NeighbourTable(self, shape):
+        """Find the neighbours of all the sites of the lattice.
+
+        Note:
+            Computed once for the whole lattice with the vectorized
+            arithmetic of the coordinates, one shift at a time.
+
+        Args:
+            shape (tuple): shape of the grid.
+
+        Returns:
+            np.array: nodes of the neighbours, one row per site.
+
+        """
+        shifts = self._NeighbourShifts(len(shape))
+        coordinates = np.indices(shape).reshape(len(shape), -1)
+        dtype = np.int32 if np.prod(shape) < 2**31 else np.int64
+        table = np.empty((coordinates.shape[1], len(shifts)), dtype=dtype)
+        for (column, shift) in enumerate(shifts):
+            neighbour_coordinates = [
+                self._BoundaryCoordinates(axis_coordinates + d, length)
+                for (axis_coordinates, d, length) in zip(
+                    coordinates, shift, shape
+                )
+            ]
+            table[:, column] = np.ravel_multi_index(
+                neighbour_coordinates, shape
+            )
+        return table
+
+    def _LatticeAdjacency(self, neighbour_table):
+        """Build the adjacency matrix of the lattice.
+
+        Args:
+            neighbour_table (np.array): nodes of the neighbours,
+                one row per site.
+
+        Returns:
+            scipy.sparse.csr_matrix: adjacency matrix of the lattice.
+
+        """
+        (nnodes, nneighbours) = neighbour_table.shape
+        return scipy.sparse.csr_matrix(
+            (
+                np.ones(neighbour_table.size, dtype=np.int8),
+                neighbour_table.ravel(),
+                np.arange(0, neighbour_table.size + 1, nneighbours),
+            ),
+            shape=(nnodes, nnodes),
+        )
+
+    def _CountNeighbourTypes(self):
+        """Count the neighbours of every type for all the Individuals.
+
+        Note:
+            With periodical boundary conditions the counts are sums of
+            shifted copies of the lattice of indicators of every type.
+            Moore neighbourhoods are boxes, hence the sums are separable
+            into one sum per axis.
+
+        Returns:
+            np.array: counts of the neighbours' types, one row per node.
+
+        """
+        if self.boundary != "periodic":
+            return super()._CountNeighbourTypes()
+        ntypes = len(self.init_label_list)
+        ndim = np.ndim(self.init_grid)
+        indicators = (
+            self._Layout(self._type_array)[..., np.newaxis]
+            == np.arange(ntypes)
+        ).astype(self._NeighbourCountArray.dtype)
+        if self.neighbourhood == "moore":
+            counts = indicators
+            for axis in range(ndim):
+                axis_counts = counts.copy()
+                for d in range(1, self.radius + 1):
+                    axis_counts += np.roll(counts, d, axis=axis)
+                    axis_counts += np.roll(counts, -d, axis=axis)
+                counts = axis_counts
+            # the box includes the site itself
+            counts -= indicators
+        else:
+            counts = np.zeros_like(indicators)
+            for shift in self._NeighbourShifts(ndim):
+                counts += np.roll(
+                    indicators,
+                    tuple(-d for d in shift),
+                    axis=tuple(range(ndim)),
+                )
+        return counts.reshape(-1, ntypes)
+
+    def _Node(self, site):
+        """Find the node of a given site of the lattice.
+
+        Args:
+            site (tuple of int): coordinates of the site in the grid
+                (or an int for a 1-dimensional grid).
+
+        Returns:
+            int: node of the site.
+
+        """
+        return int(
+            np.ravel_multi_index(
+                tuple(np.atleast_1d(site)), np.shape(self.init_grid)
+            )
+        )
+
+    def _Neighbours(self, node):
+        """Find the neighbours of a given Individual.
+
+        Args:
+            node (int): node of the Individual.
+
+        Returns:
+            np.array: nodes of the neighbours.
+
+        """
+        return self._neighbour_table[node]
+
+    def _IndexInNeighbours(self):
+        """Index the in-coming edges of the lattice.
+
+        Note:
+            With periodic boundary conditions the shifts between a site
+            and its neighbours are symmetric, hence the sites which have
+            a given site as a neighbour are its own neighbours (with the
+            same multiplicity) and the table of neighbours is reused.
+
+        """
+        if self.boundary != "periodic":
+            super()._IndexInNeighbours()
+
+    def _InNeighbours(self, node):
+        """Find the Individuals which have a given Individual as neighbour.
+
+        Args:
+            node (int): node of the Individual.
+
+        Returns:
+            np.array: nodes of the Individuals.
+
+        """
+        if self.boundary != "periodic":
+            return super()._InNeighbours(node)
+        return self._neighbour_table[node]
+
+    def _Layout(self, values):
+        """Arrange the values of all the nodes as the population.
+
+        Args:
+            values (np.array): values indexed by the nodes.
+
+        Returns:
+            np.array: values in the layout of the grid.
+
+        """
+        return values.reshape(self.init_grid.shape)
@@ -0,0 +1,225 @@
+""".
+
+##############################################################################
+#
+#   Implementation of a parallel runner of independent Moran Processes
+#
+#   AUTHOR: Maciej_Bak
+#   AFFILIATION: University_of_Basel
+#   AFFILIATION: Swiss_Institute_of_Bioinformatics
+#   CONTACT: wsciekly.maciek@gmail.com
+#   CREATED: 18-10-2026
+#   LICENSE: MIT
+#
+##############################################################################
+"""
+
+# imports
+import concurrent.futures
+import os
+
+import numpy as np
+import pandas as pd
+
+from moranpycess.CustomExceptions import IncorrectValueError
+
+
+def _simulate_replicate(arguments):
+    """Simulate a single replicate in a worker process.
+
+    Args:
+        arguments (tuple): class of the process, its initializer arguments,
+            seed sequence of the replicate and the simulation arguments.
+
+    Returns:
+        pd.DataFrame: table with simulation logs
+            (pd.Series in the summary-only mode).
+
+    """
+    (process_class, process_kwargs, seed_sequence, simulate_kwargs) = arguments
+    process = process_class(
+        **process_kwargs, rng=np.random.default_rng(seed_sequence)
+    )
+    return process.simulate(**simulate_kwargs)
+
+
+class ParallelRunner:
+    """Runner of independent replicates of a Moran Process on many cores."""
+
+    def __init__(
+        self,
+        process_class,
+        process_kwargs,
+        replicates,
+        seed=None,
+        processes=None,
+    ):
+        """Class initializer.
+
+        Note:
+            Every replicate has its own NumPy random generator built from
+            a seed sequence spawned from the root seed, hence the results
+            do not depend on the number of processes nor on the assignment
+            of the replicates to the processes.
+
+        Args:
+            process_class (type): one of: MoranProcess, MoranProcess2D,
+                MoranProcess3D, MoranProcessND, MoranProcessGraph.
+            process_kwargs (dict): arguments of the class initializer
+                (except for rng).
+            replicates (int): number of independent replicates.
+            seed (int, optional): root seed of the replicates' random
+                streams. If None it is drawn from the OS entropy.
+                Defaults to None.
+            processes (int, optional): number of worker processes.
+                If None the number of CPUs is used. Defaults to None.
+
+        Attributes:
+            process_class (type): class of the simulated process.
+            process_kwargs (dict): arguments of the class initializer.
+            replicates (int): number of independent replicates.
+            seed (int): root seed of the replicates' random streams.
+            processes (int): number of worker processes.
+
+        Raises:
+            IncorrectValueError: on a non-positive number of replicates
+                or processes.
+
+        """
+        if replicates < 1:
+            raise IncorrectValueError(
+                parameter="replicates",
+                message="Number of replicates needs to be a positive integer.",
+            )
+        if processes is not None and processes < 1:
+            raise IncorrectValueError(
+                parameter="processes",
+                message="Number of processes needs to be a positive integer.",
+            )
+        self.process_class = process_class
+        self.process_kwargs = dict(process_kwargs)
+        self.replicates = replicates
+        # keep the seed so that the simulations can be reproduced
+        self.seed = np.random.SeedSequence(seed).entropy
+        self.processes = os.cpu_count() if processes is None else processes
+
+    @property
+    def process_class(self):
+        """Python getter."""
+        return self._process_class
+
+    @process_class.setter
+    def process_class(self, process_class):
+        """Python setter."""
+        self._process_class = process_class
+
+    @property
+    def process_kwargs(self):
+        """Python getter."""
+        return self._process_kwargs
+
+    @process_kwargs.setter
+    def process_kwargs(self, process_kwargs):
+        """Python setter."""
+        self._process_kwargs = process_kwargs
+
+    @property
+    def replicates(self):
+        """Python getter."""
+        return self._replicates
+
+    @replicates.setter
+    def replicates(self, replicates):
+        """Python setter."""
+        self._replicates = replicates
+
+    @property
+    def seed(self):
+        """Python getter."""
+        return self._seed
+
+    @seed.setter
+    def seed(self, seed):
+        """Python setter."""
+        self._seed = seed
+
+    @property
+    def processes(self):
+        """Python getter."""
+        return self._processes
+
+    @processes.setter
+    def processes(self, processes):
+        """Python setter."""
+        self._processes = processes
+
+    def simulate(
+        self,
+        generations,
+        record_every=1,
+        summary_only=False,
+        stop_on_fixation=False,
+        rejection_free=False,
+    ):
+        """Simulate all the replicates in parallel.
+
+        Args:
+            generations (int): number of time steps.
+            record_every (int, optional): interval (in generations) between
+                the logged states of the population. Defaults to 1.
+            summary_only (bool, optional): keep only the final state and
+                the summary statistics of every replicate. Defaults to False.
+            stop_on_fixation (bool, optional): stop every replicate as soon
+                as one type takes over the whole population.
+                Defaults to False.
+            rejection_free (bool, optional): simulate only the Birth-Death
+                cycles which change the population. Defaults to False.
+
+        Returns:
+            pd.DataFrame: simulation logs of all the replicates, indexed by
+                the replicate and the generation.
+                If summary_only: one row of the summary per replicate.
+
+        """
+        simulate_kwargs = {
+            "generations": generations,
+            "record_every": record_every,
+            "summary_only": summary_only,
+            "stop_on_fixation": stop_on_fixation,
+            "rejection_free": rejection_free,
+        }
+        seed_sequences = np.random.SeedSequence(self.seed).spawn(
+            self.replicates
+        )
+        arguments = [
+            (
+                self.process_class,
+                self.process_kwargs,
+                seed_sequence,
+                simulate_kwargs,
+            )
+            for seed_sequence in seed_sequences
+        ]
+
+        # run in the current process if there is no need for a pool
+        if self.processes == 1:
+            results = list(map(_simulate_replicate, arguments))
+        else:
+            chunksize = max(1, self.replicates // (4 * self.processes))
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.processes
+            ) as executor:
+                results = list(
+                    executor.map(
+                        _simulate_replicate, arguments, chunksize=chunksize
+                    )
+                )
+
+        # gather the results in the order of the replicates
+        if summary_only:
+            df = pd.DataFrame(results)
+            df.index = pd.RangeIndex(self.replicates, name="replicate")
+            return df
+        return pd.concat(
+            results, keys=range(self.replicates), names=["replicate"]
+        )
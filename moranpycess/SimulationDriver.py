@@ -0,0 +1,299 @@
+""".
+
+##############################################################################
+#
+#   Implementation of the simulation loop shared by the Moran Processes
+#
+#   AUTHOR: Maciej_Bak
+#   AFFILIATION: University_of_Basel
+#   AFFILIATION: Swiss_Institute_of_Bioinformatics
+#   CONTACT: wsciekly.maciek@gmail.com
+#   CREATED: 18-10-2026
+#   LICENSE: MIT
+#
+##############################################################################
+"""
+
+# imports
+from moranpycess.CustomExceptions import IncorrectValueError
+from moranpycess.LogBuffer import LogBuffer
+from moranpycess.LogSummary import LogSummary
+
+
+class SimulationDriver:
+    """Simulation loop and logging shared by the Moran Processes.
+
+    Note:
+        Not to be instantiated by the user directly. Classes which inherit
+        the loop provide the attributes curr_size_list, init_label_list,
+        TransitionMatrix, fixation_generation and fixed_label together
+        with the methods: _LogColumns and _LogValues (columns and values
+        of the logs), _SimulateGeneration (one Birth-Death cycle),
+        _NextEventGenerations and _SimulateEvent (rejection-free cycles).
+
+    """
+
+    def _PrepareRejectionFree(self):
+        """Prepare the process for the rejection-free simulation.
+
+        Raises:
+            IncorrectValueError: if the process does not support the mode.
+
+        """
+        pass
+
+    def simulate(
+        self,
+        generations,
+        record_every=1,
+        summary_only=False,
+        sink=None,
+        stop_on_fixation=False,
+        rejection_free=False,
+    ):
+        """Simulate population evolution.
+
+        Simulate population evolution: Birth-Death process with fitness-based
+        selection of individuals.
+
+        Args:
+            generations (int): number of time steps.
+            record_every (int, optional): interval (in generations) between
+                the logged states of the population; the initial and
+                the final states are always logged. Defaults to 1.
+            summary_only (bool, optional): instead of the full logs keep only
+                the final state and the summary statistics, so that
+                the memory does not grow with the number of generations.
+                Defaults to False.
+            sink (LogWriter, optional): instead of keeping the logs in
+                memory write them to disk in chunks. Defaults to None.
+            stop_on_fixation (bool, optional): stop the simulation as soon as
+                one type takes over the whole population; the generation
+                and the label are kept in the attributes fixation_generation
+                and fixed_label. Defaults to False.
+            rejection_free (bool, optional): simulate only the Birth-Death
+                cycles which change the population and draw the number of
+                the cycles in between from a geometric distribution;
+                the logged generations are exact. Defaults to False.
+
+        Raises:
+            IncorrectValueError: on a non-positive logging interval,
+                when both summary_only and sink are specified or
+                on stop_on_fixation or rejection_free with
+                a TransitionMatrix specified or on rejection_free
+                not supported by the process.
+
+        Returns:
+            pd.DataFrame: table with simulation logs.
+                If summary_only: pd.Series with the final state of
+                the population and the means over the logged generations.
+                If sink is specified: None.
+
+        """
+        if summary_only and sink is not None:
+            raise IncorrectValueError(
+                parameter="sink",
+                message="Logs cannot be written in the summary-only mode.",
+            )
+        logged_generations = self._LoggedGenerations(
+            generations, record_every, stop_on_fixation, rejection_free
+        )
+
+        # prepare a buffer to store the logs
+        (size_columns, value_columns) = self._LogColumns()
+        if summary_only:
+            log = LogSummary(size_columns, value_columns)
+        elif sink is not None:
+            log = sink
+            log.open(size_columns, value_columns)
+        else:
+            log = LogBuffer(
+                size_columns,
+                value_columns,
+                nrows=generations // record_every + 2,
+            )
+
+        # update the logs with features of the initial population
+        # and then after every logged generation
+        try:
+            for g in logged_generations:
+                log.record(g, self.curr_size_list, self._LogValues())
+        finally:
+            # write out the last chunk even if the simulation was interrupted
+            if sink is not None:
+                log.close()
+
+        if summary_only:
+            summary = log.to_series()
+            if stop_on_fixation:
+                summary["fixation_generation"] = self.fixation_generation
+                summary["fixed_label"] = self.fixed_label
+            return summary
+        if sink is not None:
+            return None
+        return log.to_dataframe()
+
+    def simulate_iter(
+        self,
+        generations,
+        record_every=1,
+        stop_on_fixation=False,
+        rejection_free=False,
+    ):
+        """Simulate population evolution lazily.
+
+        Generator version of the method simulate: the population evolves
+        only as the records are consumed, hence the iteration may be
+        stopped at any point and no logs are kept in memory.
+
+        Args:
+            generations (int): number of time steps.
+            record_every (int, optional): interval (in generations) between
+                the yielded states of the population; the initial and
+                the final states are always yielded. Defaults to 1.
+            stop_on_fixation (bool, optional): stop the simulation as soon as
+                one type takes over the whole population. Defaults to False.
+            rejection_free (bool, optional): simulate only the Birth-Death
+                cycles which change the population and draw the number of
+                the cycles in between from a geometric distribution;
+                the logged generations are exact. Defaults to False.
+
+        Raises:
+            IncorrectValueError: on a non-positive logging interval or
+                on stop_on_fixation or rejection_free with
+                a TransitionMatrix specified or on rejection_free
+                not supported by the process.
+
+        Returns:
+            generator of dict: records with the generation and the values
+                of all the columns of the simulation logs.
+
+        """
+        (size_columns, value_columns) = self._LogColumns()
+        columns = size_columns + value_columns
+        return (
+            dict(
+                zip(
+                    ["generation"] + columns,
+                    [g] + self.curr_size_list + list(self._LogValues()),
+                )
+            )
+            for g in self._LoggedGenerations(
+                generations, record_every, stop_on_fixation, rejection_free
+            )
+        )
+
+    def _LoggedGenerations(
+        self,
+        generations,
+        record_every,
+        stop_on_fixation=False,
+        rejection_free=False,
+    ):
+        """Evolve the population, pausing at the generations to be logged.
+
+        Note:
+            Without type transitions only the type which has just multiplied
+            may take over the whole population, hence the absorption is
+            detected in O(1) per generation.
+            In the rejection-free mode the population does not change in
+            between two consecutive events, hence the generations logged
+            in between are yielded without any simulation.
+
+        Args:
+            generations (int): number of time steps.
+            record_every (int): interval (in generations) between the logged
+                states of the population.
+            stop_on_fixation (bool, optional): stop as soon as one type takes
+                over the whole population. Defaults to False.
+            rejection_free (bool, optional): simulate only the Birth-Death
+                cycles which change the population. Defaults to False.
+
+        Raises:
+            IncorrectValueError: on a non-positive logging interval or
+                on stop_on_fixation or rejection_free with
+                a TransitionMatrix specified or on rejection_free
+                not supported by the process.
+
+        Returns:
+            generator of int: numbers of the generations to be logged;
+                the population is in the respective state while
+                the generator is suspended.
+
+        """
+        if record_every < 1:
+            raise IncorrectValueError(
+                parameter="record_every",
+                message="Logging interval needs to be a positive integer.",
+            )
+
+        if stop_on_fixation and self.TransitionMatrix is not None:
+            raise IncorrectValueError(
+                parameter="stop_on_fixation",
+                message="Fixation is not absorbing with type transitions.",
+            )
+        if rejection_free and self.TransitionMatrix is not None:
+            raise IncorrectValueError(
+                parameter="rejection_free",
+                message="Type transitions change the population every cycle.",
+            )
+        if rejection_free:
+            self._PrepareRejectionFree()
+        self.fixation_generation = None
+        self.fixed_label = None
+        population_size = sum(self.curr_size_list)
+
+        def evolve():
+            # the initial population might be absorbed already
+            fixed = stop_on_fixation and population_size in self.curr_size_list
+            if fixed:
+                self.fixation_generation = 0
+                self.fixed_label = self.init_label_list[
+                    self.curr_size_list.index(population_size)
+                ]
+            yield 0
+            if fixed:
+                return
+            if rejection_free:
+                yield from evolve_events()
+                return
+            for g in range(1, generations + 1):
+                birth_index = self._SimulateGeneration()
+                if (
+                    stop_on_fixation
+                    and self.curr_size_list[birth_index] == population_size
+                ):
+                    self.fixation_generation = g
+                    self.fixed_label = self.init_label_list[birth_index]
+                    yield g
+                    return
+                if g % record_every == 0 or g == generations:
+                    yield g
+
+        def evolve_events():
+            g = 0
+            while True:
+                skipped = self._NextEventGenerations()
+                next_g = generations + 1 if skipped is None else g + skipped
+                # the population is unchanged until the next event
+                first = (g // record_every + 1) * record_every
+                stop = min(next_g, generations + 1)
+                yield from range(first, stop, record_every)
+                if next_g > generations:
+                    if generations > g and generations % record_every != 0:
+                        yield generations
+                    return
+                g = next_g
+                birth_index = self._SimulateEvent()
+                if (
+                    stop_on_fixation
+                    and self.curr_size_list[birth_index] == population_size
+                ):
+                    self.fixation_generation = g
+                    self.fixed_label = self.init_label_list[birth_index]
+                    yield g
+                    return
+                if g % record_every == 0 or g == generations:
+                    yield g
+
+        return evolve()
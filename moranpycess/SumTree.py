@@ -0,0 +1,160 @@
+""".
+
+##############################################################################
+#
+#   Implementation of a sum tree for fitness-proportional selection
+#
+#   AUTHOR: Maciej_Bak
+#   AFFILIATION: University_of_Basel
+#   AFFILIATION: Swiss_Institute_of_Bioinformatics
+#   CONTACT: wsciekly.maciek@gmail.com
+#   CREATED: 18-10-2026
+#   LICENSE: MIT
+#
+##############################################################################
+"""
+
+# imports
+import numpy as np
+
+
+class SumTree:
+    """Binary tree of partial sums over non-negative weights."""
+
+    def __init__(self, values):
+        """Class initializer.
+
+        Note:
+            Not to be instantiated by the user directly.
+            Leaves hold the weights, every internal node holds the sum of
+            its two children. Updating a weight and selecting an item
+            proportionally to its weight both cost O(log n).
+
+        Args:
+            values (np.array): initial weights of the items.
+
+        Attributes:
+            size (int): number of items in the tree.
+            capacity (int): number of leaves (power of two).
+            tree (np.array): flat array with all nodes of the tree,
+                the root is stored under index 1.
+
+        """
+        values = np.ravel(values)
+        self.size = values.size
+        self.capacity = 1
+        while self.capacity < self.size:
+            self.capacity *= 2
+        self.tree = np.zeros(2 * self.capacity, dtype=float)
+        self.rebuild(values)
+
+    @property
+    def size(self):
+        """Python getter."""
+        return self._size
+
+    @size.setter
+    def size(self, size):
+        """Python setter."""
+        self._size = size
+
+    @property
+    def capacity(self):
+        """Python getter."""
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, capacity):
+        """Python setter."""
+        self._capacity = capacity
+
+    @property
+    def tree(self):
+        """Python getter."""
+        return self._tree
+
+    @tree.setter
+    def tree(self, tree):
+        """Python setter."""
+        self._tree = tree
+
+    @property
+    def total(self):
+        """Sum of all the weights in the tree."""
+        return self.tree[1]
+
+    def rebuild(self, values):
+        """Overwrite all the weights and recompute the internal nodes.
+
+        Args:
+            values (np.array): new weights of the items.
+
+        """
+        leaves = slice(self.capacity, self.capacity + self.size)
+        self.tree[:] = 0.0
+        self.tree[leaves] = np.ravel(values)
+        level_start = self.capacity // 2
+        while level_start >= 1:
+            level = slice(level_start, 2 * level_start)
+            children = slice(2 * level_start, 4 * level_start)
+            self.tree[level] = (
+                self.tree[children][0::2] + self.tree[children][1::2]
+            )
+            level_start //= 2
+
+    def update(self, indices, values):
+        """Overwrite weights of the selected items.
+
+        Args:
+            indices (iterable of int): indices of the items.
+            values (iterable of float): new weights of the items.
+
+        """
+        tree = self.tree
+        nodes = set()
+        for index, value in zip(indices, values):
+            node = int(index) + self.capacity
+            tree[node] = value
+            if node > 1:
+                nodes.add(node // 2)
+        # recompute the sums level by level, every ancestor only once
+        while nodes:
+            parents = set()
+            for node in nodes:
+                tree[node] = tree[2 * node] + tree[2 * node + 1]
+                if node > 1:
+                    parents.add(node // 2)
+            nodes = parents
+
+    def search(self, pick):
+        """Find the item for which the cumulative weight exceeds the pick.
+
+        Note:
+            Equivalent to a linear scan which accumulates the weights in
+            the order of the items and stops as soon as the running sum is
+            greater than the pick. A pick on the upper bound of the interval
+            (or past it, by the rounding of the partial sums) selects
+            the last item with a positive weight.
+
+        Args:
+            pick (float): value from the interval [0, total].
+
+        Returns:
+            int: index of the selected item.
+
+        """
+        tree = self.tree
+        node = 1
+        while node < self.capacity:
+            left = tree[2 * node]
+            if pick < left:
+                node = 2 * node
+            elif tree[2 * node + 1] > 0.0:
+                pick -= left
+                node = 2 * node + 1
+            else:
+                # the pick fell on the upper bound of the subtree:
+                # the last positive weight is on the left
+                pick = np.inf
+                node = 2 * node
+        return node - self.capacity
@@ -15,6 +15,13 @@
 """
 
 # import distinct classes from modules of this package
+from .LogWriter import LogWriter  # noqa
 from .MoranProcess import MoranProcess  # noqa
 from .MoranProcess2D import MoranProcess2D  # noqa
 from .MoranProcess3D import MoranProcess3D  # noqa
+from .MoranProcessChain import MoranProcessChain  # noqa
+from .MoranProcessEnsemble import MoranProcessEnsemble  # noqa
+from .MoranProcessGraph import MoranProcessGraph  # noqa
+from .MoranProcessMeanField import MoranProcessMeanField  # noqa
+from .MoranProcessND import MoranProcessND  # noqa
+from .ParallelRunner import ParallelRunner  # noqa
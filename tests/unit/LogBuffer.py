@@ -0,0 +1,58 @@
+""".
+
+##############################################################################
+#
+#   Unit tests for the preallocated simulation logs
+#
+#   AUTHOR: Maciej_Bak
+#   AFFILIATION: University_of_Basel
+#   AFFILIATION: Swiss_Institute_of_Bioinformatics
+#   CONTACT: wsciekly.maciek@gmail.com
+#   CREATED: 18-10-2026
+#   LICENSE: MIT
+#
+##############################################################################
+"""
+
+# imports
+import numpy as np
+
+from .context import moranpycess
+
+
+class TestClass:
+    """Test class for pytest package."""
+
+    def test_classLogBufferInit(self):
+        """Test the initializer."""
+        # initialize an instance of LogBuffer:
+        log = moranpycess.LogBuffer.LogBuffer(
+            size_columns=["A__size", "B__size"],
+            value_columns=["Entropy"],
+            nrows=10,
+        )
+        # test all the attributes:
+        assert log.size_columns == ["A__size", "B__size"]
+        assert log.value_columns == ["Entropy"]
+        assert log.sizes.shape == (10, 2)
+        assert log.values.shape == (10, 1)
+        assert log.generations.shape == (10,)
+        assert log.nrows == 0
+
+    def test_classLogBufferToDataFrame(self):
+        """Test the conversion into a dataframe."""
+        log = moranpycess.LogBuffer.LogBuffer(
+            size_columns=["A__size", "B__size"],
+            value_columns=["Entropy"],
+            nrows=10,
+        )
+        log.record(0, [3, 1], [0.811])
+        log.record(5, [2, 2], [1.0])
+        df = log.to_dataframe()
+        assert df.shape == (2, 3)
+        assert list(df.columns) == ["A__size", "B__size", "Entropy"]
+        assert list(df.index) == [0, 5]
+        assert df.index.name == "generation"
+        assert df["A__size"].dtype == np.int64
+        assert df["Entropy"].dtype == np.float64
+        assert df.at[5, "B__size"] == 2
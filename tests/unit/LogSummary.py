@@ -0,0 +1,64 @@
+""".
+
+##############################################################################
+#
+#   Unit tests for the summary-only simulation logs
+#
+#   AUTHOR: Maciej_Bak
+#   AFFILIATION: University_of_Basel
+#   AFFILIATION: Swiss_Institute_of_Bioinformatics
+#   CONTACT: wsciekly.maciek@gmail.com
+#   CREATED: 18-10-2026
+#   LICENSE: MIT
+#
+##############################################################################
+"""
+
+# imports
+from .context import moranpycess
+
+
+class TestClass:
+    """Test class for pytest package."""
+
+    def test_classLogSummaryInit(self):
+        """Test the initializer."""
+        # initialize an instance of LogSummary:
+        log = moranpycess.LogSummary.LogSummary(
+            size_columns=["A__size", "B__size"],
+            value_columns=["Entropy"],
+        )
+        # test all the attributes:
+        assert log.size_columns == ["A__size", "B__size"]
+        assert log.value_columns == ["Entropy"]
+        assert log.generation == 0
+        assert log.sizes.shape == (2,)
+        assert log.values.shape == (1,)
+        assert list(log.sizes_sum) == [0, 0]
+        assert log.entropy_sum == 0.0
+        assert log.nrows == 0
+
+    def test_classLogSummaryToSeries(self):
+        """Test the conversion into a series."""
+        log = moranpycess.LogSummary.LogSummary(
+            size_columns=["A__size", "B__size"],
+            value_columns=["Entropy"],
+        )
+        log.record(0, [3, 1], [0.5])
+        log.record(5, [2, 2], [1.0])
+        summary = log.to_series()
+        assert list(summary.index) == [
+            "generations",
+            "A__size",
+            "B__size",
+            "Entropy",
+            "A__MeanSize",
+            "B__MeanSize",
+            "MeanEntropy",
+        ]
+        assert summary["generations"] == 5
+        assert summary["B__size"] == 2
+        assert summary["Entropy"] == 1.0
+        assert summary["A__MeanSize"] == 2.5
+        assert summary["B__MeanSize"] == 1.5
+        assert summary["MeanEntropy"] == 0.75
@@ -0,0 +1,147 @@
+""".
+
+##############################################################################
+#
+#   Unit tests for the chunked on-disk simulation logs
+#
+#   AUTHOR: Maciej_Bak
+#   AFFILIATION: University_of_Basel
+#   AFFILIATION: Swiss_Institute_of_Bioinformatics
+#   CONTACT: wsciekly.maciek@gmail.com
+#   CREATED: 18-10-2026
+#   LICENSE: MIT
+#
+##############################################################################
+"""
+
+# imports
+import importlib.util
+import os
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from .context import moranpycess
+
+
+class TestClass:
+    """Test class for pytest package."""
+
+    def test_classLogWriterInit(self):
+        """Test the initializer."""
+        # initialize an instance of LogWriter:
+        sink = moranpycess.LogWriter("log.csv", chunk_size=3)
+        # test all the attributes:
+        assert sink.path == "log.csv"
+        assert sink.file_format == "csv"
+        assert sink.chunk_size == 3
+        assert sink.nchunks == 0
+        assert sink.buffer is None
+
+    def test_classLogWriterWrongInit(self):
+        """Test assertion errors in the initializer."""
+        with pytest.raises(Exception) as e_info:
+            moranpycess.LogWriter("log.json", file_format="json")
+        assert type(e_info.value).__name__ == "IncorrectValueError"
+        with pytest.raises(Exception) as e_info:
+            moranpycess.LogWriter("log.csv", chunk_size=0)
+        assert type(e_info.value).__name__ == "IncorrectValueError"
+
+    def test_classLogWriterCSV(self, tmp_path):
+        """Test appending the logs to a CSV file in chunks."""
+        path = os.path.join(tmp_path, "log.csv")
+        sink = moranpycess.LogWriter(path, chunk_size=2)
+        sink.open(["A__size", "B__size"], ["Entropy"])
+        sink.record(0, [3, 1], [0.811])
+        assert sink.nchunks == 0
+        sink.record(1, [2, 2], [1.0])
+        assert sink.nchunks == 1
+        sink.record(2, [1, 3], [0.811])
+        sink.close()
+        assert sink.nchunks == 2
+        df = pd.read_csv(path, index_col="generation")
+        assert list(df.columns) == ["A__size", "B__size", "Entropy"]
+        assert list(df.index) == [0, 1, 2]
+        assert list(df["A__size"]) == [3, 2, 1]
+        # a new simulation replaces the previous output:
+        sink.open(["A__size", "B__size"], ["Entropy"])
+        sink.record(0, [4, 0], [0.0])
+        sink.close()
+        df = pd.read_csv(path, index_col="generation")
+        assert df.shape == (1, 3)
+
+    def test_classLogWriterParquet(self, tmp_path):
+        """Test appending the logs to a directory of Parquet files."""
+        pytest.importorskip("pyarrow")
+        path = os.path.join(tmp_path, "log")
+        sink = moranpycess.LogWriter(path, file_format="parquet", chunk_size=2)
+        sink.open(["A__size", "B__size"], ["Entropy"])
+        sink.record(0, [3, 1], [0.811])
+        sink.record(1, [2, 2], [1.0])
+        sink.record(2, [1, 3], [0.811])
+        sink.close()
+        assert sink.nchunks == 2
+        df = pd.read_parquet(path)
+        assert list(df.columns) == ["A__size", "B__size", "Entropy"]
+        assert list(df.index) == [0, 1, 2]
+        assert list(df["A__size"]) == [3, 2, 1]
+        # a new simulation replaces the previous output:
+        sink.open(["A__size", "B__size"], ["Entropy"])
+        sink.record(0, [4, 0], [0.0])
+        sink.close()
+        assert pd.read_parquet(path).shape == (1, 3)
+
+    def test_classLogWriterHDF5(self, tmp_path):
+        """Test appending the logs to a table in an HDF5 file."""
+        pytest.importorskip("tables")
+        path = os.path.join(tmp_path, "log.h5")
+        sink = moranpycess.LogWriter(path, file_format="hdf5", chunk_size=2)
+        sink.open(["A__size", "B__size"], ["Entropy"])
+        sink.record(0, [3, 1], [0.811])
+        sink.record(1, [2, 2], [1.0])
+        sink.record(2, [1, 3], [0.811])
+        sink.close()
+        assert sink.nchunks == 2
+        df = pd.read_hdf(path, key="log")
+        assert list(df.columns) == ["A__size", "B__size", "Entropy"]
+        assert list(df.index) == [0, 1, 2]
+        assert list(df["A__size"]) == [3, 2, 1]
+        # a new simulation replaces the previous output:
+        sink.open(["A__size", "B__size"], ["Entropy"])
+        sink.record(0, [4, 0], [0.0])
+        sink.close()
+        assert pd.read_hdf(path, key="log").shape == (1, 3)
+
+    def test_classLogWriterMissingEngine(self, monkeypatch):
+        """Test the error on a format without an installed engine."""
+        # pretend that none of the optional engines is installed
+        monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+        with pytest.raises(ImportError):
+            moranpycess.LogWriter("log", file_format="parquet")
+        with pytest.raises(ImportError):
+            moranpycess.LogWriter("log.h5", file_format="hdf5")
+        assert moranpycess.LogWriter("log.csv").file_format == "csv"
+
+    def test_MoranProcessWithSink(self, tmp_path):
+        """Test writing the simulation logs to disk."""
+        # initialize an instance of MoranProcess:
+        mp = moranpycess.MoranProcess(
+            size_list=[10, 10],
+            label_list=["a", "b"],
+            BirthPayoffMatrix=np.array([[1, 2], [3, 4]]),
+            DeathPayoffMatrix=np.array([[0.1, 0.2], [0.3, 0.4]]),
+        )
+        path = os.path.join(tmp_path, "log.csv")
+        sink = moranpycess.LogWriter(path, chunk_size=4)
+        random.seed(0)
+        assert mp.simulate(generations=10, sink=sink) is None
+        assert mp.curr_size_list == [6, 14]
+        df = pd.read_csv(path, index_col="generation")
+        assert df.shape == (11, 11)
+        assert df.at[10, "a__size"] == 6
+        # sink cannot be combined with the summary-only mode:
+        with pytest.raises(Exception) as e_info:
+            mp.simulate(generations=10, summary_only=True, sink=sink)
+        assert type(e_info.value).__name__ == "IncorrectValueError"
@@ -208,6 +208,112 @@ def test_classMoranProcess_simulate(self):
         assert round(mp.AvgDeathPayoffDict["b"], 3) == 0.368
         assert mp.curr_size_list == [6, 14]
         assert simulation.shape == (11, 11)
+        assert simulation["a__size"].dtype == np.int64
+        assert simulation["Entropy"].dtype == np.float64
+
+    def test_classMoranProcess_simulateThinned(self):
+        """Test the simulation with thinned and summary-only logs."""
+        # initialize an instance of MoranProcess:
+        size_list = [10, 10]
+        label_list = ["a", "b"]
+        BirthPayoffMatrix = np.array([[1, 2], [3, 4]])
+        DeathPayoffMatrix = np.array([[0.1, 0.2], [0.3, 0.4]])
+        mp = moranpycess.MoranProcess(
+            size_list=size_list,
+            label_list=label_list,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+        )
+        # thinning does not change the trajectory:
+        random.seed(0)
+        simulation = mp.simulate(generations=10, record_every=3)
+        assert mp.curr_size_list == [6, 14]
+        assert simulation.shape == (5, 11)
+        assert list(simulation.index) == [0, 3, 6, 9, 10]
+        assert simulation.at[10, "a__size"] == 6
+        # summary of the whole run:
+        summary = mp.simulate(generations=10, summary_only=True)
+        assert summary["generations"] == 10
+        assert summary["a__size"] + summary["b__size"] == 20
+        assert summary["a__MeanSize"] + summary["b__MeanSize"] == 20
+        assert 0.0 <= summary["MeanEntropy"] <= 1.0
+        # incorrect logging interval:
+        with pytest.raises(Exception) as e_info:
+            mp.simulate(generations=10, record_every=0)
+        assert type(e_info.value).__name__ == "IncorrectValueError"
+
+    def test_classMoranProcess_simulate_iter(self):
+        """Test the generator version of the simulation."""
+        # initialize an instance of MoranProcess:
+        size_list = [10, 10]
+        label_list = ["a", "b"]
+        BirthPayoffMatrix = np.array([[1, 2], [3, 4]])
+        DeathPayoffMatrix = np.array([[0.1, 0.2], [0.3, 0.4]])
+        mp = moranpycess.MoranProcess(
+            size_list=size_list,
+            label_list=label_list,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+        )
+        # records follow the same trajectory as the simulation:
+        random.seed(0)
+        records = list(mp.simulate_iter(generations=10, record_every=3))
+        assert mp.curr_size_list == [6, 14]
+        assert [r["generation"] for r in records] == [0, 3, 6, 9, 10]
+        assert records[-1]["a__size"] == 6
+        assert records[-1]["b__size"] == 14
+        assert len(records[-1]) == 12
+        # the evolution stops together with the iteration:
+        for record in mp.simulate_iter(generations=1000):
+            if record["generation"] == 5:
+                break
+        assert sum(mp.curr_size_list) == 20
+        # incorrect logging interval is reported immediately:
+        with pytest.raises(Exception) as e_info:
+            mp.simulate_iter(generations=10, record_every=-1)
+        assert type(e_info.value).__name__ == "IncorrectValueError"
+
+    def test_classMoranProcess_simulateStopOnFixation(self):
+        """Test the early termination of the simulation on absorption."""
+        # initialize an instance of MoranProcess:
+        size_list = [2, 3]
+        label_list = ["a", "b"]
+        BirthPayoffMatrix = np.array([[1, 2], [3, 4]])
+        DeathPayoffMatrix = np.array([[0.1, 0.2], [0.3, 0.4]])
+        mp = moranpycess.MoranProcess(
+            size_list=size_list,
+            label_list=label_list,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+        )
+        assert mp.fixation_generation is None
+        assert mp.fixed_label is None
+        random.seed(0)
+        simulation = mp.simulate(generations=10000, stop_on_fixation=True)
+        assert mp.fixation_generation is not None
+        assert 0 < mp.fixation_generation < 10000
+        assert simulation.index[-1] == mp.fixation_generation
+        assert simulation.at[mp.fixation_generation, mp.fixed_label + "__size"]
+        assert mp.curr_size_list[label_list.index(mp.fixed_label)] == 5
+        # absorbed population stops immediately:
+        fixed_label = mp.fixed_label
+        summary = mp.simulate(
+            generations=10, summary_only=True, stop_on_fixation=True
+        )
+        assert summary["generations"] == 0
+        assert summary["fixation_generation"] == 0
+        assert summary["fixed_label"] == fixed_label
+        # fixation is not absorbing with type transitions:
+        mp = moranpycess.MoranProcess(
+            size_list=size_list,
+            label_list=label_list,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+            TransitionMatrix=np.array([[0.9, 0.1], [0.1, 0.9]]),
+        )
+        with pytest.raises(Exception) as e_info:
+            mp.simulate(generations=10, stop_on_fixation=True)
+        assert type(e_info.value).__name__ == "IncorrectValueError"
 
     def test_classMoranProcessWrongInit(self):
         """Test assertion errors in the initializer."""
@@ -334,3 +440,226 @@ def test_MoranProcessWithTransitionMatrix(self):
         random.seed(0)
         mp.simulate(generations=10)
         assert mp.curr_size_list == [0, 10]
+
+    def test_MoranProcessTransitionMembers(self):
+        """Test the multinomial transitions of the tracked individuals."""
+        # initialize an instance of MoranProcess:
+        size_list = [60, 30, 10]
+        label_list = ["A", "B", "C"]
+        BirthPayoffMatrix = np.ones((3, 3))
+        DeathPayoffMatrix = np.ones((3, 3))
+        TransitionMatrix = np.array(
+            [[0.5, 0.25, 0.25], [0.25, 0.5, 0.25], [0.0, 0.0, 1.0]]
+        )
+        mp = moranpycess.MoranProcess(
+            size_list=size_list,
+            label_list=label_list,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+            TransitionMatrix=TransitionMatrix,
+            rng=np.random.default_rng(0),
+        )
+        mp._TransitionMembers()
+        assert sum(mp.curr_size_list) == 100
+        # labels of the members follow their new types:
+        labels = [ind.label for ind in mp.population]
+        assert [labels.count(label) for label in label_list] == (
+            mp.curr_size_list
+        )
+        # every individual is kept exactly once:
+        assert sorted(ind.ID for ind in mp.population) == list(range(100))
+        # type C is absorbing:
+        assert mp.curr_size_list[2] >= 10
+
+    def test_MoranProcessCountsOnly(self):
+        """Test the simulation without tracking individuals."""
+        # initialize an instance of MoranProcess:
+        size_list = [10, 90]
+        label_list = ["A", "B"]
+        BirthPayoffMatrix = np.array([[10, 20], [30, 40]])
+        DeathPayoffMatrix = np.array([[1, 2], [3, 4]])
+        mp = moranpycess.MoranProcess(
+            size_list=size_list,
+            label_list=label_list,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+            track_individuals=False,
+        )
+        # test the attributes:
+        assert mp.population is None
+        assert mp.curr_size_list == size_list
+        assert round(mp.AvgBirthPayoffDict["A"], 3) == 19.091
+        assert round(mp.AvgDeathPayoffDict["B"], 3) == 3.899
+        assert round(mp.BirthFitnessDict["B"], 3) == 19.995
+        assert round(mp.DeathFitnessDict["A"], 3) == 1.455
+        assert round(mp.Entropy, 3) == 0.469
+
+        # test the type selection:
+        random.seed(0)
+        assert mp._roulette_wheel_selection_BirthType() == 1
+        assert mp._roulette_wheel_selection_DeathType() == 1
+
+        # run the simulation:
+        random.seed(0)
+        simulation = mp.simulate(generations=100)
+        assert sum(mp.curr_size_list) == 100
+        assert simulation.shape == (101, 11)
+
+    def test_MoranProcessIncrementalEntropy(self):
+        """Test the entropy updated from the changes of cardinalities."""
+        # initialize an instance of MoranProcess:
+        mp = moranpycess.MoranProcess(
+            size_list=[40, 30, 30],
+            label_list=["A", "B", "C"],
+            BirthPayoffMatrix=np.ones((3, 3)),
+            DeathPayoffMatrix=np.ones((3, 3)),
+            track_individuals=False,
+            rng=np.random.default_rng(0),
+        )
+        mp._EntropyResyncInterval = 50
+        simulation = mp.simulate(generations=500, rejection_free=True)
+        # incremental entropy agrees with the one of the cardinalities:
+        for row in simulation.itertuples():
+            fractions = np.array(row[1:4]) / 100
+            fractions = fractions[fractions > 0]
+            exact = -np.sum(fractions * np.log2(fractions))
+            assert np.isclose(row.Entropy, exact)
+        assert mp._EntropyUpdates < mp._EntropyResyncInterval
+
+    def test_MoranProcessCountsOnlyWithTransitionMatrix(self):
+        """Test the counts-only simulation with a Transition Matrix."""
+        # initialize an instance of MoranProcess:
+        size_list = [10, 0]
+        label_list = ["A", "B"]
+        BirthPayoffMatrix = np.array([[1, 1], [1, 1]])
+        DeathPayoffMatrix = np.array([[1, 1], [1, 1]])
+        TransitionMatrix = np.array([[0.0, 1.0], [0.0, 1.0]])
+        mp = moranpycess.MoranProcess(
+            size_list=size_list,
+            label_list=label_list,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+            TransitionMatrix=TransitionMatrix,
+            track_individuals=False,
+        )
+        # run the simulation:
+        mp.simulate(generations=1)
+        assert mp.curr_size_list == [0, 10]
+
+    def test_MoranProcessRejectionFree(self):
+        """Test the simulation of the embedded jump chain."""
+        # initialize an instance of MoranProcess:
+        size_list = [10, 90]
+        label_list = ["A", "B"]
+        BirthPayoffMatrix = np.array([[10, 20], [30, 40]])
+        DeathPayoffMatrix = np.array([[1, 2], [3, 4]])
+        mp = moranpycess.MoranProcess(
+            size_list=size_list,
+            label_list=label_list,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+            track_individuals=False,
+            rng=np.random.default_rng(0),
+        )
+        # probability of a change agrees with the Birth-Death cycle:
+        birth = np.array(size_list) * mp._BirthFitnessArray
+        death = np.array(size_list) * mp._DeathFitnessArray
+        probability = 1 - (birth / birth.sum()) @ (death / death.sum())
+        assert np.isclose(
+            mp._EventWeights().sum() / (birth.sum() * death.sum()),
+            probability,
+        )
+        # every event changes the population:
+        sizes = list(mp.curr_size_list)
+        birth_index = mp._SimulateEvent()
+        assert mp.curr_size_list[birth_index] == sizes[birth_index] + 1
+        assert sum(mp.curr_size_list) == 100
+
+        simulation = mp.simulate(
+            generations=1000, record_every=300, rejection_free=True
+        )
+        assert simulation.index.tolist() == [0, 300, 600, 900, 1000]
+        assert (simulation.iloc[:, :2].sum(axis=1) == 100).all()
+        summary = mp.simulate(
+            generations=10**9,
+            summary_only=True,
+            stop_on_fixation=True,
+            rejection_free=True,
+        )
+        assert summary["generations"] == mp.fixation_generation
+        assert summary["fixed_label"] in label_list
+        assert mp._NextEventGenerations() is None
+
+        # tracked individuals change in every cycle:
+        mp = moranpycess.MoranProcess(
+            size_list=size_list,
+            label_list=label_list,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+        )
+        with pytest.raises(
+            moranpycess.CustomExceptions.IncorrectValueError
+        ):
+            mp.simulate(generations=10, rejection_free=True)
+
+    def test_classMoranProcessUpdatePayoffsAndFitness(self):
+        """Test the vectorized payoffs and fitness recomputation."""
+        # initialize an instance of MoranProcess with many types:
+        size_list = [3, 5, 7, 11, 13]
+        label_list = ["A", "B", "C", "D", "E"]
+        BirthPayoffMatrix = np.arange(25).reshape(5, 5)
+        DeathPayoffMatrix = np.ones((5, 5)) + np.eye(5)
+        mp = moranpycess.MoranProcess(
+            size_list=size_list,
+            label_list=label_list,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+        )
+        # compare against the per-type definition of the avg payoff:
+        for r, label in enumerate(label_list):
+            payoff = sum(
+                BirthPayoffMatrix[r, c] * (size_list[c] - int(r == c))
+                for c in range(len(label_list))
+            ) / (sum(size_list) - 1)
+            assert round(mp.AvgBirthPayoffDict[label], 6) == round(payoff, 6)
+            assert round(mp.BirthFitnessDict[label], 6) == round(
+                0.5 + 0.5 * payoff, 6
+            )
+        assert round(mp.AvgDeathPayoffDict["C"], 3) == round(44 / 38, 3)
+
+        # individuals are refreshed on access to the population:
+        random.seed(0)
+        mp.simulate(generations=10)
+        for ind in mp.population:
+            assert ind.AvgBirthPayoff == mp.AvgBirthPayoffDict[ind.label]
+            assert ind.DeathFitness == mp.DeathFitnessDict[ind.label]
+
+        # the mappings are read-only, new dicts replace the values:
+        with pytest.raises(TypeError):
+            mp.BirthFitnessDict["A"] = 2.0
+        BirthFitnessDict = dict(mp.BirthFitnessDict, A=2.0)
+        mp.BirthFitnessDict = BirthFitnessDict
+        assert mp.BirthFitnessDict == BirthFitnessDict
+        assert mp.population[0].BirthFitness == 2.0
+
+    def test_classMoranProcessPopulationConsistency(self):
+        """Test that the population matches the subpopulations' sizes."""
+        # initialize an instance of MoranProcess:
+        size_list = [20, 30, 50]
+        label_list = ["A", "B", "C"]
+        BirthPayoffMatrix = np.array([[1, 2, 3], [3, 2, 1], [2, 2, 2]])
+        DeathPayoffMatrix = np.array([[1, 1, 1], [2, 2, 2], [1, 3, 1]])
+        mp = moranpycess.MoranProcess(
+            size_list=size_list,
+            label_list=label_list,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+        )
+        # run the simulation:
+        random.seed(0)
+        mp.simulate(generations=200)
+        labels = [ind.label for ind in mp.population]
+        assert len(labels) == 100
+        assert [labels.count(label) for label in label_list] == (
+            mp.curr_size_list
+        )
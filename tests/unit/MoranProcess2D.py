@@ -53,12 +53,138 @@ def test_classMoranProcess2DInit(self):
         assert comparison.all()
         comparison = mp.curr_grid == grid
         assert comparison.all()
+        # single sites are read without the snapshot of the population:
+        assert mp.label_at((1, 1)) == "B"
+        assert mp.fitness_at((1, 1)) == (
+            mp.population[1, 1].BirthFitness,
+            mp.population[1, 1].DeathFitness,
+        )
+        assert mp.population[0, 0] is not mp.population[0, 0]
 
         comparison = mp.BirthPayoffMatrix == BirthPayoffMatrix
         assert comparison.all()
         comparison = mp.DeathPayoffMatrix == DeathPayoffMatrix
         assert comparison.all()
 
+    def test_classMoranProcess2DIntegerLattice(self):
+        """Test the integer-coded representation of the lattice."""
+        # initialize an instance of MoranProcess2D:
+        size_list = [6, 3]
+        label_list = ["A", "B"]
+        grid = np.array([["A", "B", "A"], ["A", "A", "B"], ["B", "A", "A"]])
+        BirthPayoffMatrix = np.array([[10, 20], [30, 40]])
+        DeathPayoffMatrix = np.array([[1, 2], [3, 4]])
+        mp = moranpycess.MoranProcess2D(
+            size_list=size_list,
+            label_list=label_list,
+            grid=grid,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+        )
+        assert mp._type_grid.dtype == np.int8
+        assert mp._BirthFitnessArray.dtype == np.float64
+        assert (mp._type_grid == (grid == "B")).all()
+        random.seed(0)
+        mp.simulate(generations=20)
+        # snapshot of the population agrees with the arrays:
+        population = mp.population
+        labels = np.array([[ind.label for ind in row] for row in population])
+        assert (labels == mp.curr_grid).all()
+        assert [(labels == label).sum() for label in label_list] == (
+            mp.curr_size_list
+        )
+        BirthFitnessGrid = mp._Layout(mp._BirthFitnessArray)
+        assert population[1, 2].BirthFitness == BirthFitnessGrid[1, 2]
+        # modifications of the snapshot do not affect the process:
+        population[0, 0].label = "X"
+        assert mp.population[0, 0].label != "X"
+        # assignment of the population re-evaluates the payoffs:
+        population[0, 0].label = "B"
+        mp.population = population
+        assert mp.population[0, 0].label == "B"
+        assert np.isclose(
+            mp._BirthFitnessTree.total, mp._BirthFitnessArray.sum()
+        )
+        # assignment of the grid re-evaluates the payoffs:
+        curr_grid = mp.curr_grid
+        curr_grid[0, 0] = "A"
+        mp.curr_grid = curr_grid
+        assert mp._type_grid[0, 0] == 0
+        assert mp.population[0, 0].label == "A"
+        assert np.isclose(
+            mp._BirthFitnessTree.total, mp._BirthFitnessArray.sum()
+        )
+
+    def test_classMoranProcess2DNeighbourCounts(self):
+        """Test the incremental counts of the neighbours' types."""
+        # initialize an instance of MoranProcess2D:
+        size_list = [8, 8]
+        label_list = ["A", "B"]
+        grid = np.array([["A", "B"] * 2, ["B", "A"] * 2] * 2)
+        BirthPayoffMatrix = np.array([[10, 20], [30, 40]])
+        DeathPayoffMatrix = np.array([[1, 2], [3, 4]])
+        mp = moranpycess.MoranProcess2D(
+            size_list=size_list,
+            label_list=label_list,
+            grid=grid,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+        )
+        # chequerboard: 4 neighbours of each type
+        assert (mp._NeighbourCountArray == 4).all()
+        random.seed(0)
+        mp.simulate(generations=50)
+        # counts kept up to date agree with a recount:
+        for node in range(grid.size):
+            neighbours_types = mp._type_array[mp._Neighbours(node)]
+            counts = np.bincount(neighbours_types, minlength=2)
+            assert (mp._NeighbourCountArray[node] == counts).all()
+            payoff = BirthPayoffMatrix[mp._type_array[node], neighbours_types]
+            assert np.isclose(mp._AvgBirthPayoffArray[node], payoff.mean())
+
+    def test_classMoranProcess2DNeighbourhoods(self):
+        """Test the configurable neighbourhoods of the lattice."""
+        # initialize instances of MoranProcess2D:
+        grid = np.array([["A"] * 5] * 4)
+        grid[0, 0] = "B"
+        kwargs = {
+            "size_list": [19, 1],
+            "label_list": ["A", "B"],
+            "grid": grid,
+            "BirthPayoffMatrix": np.array([[10, 20], [30, 40]]),
+            "DeathPayoffMatrix": np.array([[1, 2], [3, 4]]),
+        }
+        mp = moranpycess.MoranProcess2D(**kwargs, neighbourhood="von_neumann")
+        assert mp._Neighbours(0).tolist() == [15, 4, 1, 5]
+        mp = moranpycess.MoranProcess2D(**kwargs, neighbourhood="hexagonal")
+        assert mp._Neighbours(0).tolist() == [15, 16, 4, 1, 9, 5]
+        mp = moranpycess.MoranProcess2D(**kwargs, radius=2)
+        assert mp._neighbour_table.shape == (20, 24)
+        # rows wrap around: the last row is reached both ways
+        counts = np.bincount(mp._Neighbours(7), minlength=20)
+        assert counts.tolist() == [1] * 7 + [0] + [1] * 7 + [2] * 5
+        # mirrored neighbours are counted with multiplicity:
+        mp = moranpycess.MoranProcess2D(
+            **kwargs, neighbourhood="von_neumann", boundary="reflecting"
+        )
+        assert mp._Neighbours(0).tolist() == [5, 1, 1, 5]
+        assert mp._Neighbours(7).tolist() == [2, 6, 8, 12]
+        assert (mp._NeighbourCountArray[[0, 1]] == [[4, 0], [3, 1]]).all()
+        assert mp._AvgBirthPayoffArray[1] == 12.5
+        random.seed(0)
+        mp.simulate(generations=50)
+        for node in range(grid.size):
+            neighbours_types = mp._type_array[mp._Neighbours(node)]
+            counts = np.bincount(neighbours_types, minlength=2)
+            assert (mp._NeighbourCountArray[node] == counts).all()
+        # wrong neighbourhoods:
+        with pytest.raises(moranpycess.CustomExceptions.IncorrectValueError):
+            moranpycess.MoranProcess2D(**kwargs, neighbourhood="triangular")
+        with pytest.raises(moranpycess.CustomExceptions.IncorrectValueError):
+            moranpycess.MoranProcess2D(**kwargs, radius=0)
+        with pytest.raises(moranpycess.CustomExceptions.IncorrectValueError):
+            moranpycess.MoranProcess2D(**kwargs, boundary="absorbing")
+
     def test_classMoranProcess2DWrongInit(self):
         """Test assertion errors in the initializer."""
         # test improper lists error
@@ -294,8 +420,8 @@ def test_classMoranProcess2D_roulette_wheel_selection_Birth(self):
         )
         # test the selection:
         random.seed(0)
-        (x, y) = mp._roulette_wheel_selection_Birth()
-        ind = mp.population[x, y]
+        node = mp._roulette_wheel_selection_Birth()
+        ind = mp.population.flat[node]
         assert ind.ID == 3
         assert ind.label == "B"
 
@@ -322,11 +448,38 @@ def test_classMoranProcess2D_roulette_wheel_selection_Death(self):
         )
         # test the selection:
         random.seed(0)
-        (x, y) = mp._roulette_wheel_selection_Death(1, 1)
-        ind = mp.population[x, y]
+        node = mp._roulette_wheel_selection_Death(4)
+        ind = mp.population.flat[node]
         assert ind.ID == 0
         assert ind.label == "A"
 
+    def test_classMoranProcess2DSetGrid(self):
+        """Test the cardinalities after the grid is set."""
+        # initialize an instance of MoranProcess2D:
+        grid = np.array([["A", "B", "A"], ["A", "A", "B"], ["B", "A", "A"]])
+        mp = moranpycess.MoranProcess2D(
+            size_list=[6, 3],
+            label_list=["A", "B"],
+            grid=grid,
+            BirthPayoffMatrix=np.array([[10, 20], [30, 40]]),
+            DeathPayoffMatrix=np.array([[1, 2], [3, 4]]),
+            rng=np.random.default_rng(0),
+        )
+        assert round(mp.Entropy, 3) == 0.918
+        # a population of a single type:
+        mp.curr_grid = np.full((3, 3), "A")
+        assert mp.curr_size_list == [9, 0]
+        assert mp.Entropy == 0.0
+        simulation = mp.simulate(generations=100, stop_on_fixation=True)
+        assert simulation.shape == (1, 3)
+        assert simulation.iloc[0, :2].tolist() == [9, 0]
+        assert mp.fixation_generation == 0
+        assert mp.fixed_label == "A"
+        # the original population:
+        mp.curr_grid = grid
+        assert mp.curr_size_list == [6, 3]
+        assert round(mp.Entropy, 3) == 0.918
+
     def test_classMoranProcess2D_simulate(self):
         """Test the simulation process."""
         # initialize an instance of MoranProcess2D:
@@ -360,6 +513,28 @@ def test_classMoranProcess2D_simulate(self):
         simulation = mp.simulate(generations=100)
         assert mp.curr_size_list == [42, 58]
         assert simulation.shape == (101, 3)
+        # thinned and summary-only logs:
+        simulation = mp.simulate(generations=10, record_every=5)
+        assert list(simulation.index) == [0, 5, 10]
+        summary = mp.simulate(generations=10, summary_only=True)
+        assert summary["A__size"] + summary["B__size"] == 100
+        # generator version of the simulation:
+        records = list(mp.simulate_iter(generations=10, record_every=5))
+        assert [r["generation"] for r in records] == [0, 5, 10]
+        assert list(records[-1]) == [
+            "generation",
+            "A__size",
+            "B__size",
+            "Entropy",
+        ]
+        assert records[-1]["A__size"] == mp.curr_size_list[0]
+        # early termination on absorption:
+        records = list(
+            mp.simulate_iter(generations=10000, stop_on_fixation=True)
+        )
+        assert records[-1]["generation"] == mp.fixation_generation
+        assert mp.fixed_label == "B"
+        assert mp.curr_size_list == [0, 100]
 
     def test_plots2D(self):
         """Test the plotting functions."""
@@ -427,3 +602,111 @@ def test_MoranProcess2DWithTransitionMatrix(self):
         random.seed(0)
         mp.simulate(generations=1)
         assert mp.curr_size_list == [0, 4]
+
+    def test_MoranProcess2DVectorizedTransitions(self):
+        """Test the batched type transitions on the 2D lattice."""
+        # initialize an instance of MoranProcess2D:
+        size_list = [12, 4]
+        label_list = ["A", "B"]
+        grid = np.array([["A", "A", "A", "B"]] * 4)
+        BirthPayoffMatrix = np.array([[10, 20], [30, 40]])
+        DeathPayoffMatrix = np.array([[1, 2], [3, 4]])
+        TransitionMatrix = np.array([[0.7, 0.3], [0.4, 0.6]])
+        mp = moranpycess.MoranProcess2D(
+            size_list=size_list,
+            label_list=label_list,
+            grid=grid,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+            TransitionMatrix=TransitionMatrix,
+            rng=np.random.default_rng(0),
+        )
+        simulation = mp.simulate(generations=20)
+        assert (simulation.sum(axis=1) == 16 + simulation["Entropy"]).all()
+        assert (
+            mp.curr_size_list
+            == np.bincount(mp._type_grid.ravel(), minlength=2).tolist()
+        )
+        # shifted-array payoffs agree with the per-site evaluation:
+        NeighbourCountArray = mp._NeighbourCountArray.copy()
+        AvgBirthPayoffArray = mp._AvgBirthPayoffArray.copy()
+        DeathFitnessArray = mp._DeathFitnessArray.copy()
+        for node in range(grid.size):
+            mp._UpdateNeighbourCounts(node)
+            mp._UpdateBirthPayoff(node)
+            mp._UpdateDeathPayoff(node)
+            mp._UpdateDeathFitness(node)
+        assert (mp._NeighbourCountArray == NeighbourCountArray).all()
+        assert np.allclose(mp._AvgBirthPayoffArray, AvgBirthPayoffArray)
+        assert np.allclose(mp._DeathFitnessArray, DeathFitnessArray)
+        assert np.isclose(
+            mp._BirthFitnessTree.total, mp._BirthFitnessArray.sum()
+        )
+
+    def test_MoranProcess2DRejectionFree(self):
+        """Test the rejection-free simulation on the 2D lattice."""
+        # initialize an instance of MoranProcess2D:
+        size_list = [8, 8]
+        label_list = ["A", "B"]
+        grid = np.array([["A", "A", "B", "B"]] * 4)
+        BirthPayoffMatrix = np.array([[10, 20], [30, 40]])
+        DeathPayoffMatrix = np.array([[1, 2], [3, 4]])
+        mp = moranpycess.MoranProcess2D(
+            size_list=size_list,
+            label_list=label_list,
+            grid=grid,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+            rng=np.random.default_rng(0),
+        )
+        simulation = mp.simulate(
+            generations=100, record_every=30, rejection_free=True
+        )
+        assert simulation.index.tolist() == [0, 30, 60, 90, 100]
+        assert (simulation.iloc[:, :2].sum(axis=1) == 16).all()
+        assert (
+            mp.curr_size_list
+            == np.bincount(mp._type_grid.ravel(), minlength=2).tolist()
+        )
+        # incremental active weights agree with the whole lattice:
+        ActiveWeightArray = mp._ActiveWeightArray.copy()
+        mp._UpdateActiveWeights()
+        assert np.allclose(mp._ActiveWeightArray, ActiveWeightArray)
+        # interfaces between the types are the only active sites:
+        mp.curr_grid = grid
+        mp._UpdateActiveWeights()
+        assert (mp._ActiveWeightArray > 0).sum() == 16
+        mp.curr_grid = np.full((4, 4), "A")
+        mp._UpdateActiveWeights()
+        assert mp._NextEventGenerations() is None
+
+        # absorbed population is logged without any events:
+        mp.curr_size_list = [16, 0]
+        simulation = mp.simulate(
+            generations=10**9, record_every=10**8, rejection_free=True
+        )
+        assert simulation.shape == (11, 3)
+        assert (simulation["A__size"] == 16).all()
+
+        # run until fixation:
+        mp.curr_grid = grid
+        mp.curr_size_list = [8, 8]
+        simulation = mp.simulate(
+            generations=10**6, stop_on_fixation=True, rejection_free=True
+        )
+        assert mp.fixation_generation == simulation.index[-1]
+        assert mp.fixed_label in label_list
+
+    def test_MoranProcess2DRejectionFreeWithTransitionMatrix(self):
+        """Test the rejection-free simulation with a Transition Matrix."""
+        # initialize an instance of MoranProcess2D:
+        mp = moranpycess.MoranProcess2D(
+            size_list=[4, 0],
+            label_list=["A", "B"],
+            grid=np.array([["A", "A"], ["A", "A"]]),
+            BirthPayoffMatrix=np.array([[1, 1], [1, 1]]),
+            DeathPayoffMatrix=np.array([[1, 1], [1, 1]]),
+            TransitionMatrix=np.array([[0.5, 0.5], [0.5, 0.5]]),
+        )
+        with pytest.raises(moranpycess.CustomExceptions.IncorrectValueError):
+            mp.simulate(generations=10, rejection_free=True)
@@ -59,6 +59,85 @@ def test_classMoranProcess3DInit(self):
         comparison = mp.DeathPayoffMatrix == DeathPayoffMatrix
         assert comparison.all()
 
+    def test_classMoranProcess3DIntegerLattice(self):
+        """Test the integer-coded representation of the lattice."""
+        # initialize an instance of MoranProcess3D:
+        size_list = [7, 1]
+        label_list = ["A", "B"]
+        grid = np.array([[["A", "A"], ["A", "B"]], [["A", "A"], ["A", "A"]]])
+        BirthPayoffMatrix = np.array([[10, 20], [30, 40]])
+        DeathPayoffMatrix = np.array([[1, 2], [3, 4]])
+        mp = moranpycess.MoranProcess3D(
+            size_list=size_list,
+            label_list=label_list,
+            grid=grid,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+        )
+        assert mp._type_grid.dtype == np.int8
+        assert mp._type_grid[0, 1, 1] == 1
+        assert mp._type_grid.sum() == 1
+        random.seed(0)
+        mp.simulate(generations=20)
+        # snapshot of the population agrees with the arrays:
+        population = mp.population
+        assert population.shape == grid.shape
+        for index in np.ndindex(grid.shape):
+            assert population[index].label == mp.curr_grid[index]
+            assert population[index].DeathFitness == (
+                mp._Layout(mp._DeathFitnessArray)[index]
+            )
+
+    def test_classMoranProcess3DNeighbourCounts(self):
+        """Test the incremental counts of the neighbours' types."""
+        # initialize an instance of MoranProcess3D:
+        size_list = [14, 13]
+        label_list = ["A", "B"]
+        grid = np.array(["A", "B"] * 13 + ["A"]).reshape(3, 3, 3)
+        BirthPayoffMatrix = np.array([[10, 20], [30, 40]])
+        DeathPayoffMatrix = np.array([[1, 2], [3, 4]])
+        mp = moranpycess.MoranProcess3D(
+            size_list=size_list,
+            label_list=label_list,
+            grid=grid,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+        )
+        random.seed(0)
+        mp.simulate(generations=50)
+        # counts kept up to date agree with a recount:
+        for node in range(grid.size):
+            neighbours_types = mp._type_array[mp._Neighbours(node)]
+            counts = np.bincount(neighbours_types, minlength=2)
+            assert (mp._NeighbourCountArray[node] == counts).all()
+            this_label_index = mp._type_array[node]
+            payoff = DeathPayoffMatrix[this_label_index, neighbours_types]
+            assert np.isclose(mp._AvgDeathPayoffArray[node], payoff.mean())
+
+    def test_classMoranProcess3DNeighbourhoods(self):
+        """Test the configurable neighbourhoods of the lattice."""
+        # initialize instances of MoranProcess3D:
+        grid = np.array(["A"] * 27).reshape(3, 3, 3)
+        grid[0, 0, 0] = "B"
+        kwargs = {
+            "size_list": [26, 1],
+            "label_list": ["A", "B"],
+            "grid": grid,
+            "BirthPayoffMatrix": np.array([[10, 20], [30, 40]]),
+            "DeathPayoffMatrix": np.array([[1, 2], [3, 4]]),
+        }
+        mp = moranpycess.MoranProcess3D(**kwargs, neighbourhood="von_neumann")
+        assert mp._Neighbours(0).tolist() == [18, 6, 2, 1, 3, 9]
+        mp = moranpycess.MoranProcess3D(
+            **kwargs, neighbourhood="von_neumann", boundary="reflecting"
+        )
+        assert mp._Neighbours(0).tolist() == [9, 3, 1, 1, 3, 9]
+        assert mp._Neighbours(13).tolist() == [4, 10, 12, 14, 16, 22]
+        assert (mp._NeighbourCountArray[1] == [5, 1]).all()
+        # hexagonal neighbourhoods are defined in 2D only:
+        with pytest.raises(moranpycess.CustomExceptions.IncorrectValueError):
+            moranpycess.MoranProcess3D(**kwargs, neighbourhood="hexagonal")
+
     def test_classMoranProcess3DWrongInit(self):
         """Test assertion errors in the initializer."""
         # test improper lists error
@@ -430,8 +509,8 @@ def test_classMoranProcess3D_roulette_wheel_selection_Birth(self):
         )
         # test the selection:
         random.seed(0)
-        (x, y, z) = mp._roulette_wheel_selection_Birth()
-        ind = mp.population[x, y, z]
+        node = mp._roulette_wheel_selection_Birth()
+        ind = mp.population.flat[node]
         assert ind.ID == 13
         assert ind.label == "B"
 
@@ -471,8 +550,8 @@ def test_classMoranProcess3D_roulette_wheel_selection_Death(self):
         )
         # test the selection:
         random.seed(0)
-        (x, y, z) = mp._roulette_wheel_selection_Death(0, 0, 0)
-        ind = mp.population[x, y, z]
+        node = mp._roulette_wheel_selection_Death(0)
+        ind = mp.population.flat[node]
         assert ind.ID == 13
         assert ind.label == "B"
 
@@ -532,6 +611,20 @@ def test_classMoranProcess3D_simulate(self):
         simulation = mp.simulate(generations=10)
         assert mp.curr_size_list == [42, 10, 4, 8]
         assert simulation.shape == (11, 5)
+        # thinned and summary-only logs:
+        simulation = mp.simulate(generations=10, record_every=4)
+        assert list(simulation.index) == [0, 4, 8, 10]
+        summary = mp.simulate(generations=10, summary_only=True)
+        assert summary["generations"] == 10
+        # generator version of the simulation:
+        records = list(mp.simulate_iter(generations=10, record_every=4))
+        assert [r["generation"] for r in records] == [0, 4, 8, 10]
+        assert records[-1]["D__size"] == mp.curr_size_list[3]
+        # early termination on absorption:
+        simulation = mp.simulate(generations=10000, stop_on_fixation=True)
+        assert simulation.index[-1] == mp.fixation_generation
+        label_index = label_list.index(mp.fixed_label)
+        assert mp.curr_size_list[label_index] == 64
 
     def test_plots3D(self):
         """Test the plotting functions."""
@@ -636,3 +729,31 @@ def test_MoranProcess3DWithTransitionMatrix(self):
         random.seed(0)
         mp.simulate(generations=1)
         assert mp.curr_size_list == [0, 27]
+
+    def test_MoranProcess3DRejectionFree(self):
+        """Test the rejection-free simulation on the 3D lattice."""
+        # initialize an instance of MoranProcess3D:
+        size_list = [14, 13]
+        label_list = ["A", "B"]
+        grid = np.array(["A", "B"] * 13 + ["A"]).reshape(3, 3, 3)
+        BirthPayoffMatrix = np.array([[10, 20], [30, 40]])
+        DeathPayoffMatrix = np.array([[1, 2], [3, 4]])
+        mp = moranpycess.MoranProcess3D(
+            size_list=size_list,
+            label_list=label_list,
+            grid=grid,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+            rng=np.random.default_rng(0),
+        )
+        records = list(
+            mp.simulate_iter(
+                generations=50, record_every=20, rejection_free=True
+            )
+        )
+        assert [record["generation"] for record in records] == [0, 20, 40, 50]
+        assert records[-1]["A__size"] == mp.curr_size_list[0]
+        # incremental active weights agree with the whole lattice:
+        ActiveWeightArray = mp._ActiveWeightArray.copy()
+        mp._UpdateActiveWeights()
+        assert np.allclose(mp._ActiveWeightArray, ActiveWeightArray)
@@ -0,0 +1,189 @@
+""".
+
+##############################################################################
+#
+#   Unit tests for the exact Markov chain of the General Moran Process
+#
+#   AUTHOR: Maciej_Bak
+#   AFFILIATION: University_of_Basel
+#   AFFILIATION: Swiss_Institute_of_Bioinformatics
+#   CONTACT: wsciekly.maciek@gmail.com
+#   CREATED: 18-10-2026
+#   LICENSE: MIT
+#
+##############################################################################
+"""
+
+# imports
+import numpy as np
+import pytest
+
+from .context import moranpycess
+
+
+class TestClass:
+    """Test class for pytest package."""
+
+    def test_classMoranProcessChainInit(self):
+        """Test the initialization of the chain."""
+        # initialize an instance of MoranProcessChain:
+        size_list = [1, 2, 3]
+        label_list = ["A", "B", "C"]
+        BirthPayoffMatrix = np.ones((3, 3))
+        DeathPayoffMatrix = np.ones((3, 3))
+        chain = moranpycess.MoranProcessChain(
+            size_list=size_list,
+            label_list=label_list,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+        )
+        assert chain.init_size_list == size_list
+        assert chain.init_label_list == label_list
+        assert chain.TransitionMatrix is None
+        assert chain.w == 0.5
+        # all the states of the population of size 6:
+        states = chain._States()
+        assert states.shape == (28, 3)
+        assert (states.sum(axis=1) == 6).all()
+        assert len(np.unique(states, axis=0)) == 28
+        index = chain._StateIndex(states[::-1])
+        assert (index == np.arange(28)[::-1]).all()
+        # rows of the transition matrix are distributions:
+        P = chain._BirthDeathMatrix()
+        assert np.allclose(P.sum(axis=1), 1.0)
+        assert P.min() >= 0.0
+
+    def test_classMoranProcessChainWrongInit(self):
+        """Test the initialization with wrong arguments."""
+        with pytest.raises(AssertionError):
+            moranpycess.MoranProcessChain(
+                size_list=[1, 2],
+                label_list=["A"],
+                BirthPayoffMatrix=np.ones((2, 2)),
+                DeathPayoffMatrix=np.ones((2, 2)),
+            )
+        with pytest.raises(moranpycess.CustomExceptions.IncorrectValueError):
+            moranpycess.MoranProcessChain(
+                size_list=[1, 2],
+                label_list=["A", "B"],
+                BirthPayoffMatrix=np.ones((2, 2)),
+                DeathPayoffMatrix=np.ones((2, 2)),
+                TransitionMatrix=np.array([[0.5, 0.4], [0.5, 0.5]]),
+            )
+        chain = moranpycess.MoranProcessChain(
+            size_list=[1, 2],
+            label_list=["A", "B"],
+            BirthPayoffMatrix=np.ones((2, 2)),
+            DeathPayoffMatrix=np.ones((2, 2)),
+            TransitionMatrix=np.array([[0.5, 0.5], [0.5, 0.5]]),
+        )
+        with pytest.raises(moranpycess.CustomExceptions.IncorrectValueError):
+            chain.fixation_probabilities()
+
+    def test_classMoranProcessChainConstantFitness(self):
+        """Test the fixation of a mutant with a constant fitness."""
+        # initialize an instance of MoranProcessChain:
+        BirthPayoffMatrix = np.array([[2, 2], [1, 1]])
+        DeathPayoffMatrix = np.ones((2, 2))
+        chain = moranpycess.MoranProcessChain(
+            size_list=[1, 19],
+            label_list=["A", "B"],
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+        )
+        # relative fitness of the mutant is 1.5:
+        ratio = 1 / 1.5
+        probabilities = chain.fixation_probabilities()
+        assert np.isclose(probabilities["A"], (1 - ratio) / (1 - ratio**20))
+        assert np.isclose(probabilities.sum(), 1.0)
+        time = chain.absorption_time()
+        times = chain.fixation_times()
+        assert np.isclose((probabilities * times).sum(), time)
+
+        # an empty third type does not change the results:
+        chain = moranpycess.MoranProcessChain(
+            size_list=[1, 19, 0],
+            label_list=["A", "B", "C"],
+            BirthPayoffMatrix=np.array([[2, 2, 1], [1, 1, 1], [1, 1, 1]]),
+            DeathPayoffMatrix=np.ones((3, 3)),
+        )
+        assert np.allclose(
+            chain.fixation_probabilities().values,
+            list(probabilities.values) + [0.0],
+        )
+        assert np.isclose(chain.absorption_time(), time)
+        assert np.allclose(chain.fixation_times().values[:2], times.values)
+        assert np.isnan(chain.fixation_times()["C"])
+
+    def test_classMoranProcessChainNeutral(self):
+        """Test the neutral evolution of many types."""
+        # initialize an instance of MoranProcessChain:
+        size_list = [3, 5, 7]
+        chain = moranpycess.MoranProcessChain(
+            size_list=size_list,
+            label_list=["A", "B", "C"],
+            BirthPayoffMatrix=np.ones((3, 3)),
+            DeathPayoffMatrix=np.ones((3, 3)),
+        )
+        probabilities = chain.fixation_probabilities()
+        assert np.allclose(probabilities.values, np.array(size_list) / 15)
+
+    def test_classMoranProcessChainAbsorbed(self):
+        """Test the chain which starts from an absorbed population."""
+        # initialize an instance of MoranProcessChain:
+        chain = moranpycess.MoranProcessChain(
+            size_list=[0, 4],
+            label_list=["A", "B"],
+            BirthPayoffMatrix=np.array([[10, 20], [30, 40]]),
+            DeathPayoffMatrix=np.array([[1, 2], [3, 4]]),
+        )
+        assert chain.fixation_probabilities().tolist() == [0.0, 1.0]
+        assert chain.absorption_time() == 0.0
+        assert chain.fixation_times()["B"] == 0.0
+
+    def test_classMoranProcessChainStationaryDistribution(self):
+        """Test the stationary distribution under type transitions."""
+        # initialize an instance of MoranProcessChain:
+        chain = moranpycess.MoranProcessChain(
+            size_list=[5, 5],
+            label_list=["A", "B"],
+            BirthPayoffMatrix=np.ones((2, 2)),
+            DeathPayoffMatrix=np.ones((2, 2)),
+            TransitionMatrix=np.array([[0.75, 0.25], [0.25, 0.75]]),
+        )
+        distribution = chain.stationary_distribution()
+        assert distribution.shape == (11, 3)
+        assert distribution["probability"].sum() == pytest.approx(1.0)
+        # symmetric mutations between neutral types
+        probabilities = distribution["probability"].to_numpy()
+        assert np.allclose(probabilities, probabilities[::-1])
+        summary = chain.stationary_summary()
+        assert summary["A__MeanSize"] == pytest.approx(5.0)
+        assert summary["B__MeanSize"] == pytest.approx(5.0)
+        # chains larger than the limit are not solved:
+        with pytest.raises(moranpycess.CustomExceptions.IncorrectValueError):
+            chain.stationary_distribution(max_states=10)
+        # without type transitions the chain gets absorbed
+        chain.TransitionMatrix = None
+        with pytest.raises(moranpycess.CustomExceptions.IncorrectValueError):
+            chain.stationary_distribution()
+
+    def test_classMoranProcessChainStationarySummary(self):
+        """Test the long-run estimator of the stationary means."""
+        # initialize an instance of MoranProcessChain:
+        chain = moranpycess.MoranProcessChain(
+            size_list=[10, 10],
+            label_list=["A", "B"],
+            BirthPayoffMatrix=np.array([[10, 9], [11, 7]]),
+            DeathPayoffMatrix=np.ones((2, 2)),
+            TransitionMatrix=np.array([[0.75, 0.25], [0.5, 0.5]]),
+        )
+        exact = chain.stationary_summary()
+        estimate = chain.stationary_summary(
+            max_states=1,
+            generations=50000,
+            burn_in=100,
+            rng=np.random.default_rng(0),
+        )
+        assert exact.index.tolist() == estimate.index.tolist()
+        assert np.allclose(exact.values, estimate.values, rtol=0.02)
@@ -0,0 +1,140 @@
+""".
+
+##############################################################################
+#
+#   Unit tests for the ensemble of independent Moran Processes
+#
+#   AUTHOR: Maciej_Bak
+#   AFFILIATION: University_of_Basel
+#   AFFILIATION: Swiss_Institute_of_Bioinformatics
+#   CONTACT: wsciekly.maciek@gmail.com
+#   CREATED: 18-10-2026
+#   LICENSE: MIT
+#
+##############################################################################
+"""
+
+# imports
+import numpy as np
+import pandas as pd
+import pytest
+
+from .context import moranpycess
+
+
+class TestClass:
+    """Test class for pytest package."""
+
+    def test_classMoranProcessEnsembleInit(self):
+        """Test the initializer."""
+        # initialize an instance of MoranProcessEnsemble:
+        size_list = [1, 9]
+        label_list = ["a", "b"]
+        BirthPayoffMatrix = np.array([[3, 3], [1, 1]])
+        DeathPayoffMatrix = np.array([[1, 1], [1, 1]])
+        ensemble = moranpycess.MoranProcessEnsemble(
+            size_list=size_list,
+            label_list=label_list,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+            replicates=100,
+        )
+        # test all the attributes:
+        assert ensemble.init_size_list == size_list
+        assert ensemble.init_label_list == label_list
+        assert (ensemble.BirthPayoffMatrix == BirthPayoffMatrix).all()
+        assert (ensemble.DeathPayoffMatrix == DeathPayoffMatrix).all()
+        assert ensemble.replicates == 100
+        assert ensemble.w == 0.5
+        assert ensemble.counts.shape == (100, 2)
+        assert (ensemble.counts == [1, 9]).all()
+
+    def test_classMoranProcessEnsembleWrongInit(self):
+        """Test assertion errors in the initializer."""
+        BirthPayoffMatrix = np.array([[3, 3], [1, 1]])
+        DeathPayoffMatrix = np.array([[1, 1], [1, 1]])
+        with pytest.raises(AssertionError):
+            moranpycess.MoranProcessEnsemble(
+                size_list=[1, 9],
+                label_list=["a", "b", "c"],
+                BirthPayoffMatrix=BirthPayoffMatrix,
+                DeathPayoffMatrix=DeathPayoffMatrix,
+                replicates=10,
+            )
+        with pytest.raises(AssertionError):
+            moranpycess.MoranProcessEnsemble(
+                size_list=[1, 9],
+                label_list=["a", "b"],
+                BirthPayoffMatrix=np.array([1, 1]),
+                DeathPayoffMatrix=DeathPayoffMatrix,
+                replicates=10,
+            )
+        with pytest.raises(Exception) as e_info:
+            moranpycess.MoranProcessEnsemble(
+                size_list=[1, 9],
+                label_list=["a", "b"],
+                BirthPayoffMatrix=BirthPayoffMatrix,
+                DeathPayoffMatrix=DeathPayoffMatrix,
+                replicates=0,
+            )
+        assert type(e_info.value).__name__ == "IncorrectValueError"
+
+    def test_classMoranProcessEnsemble_simulate(self):
+        """Test the simulation of all the replicates."""
+        # initialize an instance of MoranProcessEnsemble:
+        ensemble = moranpycess.MoranProcessEnsemble(
+            size_list=[1, 9],
+            label_list=["a", "b"],
+            BirthPayoffMatrix=np.array([[3, 3], [1, 1]]),
+            DeathPayoffMatrix=np.array([[1, 1], [1, 1]]),
+            replicates=2000,
+        )
+        np.random.seed(0)
+        simulation = ensemble.simulate(generations=10000)
+        assert simulation.shape == (2000, 4)
+        assert list(simulation.columns) == [
+            "a__size",
+            "b__size",
+            "fixation_generation",
+            "fixed_label",
+        ]
+        assert simulation.index.name == "replicate"
+        assert (ensemble.counts.sum(axis=1) == 10).all()
+        # all replicates got absorbed:
+        assert simulation["fixed_label"].notna().all()
+        assert (simulation["fixation_generation"] > 0).all()
+        fixed_a = simulation["fixed_label"] == "a"
+        assert (simulation.loc[fixed_a, "a__size"] == 10).all()
+        # fitness ratio 2 gives the fixation probability ~0.5:
+        assert 0.45 < fixed_a.mean() < 0.55
+
+    def test_classMoranProcessEnsemble_simulateNotAbsorbed(self):
+        """Test the outcome of replicates which were not absorbed."""
+        ensemble = moranpycess.MoranProcessEnsemble(
+            size_list=[50, 50],
+            label_list=["a", "b"],
+            BirthPayoffMatrix=np.array([[1, 1], [1, 1]]),
+            DeathPayoffMatrix=np.array([[1, 1], [1, 1]]),
+            replicates=10,
+        )
+        np.random.seed(0)
+        simulation = ensemble.simulate(generations=5)
+        assert simulation["fixation_generation"].isna().all()
+        assert simulation["fixed_label"].isna().all()
+        assert (simulation["a__size"] + simulation["b__size"] == 100).all()
+        assert isinstance(simulation, pd.DataFrame)
+
+    def test_classMoranProcessEnsembleWithGenerator(self):
+        """Test the explicit random generator of the ensemble."""
+        simulations = []
+        for _ in range(2):
+            ensemble = moranpycess.MoranProcessEnsemble(
+                size_list=[1, 9],
+                label_list=["a", "b"],
+                BirthPayoffMatrix=np.array([[3, 3], [1, 1]]),
+                DeathPayoffMatrix=np.array([[1, 1], [1, 1]]),
+                replicates=100,
+                rng=np.random.default_rng(7),
+            )
+            simulations.append(ensemble.simulate(generations=1000))
+        assert simulations[0].equals(simulations[1])
@@ -0,0 +1,287 @@
+""".
+
+##############################################################################
+#
+#   Unit tests for the population evolution on a graph
+#
+#   AUTHOR: Maciej_Bak
+#   AFFILIATION: University_of_Basel
+#   AFFILIATION: Swiss_Institute_of_Bioinformatics
+#   CONTACT: wsciekly.maciek@gmail.com
+#   CREATED: 18-10-2026
+#   LICENSE: MIT
+#
+##############################################################################
+"""
+
+# imports
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+import scipy.sparse
+
+from .context import moranpycess
+
+
+def ring(nnodes):
+    """Adjacency matrix of a cycle graph."""
+    nodes = np.arange(nnodes)
+    rows = np.concatenate((nodes, nodes))
+    columns = np.concatenate(((nodes - 1) % nnodes, (nodes + 1) % nnodes))
+    return scipy.sparse.csr_matrix(
+        (np.ones(2 * nnodes), (rows, columns)), shape=(nnodes, nnodes)
+    )
+
+
+class TestClass:
+    """Test class for pytest package."""
+
+    def test_classMoranProcessGraphInit(self):
+        """Test the initialization of the process on a graph."""
+        # initialize an instance of MoranProcessGraph:
+        size_list = [4, 2]
+        label_list = ["A", "B"]
+        node_labels = np.array(["A", "A", "B", "A", "B", "A"])
+        BirthPayoffMatrix = np.array([[10, 20], [30, 40]])
+        DeathPayoffMatrix = np.array([[1, 2], [3, 4]])
+        mp = moranpycess.MoranProcessGraph(
+            size_list=size_list,
+            label_list=label_list,
+            node_labels=node_labels,
+            adjacency=ring(6),
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+        )
+        assert mp.init_size_list == size_list
+        assert mp.curr_size_list == size_list
+        assert mp.init_label_list == label_list
+        assert (mp.init_node_labels == node_labels).all()
+        assert (mp.curr_node_labels == node_labels).all()
+        assert mp.adjacency.nnz == 12
+        assert mp.w == 0.5
+        assert mp.TransitionMatrix is None
+        assert mp.population.shape == (6,)
+        assert [ind.ID for ind in mp.population] == list(range(6))
+        # payoffs are averaged over the two neighbours in the ring:
+        assert mp._NeighbourCountArray[:, 1].tolist() == [0, 1, 0, 2, 0, 1]
+        assert mp._AvgBirthPayoffArray.tolist() == [
+            10.0,
+            15.0,
+            30.0,
+            20.0,
+            30.0,
+            15.0,
+        ]
+        assert np.allclose(
+            mp._BirthFitnessArray, 0.5 + 0.5 * mp._AvgBirthPayoffArray
+        )
+        assert mp.Entropy == pytest.approx(0.9182958340544896)
+
+    def test_classMoranProcessGraphWrongInit(self):
+        """Test the initialization with a wrong adjacency matrix."""
+        kwargs = {
+            "size_list": [2, 1],
+            "label_list": ["A", "B"],
+            "node_labels": np.array(["A", "B", "A"]),
+            "BirthPayoffMatrix": np.ones((2, 2)),
+            "DeathPayoffMatrix": np.ones((2, 2)),
+        }
+        # dense adjacency:
+        with pytest.raises(AssertionError):
+            moranpycess.MoranProcessGraph(adjacency=np.ones((3, 3)), **kwargs)
+        # adjacency of a different size:
+        with pytest.raises(AssertionError):
+            moranpycess.MoranProcessGraph(adjacency=ring(4), **kwargs)
+        # isolated node:
+        adjacency = scipy.sparse.csr_matrix(
+            np.array([[0, 1, 0], [1, 0, 0], [0, 0, 0]])
+        )
+        with pytest.raises(AssertionError):
+            moranpycess.MoranProcessGraph(adjacency=adjacency, **kwargs)
+        # wrong labels:
+        kwargs["node_labels"] = np.array(["A", "B", "B"])
+        with pytest.raises(AssertionError):
+            moranpycess.MoranProcessGraph(adjacency=ring(3), **kwargs)
+
+    def test_classMoranProcessGraphLattice(self):
+        """Test the process on the graph of the 2D lattice."""
+        # initialize an instance of MoranProcess2D:
+        size_list = [12, 4]
+        label_list = ["A", "B"]
+        grid = np.array([["A", "A", "A", "B"]] * 4)
+        BirthPayoffMatrix = np.array([[10, 20], [30, 40]])
+        DeathPayoffMatrix = np.array([[1, 2], [3, 4]])
+        lattice = moranpycess.MoranProcess2D(
+            size_list=size_list,
+            label_list=label_list,
+            grid=grid,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+            rng=np.random.default_rng(0),
+        )
+        # the same population on the graph of the lattice
+        mp = moranpycess.MoranProcessGraph(
+            size_list=size_list,
+            label_list=label_list,
+            node_labels=grid.ravel(),
+            adjacency=lattice.adjacency,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+            rng=np.random.default_rng(0),
+        )
+        assert (np.diff(mp.adjacency.indptr) == 8).all()
+        pd.testing.assert_frame_equal(
+            mp.simulate(generations=50), lattice.simulate(generations=50)
+        )
+        assert (mp.curr_node_labels == lattice.curr_grid.ravel()).all()
+
+    def test_classMoranProcessGraphIncrementalUpdates(self):
+        """Test the incremental updates on a directed graph."""
+        # star graph with one more directed edge between the leaves
+        nnodes = 7
+        rows = np.concatenate((np.zeros(6), np.arange(1, 7), [1]))
+        columns = np.concatenate((np.arange(1, 7), np.zeros(6), [2]))
+        adjacency = scipy.sparse.csr_matrix(
+            (np.ones(13), (rows, columns)), shape=(nnodes, nnodes)
+        )
+        BirthPayoffMatrix = np.array([[10, 20], [30, 40]])
+        DeathPayoffMatrix = np.array([[1, 2], [3, 4]])
+        mp = moranpycess.MoranProcessGraph(
+            size_list=[4, 3],
+            label_list=["A", "B"],
+            node_labels=np.array(["A", "B", "A", "B", "A", "B", "A"]),
+            adjacency=adjacency,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+            rng=np.random.default_rng(0),
+        )
+        assert mp._Neighbours(1).tolist() == [0, 2]
+        assert mp._InNeighbours(1).tolist() == [0]
+        assert mp._InNeighbours(2).tolist() == [0, 1]
+        for rejection_free in [False, True]:
+            mp.simulate(generations=30, rejection_free=rejection_free)
+            # counts kept up to date agree with a recount:
+            for node in range(nnodes):
+                neighbours_types = mp._type_array[mp._Neighbours(node)]
+                counts = np.bincount(neighbours_types, minlength=2)
+                assert (mp._NeighbourCountArray[node] == counts).all()
+                payoff = DeathPayoffMatrix[
+                    mp._type_array[node], neighbours_types
+                ]
+                assert np.isclose(mp._AvgDeathPayoffArray[node], payoff.mean())
+            assert (
+                mp.curr_size_list
+                == np.bincount(mp._type_array, minlength=2).tolist()
+            )
+            assert np.isclose(
+                mp._BirthFitnessTree.total, mp._BirthFitnessArray.sum()
+            )
+        # incremental active weights agree with the whole graph:
+        ActiveWeightArray = mp._ActiveWeightArray.copy()
+        mp._UpdateActiveWeights()
+        assert np.allclose(mp._ActiveWeightArray, ActiveWeightArray)
+
+    def test_classMoranProcessGraphIncrementalEntropy(self):
+        """Test the entropy updated from the changes of cardinalities."""
+        # initialize an instance of MoranProcessGraph:
+        mp = moranpycess.MoranProcessGraph(
+            size_list=[10, 10, 10],
+            label_list=["A", "B", "C"],
+            node_labels=np.array(["A", "B", "C"] * 10),
+            adjacency=ring(30),
+            BirthPayoffMatrix=np.ones((3, 3)),
+            DeathPayoffMatrix=np.ones((3, 3)),
+            rng=np.random.default_rng(0),
+        )
+        mp._EntropyResyncInterval = 20
+        for rejection_free in [False, True]:
+            for record in mp.simulate_iter(
+                generations=200, rejection_free=rejection_free
+            ):
+                sizes = [record[label + "__size"] for label in "ABC"]
+                fractions = np.array(sizes) / 30
+                fractions = fractions[fractions > 0]
+                exact = -np.sum(fractions * np.log2(fractions))
+                assert np.isclose(record["Entropy"], exact)
+        # the bookkeeping is shared with the well-mixed population:
+        assert (
+            moranpycess.MoranProcessGraph._UpdateEntropyChange
+            is moranpycess.MoranProcess._UpdateEntropyChange
+        )
+
+    def test_classMoranProcessGraphSimulationModes(self, tmp_path):
+        """Test the logging modes of the simulation on a graph."""
+        # initialize an instance of MoranProcessGraph:
+        kwargs = {
+            "size_list": [5, 1],
+            "label_list": ["A", "B"],
+            "node_labels": np.array(["A", "A", "B", "A", "A", "A"]),
+            "adjacency": ring(6),
+            "BirthPayoffMatrix": np.array([[10, 20], [30, 40]]),
+            "DeathPayoffMatrix": np.array([[1, 2], [3, 4]]),
+        }
+        mp = moranpycess.MoranProcessGraph(
+            **kwargs, rng=np.random.default_rng(0)
+        )
+        full = mp.simulate(generations=30)
+        # the same trajectory in the other modes:
+        mp = moranpycess.MoranProcessGraph(
+            **kwargs, rng=np.random.default_rng(0)
+        )
+        summary = mp.simulate(generations=30, summary_only=True)
+        assert summary["A__size"] == full["A__size"].iloc[-1]
+        assert summary["MeanEntropy"] == pytest.approx(full["Entropy"].mean())
+        mp = moranpycess.MoranProcessGraph(
+            **kwargs, rng=np.random.default_rng(0)
+        )
+        path = os.path.join(tmp_path, "log.csv")
+        sink = moranpycess.LogWriter(path, chunk_size=7)
+        assert mp.simulate(generations=30, sink=sink) is None
+        written = pd.read_csv(path, index_col="generation")
+        assert (written.iloc[:, :2] == full.iloc[:, :2]).all().all()
+        mp = moranpycess.MoranProcessGraph(
+            **kwargs, rng=np.random.default_rng(0)
+        )
+        records = list(mp.simulate_iter(generations=30, record_every=10))
+        assert [record["generation"] for record in records] == [0, 10, 20, 30]
+        assert [record["B__size"] for record in records] == list(
+            full["B__size"].iloc[::10]
+        )
+        # the simulation stops as soon as one type takes over:
+        mp = moranpycess.MoranProcessGraph(
+            **kwargs, rng=np.random.default_rng(0)
+        )
+        simulation = mp.simulate(generations=10**5, stop_on_fixation=True)
+        assert simulation.index[-1] == mp.fixation_generation
+        assert mp.fixed_label in ["A", "B"]
+        assert simulation[mp.fixed_label + "__size"].iloc[-1] == 6
+        summary = mp.simulate(
+            generations=10**5, summary_only=True, stop_on_fixation=True
+        )
+        assert summary["fixation_generation"] == 0
+        with pytest.raises(moranpycess.CustomExceptions.IncorrectValueError):
+            mp.simulate(generations=10, summary_only=True, sink=sink)
+
+    def test_classMoranProcessGraphTransitions(self):
+        """Test the type transitions on a graph."""
+        # initialize an instance of MoranProcessGraph:
+        mp = moranpycess.MoranProcessGraph(
+            size_list=[5, 5],
+            label_list=["A", "B"],
+            node_labels=np.array(["A", "B"] * 5),
+            adjacency=ring(10),
+            BirthPayoffMatrix=np.array([[10, 20], [30, 40]]),
+            DeathPayoffMatrix=np.array([[1, 2], [3, 4]]),
+            TransitionMatrix=np.array([[0.5, 0.5], [0.25, 0.75]]),
+            rng=np.random.default_rng(0),
+        )
+        simulation = mp.simulate(generations=20, summary_only=True)
+        assert simulation["A__size"] + simulation["B__size"] == 10
+        assert (
+            mp.curr_size_list
+            == np.bincount(mp._type_array, minlength=2).tolist()
+        )
+        with pytest.raises(moranpycess.CustomExceptions.IncorrectValueError):
+            mp.simulate(generations=20, rejection_free=True)
@@ -0,0 +1,124 @@
+""".
+
+##############################################################################
+#
+#   Unit tests for the mean-field dynamics of the General Moran Process
+#
+#   AUTHOR: Maciej_Bak
+#   AFFILIATION: University_of_Basel
+#   AFFILIATION: Swiss_Institute_of_Bioinformatics
+#   CONTACT: wsciekly.maciek@gmail.com
+#   CREATED: 18-10-2026
+#   LICENSE: MIT
+#
+##############################################################################
+"""
+
+# imports
+import numpy as np
+import pytest
+
+from .context import moranpycess
+
+
+class TestClass:
+    """Test class for pytest package."""
+
+    def test_classMoranProcessMeanFieldInit(self):
+        """Test the initialization of the mean-field dynamics."""
+        # initialize an instance of MoranProcessMeanField:
+        size_list = [10, 90]
+        label_list = ["A", "B"]
+        BirthPayoffMatrix = np.array([[10, 20], [30, 40]])
+        DeathPayoffMatrix = np.array([[1, 2], [3, 4]])
+        mf = moranpycess.MoranProcessMeanField(
+            size_list=size_list,
+            label_list=label_list,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+        )
+        assert mf.init_size_list == size_list
+        assert mf.init_label_list == label_list
+        assert (mf.BirthPayoffMatrix == BirthPayoffMatrix).all()
+        assert (mf.DeathPayoffMatrix == DeathPayoffMatrix).all()
+        assert mf.TransitionMatrix is None
+        assert mf.w == 0.5
+        assert mf.rng is None
+
+    def test_classMoranProcessMeanFieldWrongInit(self):
+        """Test the initialization with wrong arguments."""
+        with pytest.raises(AssertionError):
+            moranpycess.MoranProcessMeanField(
+                size_list=[10, 90],
+                label_list=["A"],
+                BirthPayoffMatrix=np.ones((2, 2)),
+                DeathPayoffMatrix=np.ones((2, 2)),
+            )
+        with pytest.raises(moranpycess.CustomExceptions.IncorrectValueError):
+            moranpycess.MoranProcessMeanField(
+                size_list=[10, 90],
+                label_list=["A", "B"],
+                BirthPayoffMatrix=np.ones((2, 2)),
+                DeathPayoffMatrix=np.ones((2, 2)),
+                TransitionMatrix=np.array([[0.5, 0.25], [0.5, 0.5]]),
+            )
+
+    def test_classMoranProcessMeanFieldLogs(self):
+        """Test the schema of the logs against the simulation."""
+        kwargs = {
+            "size_list": [10, 90],
+            "label_list": ["A", "B"],
+            "BirthPayoffMatrix": np.array([[10, 9], [11, 7]]),
+            "DeathPayoffMatrix": np.array([[1, 1], [1, 1]]),
+        }
+        mf = moranpycess.MoranProcessMeanField(**kwargs)
+        df = mf.simulate(1000, record_every=300)
+        process = moranpycess.MoranProcess(**kwargs)
+        expected = process.simulate(1000, record_every=300)
+        assert df.columns.tolist() == expected.columns.tolist()
+        assert df.index.tolist() == expected.index.tolist()
+        assert df.index.name == expected.index.name
+        # the initial state is logged exactly
+        assert np.allclose(df.iloc[0].values, expected.iloc[0].values)
+        # the fitter type grows and the population size is kept
+        assert (np.diff(df["A__size"].values) > 0).all()
+        assert np.allclose(df["A__size"] + df["B__size"], 100)
+        with pytest.raises(moranpycess.CustomExceptions.IncorrectValueError):
+            mf.simulate(1000, record_every=0)
+
+    def test_classMoranProcessMeanFieldLargePopulation(self):
+        """Test the integration of the dynamics of a huge population."""
+        # initialize an instance of MoranProcessMeanField:
+        mf = moranpycess.MoranProcessMeanField(
+            size_list=[10**8, 9 * 10**8],
+            label_list=["A", "B"],
+            BirthPayoffMatrix=np.array([[10, 9], [11, 7]]),
+            DeathPayoffMatrix=np.array([[1, 1], [1, 1]]),
+        )
+        df = mf.simulate(10**11, record_every=10**10)
+        assert len(df) == 11
+        # the population approaches the mixed equilibrium of the game
+        assert df["A__size"].iloc[-1] / 10**9 == pytest.approx(2 / 3, abs=0.01)
+        # fluctuations are negligible in a huge population
+        mf.rng = np.random.default_rng(0)
+        noisy = mf.simulate(10**11, record_every=10**10, noise=True)
+        assert np.allclose(noisy["A__size"], df["A__size"], rtol=1e-3)
+
+    def test_classMoranProcessMeanFieldTransitions(self):
+        """Test the dynamics with type transitions."""
+        # initialize an instance of MoranProcessMeanField:
+        mf = moranpycess.MoranProcessMeanField(
+            size_list=[10, 90],
+            label_list=["A", "B"],
+            BirthPayoffMatrix=np.ones((2, 2)),
+            DeathPayoffMatrix=np.ones((2, 2)),
+            TransitionMatrix=np.array([[0.75, 0.25], [0.25, 0.75]]),
+            rng=np.random.default_rng(0),
+        )
+        df = mf.simulate(100, record_every=10)
+        # symmetric mutations between neutral types
+        assert df["A__size"].iloc[-1] == pytest.approx(50.0)
+        assert df["Entropy"].iloc[-1] == pytest.approx(1.0)
+        noisy = mf.simulate(100, record_every=10, noise=True)
+        assert (noisy.iloc[:, :2] >= 0).all().all()
+        assert np.allclose(noisy["A__size"] + noisy["B__size"], 100)
@@ -0,0 +1,236 @@
+""".
+
+##############################################################################
+#
+#   Unit tests for the population evolution on an N-dimensional lattice
+#
+#   AUTHOR: Maciej_Bak
+#   AFFILIATION: University_of_Basel
+#   AFFILIATION: Swiss_Institute_of_Bioinformatics
+#   CONTACT: wsciekly.maciek@gmail.com
+#   CREATED: 18-10-2026
+#   LICENSE: MIT
+#
+##############################################################################
+"""
+
+# imports
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from .context import moranpycess
+
+
+class TestClass:
+    """Test class for pytest package."""
+
+    def test_classMoranProcessNDRing(self):
+        """Test the process on a 1-dimensional lattice."""
+        # initialize an instance of MoranProcessND:
+        size_list = [7, 3]
+        label_list = ["A", "B"]
+        grid = np.array(["A", "B", "A", "A", "B", "A", "A", "B", "A", "A"])
+        BirthPayoffMatrix = np.array([[10, 20], [30, 40]])
+        DeathPayoffMatrix = np.array([[1, 2], [3, 4]])
+        mp = moranpycess.MoranProcessND(
+            size_list=size_list,
+            label_list=label_list,
+            grid=grid,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+            rng=np.random.default_rng(0),
+        )
+        assert mp.population.shape == grid.shape
+        assert (mp.curr_grid == grid).all()
+        # the ends of the lattice are neighbours:
+        assert mp._Neighbours(0).tolist() == [9, 1]
+        assert mp._Neighbours(9).tolist() == [8, 0]
+        assert (mp._NeighbourCountArray[0] == [1, 1]).all()
+        assert mp._AvgBirthPayoffArray[0] == 15.0
+        assert mp.label_at(1) == mp.label_at((1,)) == "B"
+        assert mp.fitness_at(0)[0] == 0.5 + 0.5 * 15.0
+        # with reflecting boundaries the end has one neighbour twice:
+        mp = moranpycess.MoranProcessND(
+            size_list=size_list,
+            label_list=label_list,
+            grid=grid,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+            boundary="reflecting",
+            radius=2,
+            rng=np.random.default_rng(0),
+        )
+        assert mp._Neighbours(0).tolist() == [2, 1, 1, 2]
+        df = mp.simulate(generations=100)
+        assert (df.iloc[:, :2].sum(axis=1) == 10).all()
+        # hexagonal neighbourhoods are defined in 2D only:
+        with pytest.raises(moranpycess.CustomExceptions.IncorrectValueError):
+            moranpycess.MoranProcessND(
+                size_list=size_list,
+                label_list=label_list,
+                grid=grid,
+                BirthPayoffMatrix=BirthPayoffMatrix,
+                DeathPayoffMatrix=DeathPayoffMatrix,
+                neighbourhood="hexagonal",
+            )
+
+    def test_classMoranProcessNDLattice2D(self):
+        """Test the process on the 2D lattice."""
+        # initialize instances of MoranProcessND and MoranProcess2D:
+        size_list = [12, 4]
+        label_list = ["A", "B"]
+        grid = np.array([["A", "A", "A", "B"]] * 4)
+        kwargs = {
+            "size_list": size_list,
+            "label_list": label_list,
+            "grid": grid,
+            "BirthPayoffMatrix": np.array([[10, 20], [30, 40]]),
+            "DeathPayoffMatrix": np.array([[1, 2], [3, 4]]),
+            "neighbourhood": "hexagonal",
+        }
+        mp = moranpycess.MoranProcessND(**kwargs, rng=np.random.default_rng(0))
+        lattice = moranpycess.MoranProcess2D(
+            **kwargs, rng=np.random.default_rng(0)
+        )
+        pd.testing.assert_frame_equal(
+            mp.simulate(generations=50), lattice.simulate(generations=50)
+        )
+        assert (mp.curr_grid == lattice.curr_grid).all()
+        # grids of a different dimensionality:
+        with pytest.raises(AssertionError):
+            moranpycess.MoranProcess2D(
+                **dict(kwargs, grid=grid.ravel(), neighbourhood="moore")
+            )
+        with pytest.raises(AssertionError):
+            moranpycess.MoranProcess3D(**dict(kwargs, neighbourhood="moore"))
+
+    def test_classMoranProcessND4D(self):
+        """Test the process on a 4-dimensional lattice."""
+        # initialize an instance of MoranProcessND:
+        size_list = [40, 41]
+        label_list = ["A", "B"]
+        grid = np.array(["A", "B"] * 40 + ["B"]).reshape(3, 3, 3, 3)
+        BirthPayoffMatrix = np.array([[10, 20], [30, 40]])
+        DeathPayoffMatrix = np.array([[1, 2], [3, 4]])
+        mp = moranpycess.MoranProcessND(
+            size_list=size_list,
+            label_list=label_list,
+            grid=grid,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+            rng=np.random.default_rng(0),
+        )
+        assert mp._neighbour_table.shape == (81, 80)
+        # in a lattice of length 3 the neighbours are all the other sites:
+        assert (np.sort(mp._Neighbours(0)) == np.arange(1, 81)).all()
+        df = mp.simulate(generations=50)
+        assert df.index[-1] == 50
+        assert mp.curr_grid.shape == grid.shape
+        # counts kept up to date agree with a recount:
+        for node in range(grid.size):
+            neighbours_types = mp._type_array[mp._Neighbours(node)]
+            counts = np.bincount(neighbours_types, minlength=2)
+            assert (mp._NeighbourCountArray[node] == counts).all()
+            payoff = BirthPayoffMatrix[mp._type_array[node], neighbours_types]
+            assert np.isclose(mp._AvgBirthPayoffArray[node], payoff.mean())
+        # von Neumann neighbourhood: two neighbours along every axis
+        mp = moranpycess.MoranProcessND(
+            size_list=size_list,
+            label_list=label_list,
+            grid=grid,
+            BirthPayoffMatrix=BirthPayoffMatrix,
+            DeathPayoffMatrix=DeathPayoffMatrix,
+            neighbourhood="von_neumann",
+        )
+        assert mp._Neighbours(0).tolist() == [54, 18, 6, 2, 1, 3, 9, 27]
+
+    def test_classMoranProcessNDBulkCounts(self):
+        """Test the counts of neighbours' types with shifted lattices."""
+        rng = np.random.default_rng(0)
+        label_list = ["A", "B", "C"]
+        for (shape, neighbourhood, radius) in [
+            ((7,), "moore", 2),
+            ((4, 5), "moore", 1),
+            ((4, 5), "hexagonal", 2),
+            ((3, 3, 3), "von_neumann", 1),
+            ((2, 3, 4, 3), "moore", 2),
+        ]:
+            grid = rng.choice(label_list, size=shape)
+            grid.flat[:3] = label_list
+            mp = moranpycess.MoranProcessND(
+                size_list=[int(np.sum(grid == label)) for label in label_list],
+                label_list=label_list,
+                grid=grid,
+                BirthPayoffMatrix=np.ones((3, 3)),
+                DeathPayoffMatrix=np.ones((3, 3)),
+                neighbourhood=neighbourhood,
+                radius=radius,
+            )
+            # the same counts for all the edges of the graph
+            counts = moranpycess.MoranProcessGraph._CountNeighbourTypes(mp)
+            assert (mp._CountNeighbourTypes() == counts).all()
+            assert (mp._NeighbourCountArray == counts).all()
+
+    def test_classMoranProcessNDSimulationModes(self):
+        """Test the logging modes of the simulation on a lattice."""
+        # initialize an instance of MoranProcessND:
+        kwargs = {
+            "size_list": [7, 1],
+            "label_list": ["A", "B"],
+            "grid": np.array(["A", "A", "A", "B", "A", "A", "A", "A"]),
+            "BirthPayoffMatrix": np.array([[10, 20], [30, 40]]),
+            "DeathPayoffMatrix": np.array([[1, 2], [3, 4]]),
+        }
+        mp = moranpycess.MoranProcessND(**kwargs, rng=np.random.default_rng(0))
+        full = mp.simulate(generations=40, rejection_free=True)
+        mp = moranpycess.MoranProcessND(**kwargs, rng=np.random.default_rng(0))
+        summary = mp.simulate(
+            generations=40, summary_only=True, rejection_free=True
+        )
+        assert summary["B__size"] == full["B__size"].iloc[-1]
+        assert (mp.curr_grid == "B").sum() == summary["B__size"]
+        mp = moranpycess.MoranProcessND(**kwargs, rng=np.random.default_rng(0))
+        records = mp.simulate_iter(generations=40, rejection_free=True)
+        sizes = [record["B__size"] for record in records]
+        assert sizes == full["B__size"].tolist()
+        # the simulation stops as soon as one type takes over:
+        mp = moranpycess.MoranProcessND(**kwargs, rng=np.random.default_rng(0))
+        simulation = mp.simulate(
+            generations=10**5, stop_on_fixation=True, rejection_free=True
+        )
+        assert simulation.index[-1] == mp.fixation_generation
+        assert simulation[mp.fixed_label + "__size"].iloc[-1] == 8
+        assert (mp.curr_grid == mp.fixed_label).all()
+
+    def test_classMoranProcessNDMemory(self):
+        """Test the memory kept per site of the lattice."""
+        grid = np.full((128, 128), "A")
+        grid[0, 0] = "B"
+        kwargs = {
+            "size_list": [grid.size - 1, 1],
+            "label_list": ["A", "B"],
+            "grid": grid,
+            "BirthPayoffMatrix": np.array([[10, 20], [30, 40]]),
+            "DeathPayoffMatrix": np.array([[1, 2], [3, 4]]),
+        }
+        tracemalloc.start()
+        mp = moranpycess.MoranProcessND(**kwargs)
+        (held, _) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        # the table of 8 neighbours (int32) and the per-site arrays only,
+        # no other arrays as long as the list of edges
+        assert held / grid.size < 128
+        # in-coming edges of a periodic lattice are the neighbours:
+        generic = moranpycess.MoranProcessND(**kwargs, boundary="reflecting")
+        moranpycess.MoranProcessGraph._IndexInNeighbours(mp)
+        for node in [0, 1, 129, grid.size - 1]:
+            assert (
+                np.sort(mp._InNeighbours(node))
+                == moranpycess.MoranProcessGraph._InNeighbours(mp, node)
+            ).all()
+        assert not hasattr(generic, "_edge_sources")
+        assert generic._in_indices.dtype == np.int32
+        assert mp.adjacency.nnz == 8 * grid.size
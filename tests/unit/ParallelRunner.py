@@ -0,0 +1,138 @@
+""".
+
+##############################################################################
+#
+#   Unit tests for the parallel runner of independent Moran Processes
+#
+#   AUTHOR: Maciej_Bak
+#   AFFILIATION: University_of_Basel
+#   AFFILIATION: Swiss_Institute_of_Bioinformatics
+#   CONTACT: wsciekly.maciek@gmail.com
+#   CREATED: 18-10-2026
+#   LICENSE: MIT
+#
+##############################################################################
+"""
+
+# imports
+import numpy as np
+import pytest
+
+from .context import moranpycess
+
+
+class TestClass:
+    """Test class for pytest package."""
+
+    process_kwargs = {
+        "size_list": [5, 5],
+        "label_list": ["a", "b"],
+        "BirthPayoffMatrix": np.array([[1, 2], [3, 4]]),
+        "DeathPayoffMatrix": np.array([[1, 1], [1, 1]]),
+    }
+
+    def test_classParallelRunnerInit(self):
+        """Test the initializer."""
+        # initialize an instance of ParallelRunner:
+        runner = moranpycess.ParallelRunner(
+            process_class=moranpycess.MoranProcess,
+            process_kwargs=self.process_kwargs,
+            replicates=8,
+            seed=42,
+            processes=2,
+        )
+        # test all the attributes:
+        assert runner.process_class is moranpycess.MoranProcess
+        assert runner.process_kwargs == self.process_kwargs
+        assert runner.replicates == 8
+        assert runner.seed == 42
+        assert runner.processes == 2
+        # the seed is drawn if not specified:
+        runner = moranpycess.ParallelRunner(
+            process_class=moranpycess.MoranProcess,
+            process_kwargs=self.process_kwargs,
+            replicates=8,
+        )
+        assert isinstance(runner.seed, int)
+        assert runner.processes >= 1
+
+    def test_classParallelRunnerWrongInit(self):
+        """Test assertion errors in the initializer."""
+        with pytest.raises(Exception) as e_info:
+            moranpycess.ParallelRunner(
+                process_class=moranpycess.MoranProcess,
+                process_kwargs=self.process_kwargs,
+                replicates=0,
+            )
+        assert type(e_info.value).__name__ == "IncorrectValueError"
+        with pytest.raises(Exception) as e_info:
+            moranpycess.ParallelRunner(
+                process_class=moranpycess.MoranProcess,
+                process_kwargs=self.process_kwargs,
+                replicates=8,
+                processes=0,
+            )
+        assert type(e_info.value).__name__ == "IncorrectValueError"
+
+    def test_classParallelRunner_simulate(self):
+        """Test reproducibility of the parallel simulations."""
+        summaries = [
+            moranpycess.ParallelRunner(
+                process_class=moranpycess.MoranProcess,
+                process_kwargs=self.process_kwargs,
+                replicates=8,
+                seed=42,
+                processes=processes,
+            ).simulate(
+                generations=1000, summary_only=True, stop_on_fixation=True
+            )
+            for processes in [1, 2]
+        ]
+        # results do not depend on the number of processes:
+        assert summaries[0].equals(summaries[1])
+        assert summaries[0].shape[0] == 8
+        assert summaries[0].index.name == "replicate"
+        assert summaries[0]["fixed_label"].notna().all()
+        # replicates follow distinct random streams:
+        assert summaries[0]["fixation_generation"].nunique() > 1
+
+    def test_classParallelRunner_simulateLogs(self):
+        """Test gathering of the simulation logs."""
+        runner = moranpycess.ParallelRunner(
+            process_class=moranpycess.MoranProcess,
+            process_kwargs=self.process_kwargs,
+            replicates=3,
+            seed=1,
+            processes=1,
+        )
+        simulation = runner.simulate(generations=10, record_every=5)
+        assert simulation.shape == (9, 11)
+        assert simulation.index.names == ["replicate", "generation"]
+        assert list(simulation.loc[2].index) == [0, 5, 10]
+        assert simulation.equals(runner.simulate(10, record_every=5))
+
+    def test_MoranProcessWithGenerator(self):
+        """Test the explicit random generator of the processes."""
+        simulations = []
+        for _ in range(2):
+            mp = moranpycess.MoranProcess(
+                **self.process_kwargs,
+                TransitionMatrix=np.array([[0.9, 0.1], [0.1, 0.9]]),
+                rng=np.random.default_rng(7),
+            )
+            simulations.append(mp.simulate(generations=50))
+        assert simulations[0].equals(simulations[1])
+        grid = np.array([["a", "b"], ["b", "a"]])
+        simulations = []
+        for _ in range(2):
+            mp = moranpycess.MoranProcess2D(
+                size_list=[2, 2],
+                label_list=["a", "b"],
+                grid=grid,
+                BirthPayoffMatrix=np.array([[1, 2], [3, 4]]),
+                DeathPayoffMatrix=np.array([[1, 1], [1, 1]]),
+                TransitionMatrix=np.array([[0.9, 0.1], [0.1, 0.9]]),
+                rng=np.random.default_rng(7),
+            )
+            simulations.append(mp.simulate(generations=50))
+        assert simulations[0].equals(simulations[1])
@@ -0,0 +1,70 @@
+""".
+
+##############################################################################
+#
+#   Unit tests for the sum tree
+#
+#   AUTHOR: Maciej_Bak
+#   AFFILIATION: University_of_Basel
+#   AFFILIATION: Swiss_Institute_of_Bioinformatics
+#   CONTACT: wsciekly.maciek@gmail.com
+#   CREATED: 18-10-2026
+#   LICENSE: MIT
+#
+##############################################################################
+"""
+
+# imports
+import numpy as np
+
+from .context import moranpycess
+
+
+class TestClass:
+    """Test class for pytest package."""
+
+    def test_classSumTreeInit(self):
+        """Test the initializer."""
+        # initialize an instance of SumTree:
+        values = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+        tree = moranpycess.SumTree.SumTree(values)
+        # test all the attributes:
+        assert tree.size == 5
+        assert tree.capacity == 8
+        assert tree.total == 15.0
+        comparison = tree.tree[8:13] == values
+        assert comparison.all()
+
+    def test_classSumTreeSearch(self):
+        """Test the search against a linear scan."""
+        values = np.array([0.5, 0.0, 2.0, 1.5, 0.0, 3.0, 1.0])
+        tree = moranpycess.SumTree.SumTree(values)
+        cumulative = np.cumsum(values)
+        for pick in np.linspace(0, tree.total, 50, endpoint=False):
+            expected = int(np.argmax(cumulative > pick))
+            assert tree.search(pick) == expected
+        assert tree.search(0.5) == 2
+        # the pick on the upper bound of the wheel:
+        values = np.array([0.5, 2.0, 1.0, 0.0, 0.0])
+        tree = moranpycess.SumTree.SumTree(values)
+        assert tree.search(tree.total) == 2
+        assert tree.search(np.nextafter(tree.total, np.inf)) == 2
+        tree.update([2], [0.0])
+        assert tree.search(tree.total) == 1
+        assert tree.search(0.5) == 1
+
+    def test_classSumTreeUpdate(self):
+        """Test the update of the weights."""
+        values = np.ones(6)
+        tree = moranpycess.SumTree.SumTree(values)
+        tree.update([0, 5, 5], [0.0, 10.0, 10.0])
+        assert tree.total == 14.0
+        assert tree.search(0.0) == 1
+        assert tree.search(4.5) == 5
+        tree.rebuild(np.arange(6))
+        assert tree.total == 15.0
+        # a single item:
+        tree = moranpycess.SumTree.SumTree([2.0])
+        tree.update([0], [3.0])
+        assert tree.total == 3.0
+        assert tree.search(1.0) == 0